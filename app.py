@@ -6,13 +6,18 @@ from flet import Colors
 
 # 서비스 및 컴포넌트 import
 from services.auth_service import get_current_user
-from components.header import create_header
-from components.prompt_card import load_prompt_cards
+from components.home_controller import (
+    HomeViewController, SESSION_KEY as HOME_CONTROLLER_KEY, get_home_controller, refresh_home,
+)
 from pages.auth.login_page import build_login_view
 from pages.auth.register_page import build_register_view  
 from pages.prompt.new_prompt_page import build_prompt_new_view
 from pages.prompt.detail_page import build_prompt_detail_view
 from config.constants import UI_CONSTANTS
+from utils.log_utils import get_logger
+
+logger = get_logger("app")
+sidebar_logger = get_logger("sidebar")
 
 
 def _check_welcome_bonus(page: ft.Page):
@@ -25,56 +30,42 @@ def _check_welcome_bonus(page: ft.Page):
             # 한 번 표시 후 세션에서 제거
             page.session.remove("welcome_bonus")
     except Exception as e:
-        print(f"[DEBUG] 환영 보너스 토스트 오류: {e}")
+        logger.debug("환영 보너스 토스트 오류: %s", e)
 
 
 def _update_ui_after_filter(page: ft.Page):
-    """필터 적용 후 UI 직접 업데이트"""
+    """필터 적용 후 UI 직접 업데이트 (사이드바와 카드 목록만 교체)"""
     try:
-        print("[DEBUG] UI 직접 업데이트 시작")
-        
-        # 1. 사이드바 업데이트 (필터 활성화 표시)
-        # 2. 메인 카드 영역 업데이트 (필터링된 결과)
+        logger.debug("UI 직접 업데이트 시작")
         
-        # 현재 뷰에서 사이드바와 카드 컨테이너 찾기
         if not page.views:
-            print("[ERROR] 페이지 뷰가 없음")
+            logger.error("페이지 뷰가 없음")
             page.go("/")
             return
-            
-        main_view = page.views[-1]
         
-        # 뷰를 다시 빌드하는 것이 가장 확실함
-        new_view = build_home_view(page)
-        page.views[-1] = new_view
-        page.update()
+        refresh_home(page)
         
-        print("[DEBUG] UI 직접 업데이트 완료")
+        logger.debug("UI 직접 업데이트 완료")
         
     except Exception as e:
-        print(f"[ERROR] UI 업데이트 실패: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("UI 업데이트 실패: %s", e)
         # 폴백: 페이지 이동
         page.go("/")
 
 
 def _create_filter_sidebar(page: ft.Page) -> ft.Container:
     """필터 사이드바 생성 - 간단 버전"""
-    print("[DEBUG] _create_filter_sidebar 함수 시작")
+    sidebar_logger.debug("_create_filter_sidebar 함수 시작")
     from components.toast import show_toast
     
     def apply_category_filter(category: str):
         """카테고리 필터 적용"""
         try:
-            from services.csv_utils import read_csv_rows
-            from pathlib import Path
+            from services.filter_service import query_prompt_ids
             
-            print(f"[DEBUG] 카테고리 필터 적용: {category}")
+            sidebar_logger.debug("카테고리 필터 적용: %s", category)
             
-            # 기존 검색 결과만 초기화 (AI 모델 필터는 유지)
-            if page.session.get("search_results") is not None:
-                page.session.remove("search_results")
+            # 기존 검색어만 초기화 (AI 모델 필터는 유지)
             if page.session.get("search_query") is not None:
                 page.session.remove("search_query")
             # AI 모델 필터는 유지하여 중복 필터 가능
@@ -85,74 +76,50 @@ def _create_filter_sidebar(page: ft.Page) -> ft.Container:
                     page.session.remove("filter_category")
                 if page.session.get("filter_ai_model") is not None:
                     page.session.remove("filter_ai_model")
-                if page.session.get("search_results") is not None:
-                    page.session.remove("search_results")
                 if page.session.get("search_query") is not None:
                     page.session.remove("search_query")
                 
                 show_toast(page, "전체 프롬프트를 표시합니다.", 1000)
                 
                 # 전체 선택 시 UI 업데이트
-                print(f"[DEBUG] 전체 카테고리 선택 - 모든 필터 초기화 후 UI 업데이트")
+                sidebar_logger.debug("전체 카테고리 선택 - 모든 필터 초기화 후 UI 업데이트")
                 _update_ui_after_filter(page)
                 return
             else:
                 # 카테고리 필터 적용 (AI 모델 필터와 중복 적용)
-                prompts_data = read_csv_rows(Path("data/prompts.csv"))
-                filtered_results = []
-                
                 # 기존 AI 모델 필터 확인
                 current_ai_model = page.session.get("filter_ai_model")
                 
-                for prompt in prompts_data:
-                    prompt_category = prompt.get("category", "").strip()
-                    prompt_ai_model = prompt.get("ai_model_key", "").strip()
-                    
-                    # 카테고리 조건 확인
-                    category_match = (prompt_category == category)
-                    
-                    # AI 모델 조건 확인 (설정되어 있으면)
-                    ai_model_match = True
-                    if current_ai_model and current_ai_model != "전체":
-                        ai_model_match = (prompt_ai_model == current_ai_model)
-                    
-                    # 두 조건 모두 만족하면 추가
-                    if category_match and ai_model_match:
-                        filtered_results.append(prompt)
+                # facet posting 교집합으로 결과 수만 확인 (세션에는 조건만 저장)
+                filtered_ids = query_prompt_ids(category, current_ai_model)
                 
                 page.session.set("filter_category", category)
-                page.session.set("search_results", filtered_results)
-                print(f"[DEBUG] 세션 저장 완료 - filter_category: {category}, search_results: {len(filtered_results)}개")
+                sidebar_logger.debug("세션 저장 완료 - filter_category: %s, 결과: %s개", category, len(filtered_ids))
                 
                 # 토스트 메시지에 중복 필터 정보 포함
                 if current_ai_model and current_ai_model != "전체":
                     model_names = {"gpt4": "ChatGPT", "claude": "Claude", "gemini": "Gemini", "midjourney": "Midjourney"}
                     model_name = model_names.get(current_ai_model, current_ai_model)
-                    show_toast(page, f"'{category}' + '{model_name}' 필터: {len(filtered_results)}개 프롬프트", 1000)
+                    show_toast(page, f"'{category}' + '{model_name}' 필터: {len(filtered_ids)}개 프롬프트", 1000)
                 else:
-                    show_toast(page, f"'{category}' 카테고리 {len(filtered_results)}개 프롬프트", 1000)
+                    show_toast(page, f"'{category}' 카테고리 {len(filtered_ids)}개 프롬프트", 1000)
             
             # 직접 UI 업데이트 (페이지 이동 없이)
-            print(f"[DEBUG] 카테고리 필터 적용 후 직접 UI 업데이트: {category}")
+            sidebar_logger.debug("카테고리 필터 적용 후 직접 UI 업데이트: %s", category)
             _update_ui_after_filter(page)
             
         except Exception as e:
-            print(f"[ERROR] 카테고리 필터 오류: {e}")
-            import traceback
-            traceback.print_exc()
+            sidebar_logger.exception("카테고리 필터 오류: %s", e)
             show_toast(page, "필터 적용 중 오류가 발생했습니다.", 1000)
     
     def apply_ai_model_filter(ai_model_key: str):
         """AI 모델 필터 적용"""
         try:
-            from services.csv_utils import read_csv_rows
-            from pathlib import Path
+            from services.filter_service import query_prompt_ids
             
-            print(f"[DEBUG] AI 모델 필터 적용: {ai_model_key}")
+            sidebar_logger.debug("AI 모델 필터 적용: %s", ai_model_key)
             
-            # 기존 검색 결과만 초기화 (카테고리 필터는 유지)
-            if page.session.get("search_results") is not None:
-                page.session.remove("search_results")
+            # 기존 검색어만 초기화 (카테고리 필터는 유지)
             if page.session.get("search_query") is not None:
                 page.session.remove("search_query")
             # 카테고리 필터는 유지하여 중복 필터 가능
@@ -163,40 +130,22 @@ def _create_filter_sidebar(page: ft.Page) -> ft.Container:
                     page.session.remove("filter_ai_model")
                 if page.session.get("filter_category") is not None:
                     page.session.remove("filter_category")
-                if page.session.get("search_results") is not None:
-                    page.session.remove("search_results")
                 if page.session.get("search_query") is not None:
                     page.session.remove("search_query")
                 
                 show_toast(page, "전체 프롬프트를 표시합니다.", 1000)
                 
                 # 전체 선택 시 UI 업데이트
-                print(f"[DEBUG] 전체 AI 모델 선택 - 모든 필터 초기화 후 UI 업데이트")
+                sidebar_logger.debug("전체 AI 모델 선택 - 모든 필터 초기화 후 UI 업데이트")
                 _update_ui_after_filter(page)
                 return
             else:
                 # AI 모델 필터 적용 (카테고리 필터와 중복 적용)
-                prompts_data = read_csv_rows(Path("data/prompts.csv"))
-                filtered_results = []
-                
                 # 기존 카테고리 필터 확인
                 current_category = page.session.get("filter_category")
                 
-                for prompt in prompts_data:
-                    prompt_category = prompt.get("category", "").strip()
-                    prompt_ai_model = prompt.get("ai_model_key", "").strip()
-                    
-                    # AI 모델 조건 확인
-                    ai_model_match = (prompt_ai_model == ai_model_key)
-                    
-                    # 카테고리 조건 확인 (설정되어 있으면)
-                    category_match = True
-                    if current_category and current_category != "전체":
-                        category_match = (prompt_category == current_category)
-                    
-                    # 두 조건 모두 만족하면 추가
-                    if ai_model_match and category_match:
-                        filtered_results.append(prompt)
+                # facet posting 교집합으로 결과 수만 확인 (세션에는 조건만 저장)
+                filtered_ids = query_prompt_ids(current_category, ai_model_key)
                 
                 # AI 모델 이름 매핑
                 model_names = {
@@ -208,222 +157,184 @@ def _create_filter_sidebar(page: ft.Page) -> ft.Container:
                 model_name = model_names.get(ai_model_key, ai_model_key)
                 
                 page.session.set("filter_ai_model", ai_model_key)
-                page.session.set("search_results", filtered_results)
-                print(f"[DEBUG] 세션 저장 완료 - filter_ai_model: {ai_model_key}, search_results: {len(filtered_results)}개")
+                sidebar_logger.debug("세션 저장 완료 - filter_ai_model: %s, 결과: %s개", ai_model_key, len(filtered_ids))
                 
                 # 토스트 메시지에 중복 필터 정보 포함
                 if current_category and current_category != "전체":
-                    show_toast(page, f"'{current_category}' + '{model_name}' 필터: {len(filtered_results)}개 프롬프트", 1000)
+                    show_toast(page, f"'{current_category}' + '{model_name}' 필터: {len(filtered_ids)}개 프롬프트", 1000)
                 else:
-                    show_toast(page, f"'{model_name}' 모델 {len(filtered_results)}개 프롬프트", 1000)
+                    show_toast(page, f"'{model_name}' 모델 {len(filtered_ids)}개 프롬프트", 1000)
             
             # 직접 UI 업데이트 (페이지 이동 없이)
-            print(f"[DEBUG] AI 모델 필터 적용 후 직접 UI 업데이트: {ai_model_key}")
+            sidebar_logger.debug("AI 모델 필터 적용 후 직접 UI 업데이트: %s", ai_model_key)
             _update_ui_after_filter(page)
             
         except Exception as e:
-            print(f"[ERROR] AI 모델 필터 오류: {e}")
-            import traceback
-            traceback.print_exc()
+            sidebar_logger.exception("AI 모델 필터 오류: %s", e)
             show_toast(page, "필터 적용 중 오류가 발생했습니다.", 1000)
     
-    # 실제 데이터에서 카테고리 목록 가져오기
-    print("[DEBUG] 데이터 로딩 시작")
-    try:
-        from services.csv_utils import read_csv_rows
-        from pathlib import Path
-        
-        prompts_data = read_csv_rows(Path("data/prompts.csv"))
-        print(f"[DEBUG] 로딩된 프롬프트 개수: {len(prompts_data) if prompts_data else 0}")
-        
-        categories_set = set(["전체"])  # 전체는 기본 포함
-        ai_models_set = set()
-        
-        for i, prompt in enumerate(prompts_data[:5]):  # 처음 5개만 디버그 출력
-            print(f"[DEBUG] 프롬프트 {i+1}: category='{prompt.get('category', '')}', ai_model='{prompt.get('ai_model_key', '')}'")
-        
-        for prompt in prompts_data:
-            # 카테고리 수집
-            category = prompt.get("category", "").strip()
-            if category and category not in ["", "1234"]:  # 빈 값이나 테스트 데이터 제외
-                categories_set.add(category)
-                print(f"[DEBUG] 카테고리 추가: '{category}'")
-            
-            # AI 모델 수집
-            ai_model = prompt.get("ai_model_key", "").strip()
-            if ai_model and ai_model not in ["", "1234"]:  # 빈 값이나 테스트 데이터 제외
-                ai_models_set.add(ai_model)
-                print(f"[DEBUG] AI 모델 추가: '{ai_model}'")
-        
-        # "전체"를 최상단으로, 나머지는 정렬
-        categories_list = sorted([cat for cat in categories_set if cat != "전체"])
-        categories = ["전체"] + categories_list
-        print(f"[DEBUG] 실제 카테고리 목록: {categories}")
-        
-        # AI 모델 이름 매핑
-        model_mapping = {
-            "gpt4": "ChatGPT",
-            "claude": "Claude",
-            "gemini": "Gemini",
-            "midjourney": "Midjourney",
-            "stable_diffusion": "Stable Diffusion"
-        }
-        
-        ai_models = [{"key": "전체", "name": "전체"}]
-        for key in sorted(ai_models_set):
-            name = model_mapping.get(key, key.title())
-            ai_models.append({"key": key, "name": name})
-        
-        print(f"[DEBUG] 실제 AI 모델 목록: {ai_models}")
-        
-    except Exception as e:
-        print(f"[ERROR] 데이터 로딩 오류: {e}")
-        categories = ["전체", "텍스트"]
-        ai_models = [{"key": "전체", "name": "전체"}, {"key": "gpt4", "name": "ChatGPT"}]
+    facets = _load_sidebar_facets(page)
+    current_category = facets["current_category"]
+    current_ai_model = facets["current_ai_model"]
     
-    # 카테고리 버튼들 생성
-    current_category = page.session.get("filter_category") or ""
-    print(f"[DEBUG] 사이드바 생성 시 현재 카테고리: '{current_category}'")
-    category_buttons = []
+    # 카테고리 버튼들 생성 (필터 변경 시 _refresh_filter_sidebar 가 텍스트/스타일만 갱신)
+    sidebar_logger.debug("사이드바 생성 시 현재 카테고리: '%s'", current_category)
+    category_buttons = {}
     
-    for category in categories:
-        is_active = (category == current_category) or (category == "전체" and not current_category)
-        print(f"[DEBUG] 카테고리 버튼 생성: {category}, 활성화: {is_active}, 현재 카테고리: {current_category}")
-        
-        button = ft.TextButton(
-            text=f"{'▶ ' if is_active else '• '}{category}",
-            style=ft.ButtonStyle(
-                color=Colors.BLUE_600 if is_active else Colors.GREY_600,
-                bgcolor=Colors.BLUE_50 if is_active else None,
-            ),
+    for category in facets["categories"]:
+        text, style = _filter_button_props(
+            category, facets["category_counts"].get(category, 0), facets["category_active"](category)
+        )
+        category_buttons[category] = ft.TextButton(
+            text=text,
+            style=style,
             on_click=lambda e, cat=category: apply_category_filter(cat)
         )
-        category_buttons.append(button)
     
     # AI 모델 버튼들 생성
-    current_ai_model = page.session.get("filter_ai_model") or ""
-    print(f"[DEBUG] 사이드바 생성 시 현재 AI 모델: '{current_ai_model}'")
-    ai_model_buttons = []
+    sidebar_logger.debug("사이드바 생성 시 현재 AI 모델: '%s'", current_ai_model)
+    ai_model_buttons = {}
     
-    for model in ai_models:
-        is_active = (model["key"] == current_ai_model) or (model["key"] == "전체" and not current_ai_model)
-        print(f"[DEBUG] AI 모델 버튼 생성: {model['name']}, 활성화: {is_active}, 현재 모델: {current_ai_model}")
-        
-        button = ft.TextButton(
-            text=f"{'▶ ' if is_active else '• '}{model['name']}",
-            style=ft.ButtonStyle(
-                color=Colors.BLUE_600 if is_active else Colors.GREY_600,
-                bgcolor=Colors.BLUE_50 if is_active else None,
-            ),
+    for model in facets["ai_models"]:
+        text, style = _filter_button_props(
+            model["name"], facets["model_counts"].get(model["key"], 0), facets["model_active"](model["key"])
+        )
+        ai_model_buttons[model["key"]] = ft.TextButton(
+            text=text,
+            style=style,
             on_click=lambda e, key=model["key"]: apply_ai_model_filter(key)
         )
-        ai_model_buttons.append(button)
     
     return ft.Container(
         content=ft.Column([
             ft.Text("🔍 필터", size=16, weight=ft.FontWeight.BOLD),
             ft.Container(height=10),
             ft.Text("카테고리", size=14, weight=ft.FontWeight.BOLD),
-            *category_buttons,
+            *category_buttons.values(),
             ft.Container(height=10),
             ft.Text("AI 모델", size=14, weight=ft.FontWeight.BOLD),
-            *ai_model_buttons,
+            *ai_model_buttons.values(),
         ]),
         width=UI_CONSTANTS["SIDEBAR_WIDTH"],
         padding=20,
         bgcolor=Colors.GREY_50,
+        data={
+            "category_buttons": category_buttons,
+            "ai_model_buttons": ai_model_buttons,
+            "model_names": {m["key"]: m["name"] for m in facets["ai_models"]},
+        },
     )
 
 
+def _load_sidebar_facets(page: ft.Page) -> dict:
+    """facet 인덱스에서 카테고리/AI 모델 목록과 개수, 현재 선택 상태 조회 (CSV 재스캔 없음)"""
+    current_category = page.session.get("filter_category") or ""
+    current_ai_model = page.session.get("filter_ai_model") or ""
+    try:
+        from services.facet_index import get_facet_index
+        from services.filter_service import get_available_categories, get_available_ai_models
+        
+        facets = get_facet_index()
+        excluded = ["", "1234"]  # 빈 값이나 테스트 데이터 제외
+        categories = [cat for cat in get_available_categories() if cat not in excluded]
+        ai_models = [model for model in get_available_ai_models() if model["key"] not in excluded]
+        
+        # 버튼 옆 개수: 다른 축에서 선택된 필터와의 조합 기준
+        category_counts = facets.category_counts(current_ai_model or None)
+        model_counts = facets.model_counts(current_category or None)
+        category_counts["전체"] = facets.count(ai_model=current_ai_model or None)
+        model_counts["전체"] = facets.count(category=current_category or None)
+        sidebar_logger.debug("실제 카테고리 목록: %s", categories)
+        sidebar_logger.debug("실제 AI 모델 목록: %s", ai_models)
+        
+    except Exception as e:
+        sidebar_logger.error("데이터 로딩 오류: %s", e)
+        categories = ["전체", "텍스트"]
+        ai_models = [{"key": "전체", "name": "전체"}, {"key": "gpt4", "name": "ChatGPT"}]
+        category_counts = {}
+        model_counts = {}
+    
+    return {
+        "current_category": current_category,
+        "current_ai_model": current_ai_model,
+        "categories": categories,
+        "ai_models": ai_models,
+        "category_counts": category_counts,
+        "model_counts": model_counts,
+        "category_active": lambda c: (c == current_category) or (c == "전체" and not current_category),
+        "model_active": lambda k: (k == current_ai_model) or (k == "전체" and not current_ai_model),
+    }
+
+
+def _filter_button_props(label: str, count: int, is_active: bool):
+    """사이드바 필터 버튼의 텍스트와 스타일 (생성/갱신 공용)"""
+    text = f"{'▶ ' if is_active else '• '}{label} ({count})"
+    style = ft.ButtonStyle(
+        color=Colors.BLUE_600 if is_active else Colors.GREY_600,
+        bgcolor=Colors.BLUE_50 if is_active else None,
+    )
+    return text, style
+
+
+def _refresh_filter_sidebar(page: ft.Page, sidebar: ft.Control):
+    """기존 사이드바 버튼의 개수/활성 상태만 제자리에서 갱신
+    반환: 바뀐 버튼 목록 (카테고리/모델 목록 자체가 바뀌었으면 None -> 호출자가 새로 생성)
+    """
+    refs = getattr(sidebar, "data", None)
+    if not isinstance(refs, dict) or "category_buttons" not in refs:
+        return None
+    facets = _load_sidebar_facets(page)
+    category_buttons = refs["category_buttons"]
+    ai_model_buttons = refs["ai_model_buttons"]
+    model_names = {m["key"]: m["name"] for m in facets["ai_models"]}
+    if list(category_buttons) != facets["categories"] or refs["model_names"] != model_names:
+        return None
+    
+    changed = []
+    targets = [
+        (category_buttons[c], c, facets["category_counts"].get(c, 0), facets["category_active"](c))
+        for c in facets["categories"]
+    ] + [
+        (ai_model_buttons[k], name, facets["model_counts"].get(k, 0), facets["model_active"](k))
+        for k, name in model_names.items()
+    ]
+    for button, label, count, is_active in targets:
+        text, style = _filter_button_props(label, count, is_active)
+        if button.text != text:
+            # 텍스트에 활성 표시(▶)와 개수가 모두 들어 있으므로 텍스트가 같으면 스타일도 같다
+            button.text = text
+            button.style = style
+            changed.append(button)
+    sidebar_logger.debug("사이드바 버튼 갱신: %d개", len(changed))
+    return changed
+
+
 def build_home_view(page: ft.Page) -> ft.View:
     """홈 화면 - 반응형 레이아웃"""
-    print("[DEBUG] build_home_view 시작")
+    logger.debug("build_home_view 시작")
     
     # 현재 세션 상태 확인
     current_category = page.session.get("filter_category")
     current_ai_model = page.session.get("filter_ai_model") 
-    current_search_results = page.session.get("search_results")
-    print(f"[DEBUG] 홈 뷰 생성 시 세션 상태 - 카테고리: {current_category}, AI모델: {current_ai_model}, 검색결과: {len(current_search_results) if current_search_results else 'None'}")
+    current_search_query = page.session.get("search_query")
+    logger.debug("홈 뷰 생성 시 세션 상태 - 카테고리: %s, AI모델: %s, 검색어: %s",
+                 current_category, current_ai_model, current_search_query)
     
     try:
-        header = create_header(page)
-        print("[DEBUG] 헤더 생성 완료")
-        
-        # 현재 페이지 너비 확인
-        page_width = getattr(page, 'window_width', 1200)
-        print(f"[DEBUG] build_home_view 페이지 너비: {page_width}px")
-        
-        # 프롬프트 카드 컨테이너
-        cards_container = ft.Column([], spacing=0, expand=True, scroll=ft.ScrollMode.AUTO)
-        print("[DEBUG] 카드 컨테이너 생성 완료")
-        
-        # 반응형 래퍼 - prpt.ai 스타일
-        def responsive_wrapper(main_content):
-            
-            if page_width >= 1000:
-                # 큰 화면: 사이드바 + 메인 콘텐츠
-                print("[DEBUG] 사이드바 생성 시작")
-                filter_sidebar = _create_filter_sidebar(page)
-                print("[DEBUG] 사이드바 생성 완료")
-                
-                content_wrapper = ft.Container(
-                    content=ft.Row([
-                        ft.Container(
-                            content=filter_sidebar,
-                            alignment=ft.alignment.top_left,  # 사이드바 상단 고정
-                        ),
-                        ft.Container(
-                            content=main_content,
-                            expand=True,
-                            padding=ft.padding.only(left=20, right=20, top=20, bottom=20),
-                        )
-                    ], 
-                    alignment=ft.MainAxisAlignment.START,  # Row 가로 정렬
-                    vertical_alignment=ft.CrossAxisAlignment.START),  # Row 세로 정렬 (상단 고정)
-                    width=min(UI_CONSTANTS["MAX_CONTENT_WIDTH"], page_width),
-                    alignment=ft.alignment.top_center,  # 전체 컨테이너도 상단 정렬
-                )
-            else:
-                # 작은 화면: 메인 콘텐츠만
-                content_wrapper = ft.Container(
-                    content=main_content,
-                    width=min(UI_CONSTANTS["MAX_CONTENT_WIDTH"], page_width),
-                    padding=20,
-                    alignment=ft.alignment.top_center,  # 상단 중앙 정렬
-                )
-            
-            return ft.Container(
-                content=content_wrapper,
-                bgcolor=Colors.GREY_50,
-                expand=True,
-                alignment=ft.alignment.top_center,  # 상단 중앙 정렬
-            )
-    
-        main_content = responsive_wrapper(cards_container)
-        print("[DEBUG] 반응형 래퍼 생성 완료")
-        
-        # View 생성
-        home_view = ft.View(
-            route="/",
-            controls=[header, main_content],
-            scroll=ft.ScrollMode.AUTO,
-        )
-        print("[DEBUG] View 생성 완료")
-        
-        # 카드 로딩 (이미 계산된 페이지 너비 사용)
-        load_prompt_cards(cards_container, page, page_width)
-        print("[DEBUG] 카드 로딩 완료")
+        # 헤더/사이드바/카드 컨트롤을 보관하는 컨트롤러 생성 (이후 필터/리사이즈는 부분 갱신)
+        controller = HomeViewController(page, _create_filter_sidebar, _refresh_filter_sidebar)
+        page.session.set(HOME_CONTROLLER_KEY, controller)
+        home_view = controller.view
+        logger.debug("홈 뷰 생성 완료 (너비: %spx)", controller.page_width)
         
         # 환영 보너스 토스트 체크
         _check_welcome_bonus(page)
-        print("[DEBUG] 환영 보너스 체크 완료")
+        logger.debug("환영 보너스 체크 완료")
         
         return home_view
         
     except Exception as e:
-        print(f"[ERROR] build_home_view 오류: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("build_home_view 오류: %s", e)
         
         # 오류 발생 시 기본 뷰 반환
         return ft.View(
@@ -454,19 +365,27 @@ def main(page: ft.Page):
     page.scroll = ft.ScrollMode.AUTO
     page.padding = 0
     
+    # CSV 스키마 마이그레이션 (프로세스당 한 번, 이후 조회 경로에서는 스키마 검사 없음)
+    from services.migrations import run_migrations
+    run_migrations()
+    
 
 
     def on_resize(e):
-        """페이지 크기 변경 시 홈 뷰 재구성"""
+        """페이지 크기 변경 시 홈 레이아웃 폭/카드 너비만 조정 (디바운스)"""
         try:
             if page.route == "/":
                 new_width = getattr(page, 'window_width', 1200)
-                print(f"[DEBUG] 페이지 리사이즈: {new_width}px")
-                # 홈 뷰 재구성
-                page.views[-1] = build_home_view(page)
-                page.update()
+                logger.debug("페이지 리사이즈: %spx", new_width)
+                controller = get_home_controller(page)
+                if controller is not None:
+                    # 연속 이벤트는 디바운스 후 한 번만 반영
+                    controller.schedule_resize(new_width)
+                else:
+                    page.views[-1] = build_home_view(page)
+                    page.update()
         except Exception as ex:
-            print(f"[DEBUG] 리사이즈 오류: {ex}")
+            logger.debug("리사이즈 오류: %s", ex)
 
     def route_change(e):
         """라우팅 처리"""
@@ -490,7 +409,7 @@ def main(page: ft.Page):
         page.views.clear()
         
         route = page.route or "/"
-        print(f"[DEBUG] route_change: {route}")
+        logger.debug("route_change: %s", route)
         
         if route == "/":
             page.views.append(build_home_view(page))
@@ -23,6 +23,7 @@ def create_stat_handler(
         current_user_id: 현재 사용자 ID
         prompt_id: 프롬프트 ID
         error_msg: 에러 메시지
+        view_prompt_id: 포인트 소비와 같은 커밋에서 조회를 기록할 프롬프트 ID
         success_callback: 성공 시 실행할 콜백
     
     Returns:
@@ -54,7 +55,8 @@ def create_navigation_handler(
     route: str,
     auth_required: bool = False,
     point_cost: int = 0,
-    error_msg: str = "페이지 이동 중 오류가 발생했습니다."
+    error_msg: str = "페이지 이동 중 오류가 발생했습니다.",
+    view_prompt_id: Optional[str] = None,
 ) -> Callable:
     """
     네비게이션 핸들러 팩토리
@@ -93,10 +95,13 @@ def create_navigation_handler(
                 current_user = get_current_user(page)
                 user_id = current_user.get("user_id")
                 
-                result = try_consume_view(user_id)
+                result = try_consume_view(user_id, view_prompt_id)
                 if not result.get("ok"):
                     _show_point_shortage_dialog(page)
                     return
+                if view_prompt_id:
+                    from services.interactions_service import VIEW_RECORDED_SESSION_KEY
+                    page.session.set(VIEW_RECORDED_SESSION_KEY, str(view_prompt_id))
             
             # 네비게이션 실행
             page.go(route)
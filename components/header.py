@@ -1,6 +1,9 @@
 import flet as ft
 from flet import Colors
 from components.toast import show_toast
+from utils.log_utils import get_logger
+
+logger = get_logger("header")
 
 
 def _get_current_user(page: ft.Page):
@@ -37,9 +40,43 @@ def _create_search_area(page: ft.Page, page_width: int) -> ft.Container:
         color=Colors.WHITE,
         on_click=lambda e: _perform_search(page, search_field.value)
     )
-    
+
+    # 자동완성 제안 목록 (메모리 인덱스 조회만 하므로 입력마다 호출해도 디스크 접근 없음)
+    suggestions_column = ft.Column([], spacing=0, visible=False)
+
+    def select_suggestion(word: str):
+        search_field.value = word
+        suggestions_column.visible = False
+        suggestions_column.controls = []
+        search_field.update()
+        suggestions_column.update()
+        _perform_search(page, word)
+
+    def update_suggestions(e):
+        try:
+            from services.search_service import get_search_suggestions
+            query = (e.control.value or "").strip()
+            words = get_search_suggestions(query, limit=5) if query else []
+            suggestions_column.controls = [
+                ft.TextButton(
+                    text=word,
+                    style=ft.ButtonStyle(color=Colors.GREY_700),
+                    on_click=lambda e, w=word: select_suggestion(w),
+                )
+                for word in words
+            ]
+            suggestions_column.visible = bool(words)
+            suggestions_column.update()
+        except Exception as ex:
+            logger.error("자동완성 오류: %s", ex)
+
+    search_field.on_change = update_suggestions
+
     return ft.Container(
-        content=ft.Row([search_field, search_button], tight=True),
+        content=ft.Column([
+            ft.Row([search_field, search_button], tight=True),
+            suggestions_column,
+        ], spacing=4, tight=True),
         expand=True
     )
 
@@ -47,8 +84,6 @@ def _create_search_area(page: ft.Page, page_width: int) -> ft.Container:
 def _clear_search_results(page: ft.Page):
     """검색 결과 초기화"""
     try:
-        if page.session.get("search_results") is not None:
-            page.session.remove("search_results")
         if page.session.get("search_query") is not None:
             page.session.remove("search_query")
         if page.session.get("filter_category") is not None:
@@ -62,25 +97,19 @@ def _clear_search_results(page: ft.Page):
             search_field.value = ""
             search_field.update()
         
-        if page.route == "/":
-            # 현재 메인 페이지에 있으면 뷰를 다시 빌드
-            from app import build_home_view
-            page.views[-1] = build_home_view(page)
-            page.update()
-        else:
-            page.go("/")
+        # 현재 메인 페이지면 사이드바/카드만 갱신, 아니면 홈으로 이동
+        from components.home_controller import refresh_home
+        refresh_home(page)
     except Exception as e:
-        print(f"[ERROR] 검색 결과 초기화 오류: {e}")
+        logger.error("검색 결과 초기화 오류: %s", e)
 
 
 def _go_home_and_clear_filters(page: ft.Page):
     """홈으로 이동하고 모든 필터/검색 상태 초기화"""
     try:
-        print("[DEBUG] 로고 클릭 - 홈으로 이동 및 필터 초기화")
+        logger.debug("로고 클릭 - 홈으로 이동 및 필터 초기화")
         
         # 모든 검색/필터 상태 초기화
-        if page.session.get("search_results") is not None:
-            page.session.remove("search_results")
         if page.session.get("search_query") is not None:
             page.session.remove("search_query")
         if page.session.get("filter_category") is not None:
@@ -94,19 +123,14 @@ def _go_home_and_clear_filters(page: ft.Page):
             search_field.value = ""
             search_field.update()
         
-        # 홈으로 강제 이동 및 새로고침
-        if page.route == "/":
-            # 현재 메인 페이지에 있으면 뷰를 다시 빌드
-            from app import build_home_view
-            page.views[-1] = build_home_view(page)
-            page.update()
-        else:
-            page.go("/")
+        # 홈으로 이동 (이미 홈이면 사이드바/카드만 갱신)
+        from components.home_controller import refresh_home
+        refresh_home(page)
         
         show_toast(page, "홈으로 돌아갑니다.", 1000)
         
     except Exception as e:
-        print(f"[ERROR] 홈 이동 오류: {e}")
+        logger.error("홈 이동 오류: %s", e)
         page.go("/")
 
 
@@ -125,31 +149,25 @@ def _perform_search(page: ft.Page, query: str):
         return
     
     try:
-        # 검색 결과를 세션에 저장
-        from services.search_service import search_prompts
-        results = search_prompts(query)
+        # 결과 수만 확인 (행 데이터는 카드 로딩 시 인덱스로 다시 조회)
+        from services.search_service import search_prompt_ids
+        result_ids = search_prompt_ids(query)
         
-        if not results:
+        if not result_ids:
             show_toast(page, f"'{query}' 검색 결과가 없습니다.", 1000)
             return
         
-        # 검색 결과를 세션에 저장하고 메인 페이지로 이동
+        # 검색어만 세션에 저장하고 메인 페이지로 이동
         page.session.set("search_query", query)
-        page.session.set("search_results", results)
         
-        show_toast(page, f"'{query}' 검색 결과 {len(results)}개 발견!", 1000)
+        show_toast(page, f"'{query}' 검색 결과 {len(result_ids)}개 발견!", 1000)
         
-        # 메인 페이지로 이동하고 강제로 새로고침
-        if page.route != "/":
-            page.go("/")
-        else:
-            # 현재 메인 페이지에 있으면 뷰를 다시 빌드
-            from app import build_home_view
-            page.views[-1] = build_home_view(page)
-            page.update()
+        # 메인 페이지로 이동 (이미 홈이면 카드 목록만 교체)
+        from components.home_controller import refresh_home
+        refresh_home(page)
             
     except Exception as e:
-        print(f"[ERROR] 검색 오류: {e}")
+        logger.error("검색 오류: %s", e)
         show_toast(page, "검색 중 오류가 발생했습니다.", 1000)
 
 def build_user_menu(page: ft.Page) -> ft.Row:
@@ -0,0 +1,175 @@
+"""
+홈 화면 컨트롤러
+
+헤더/사이드바/카드 컨트롤을 한 번 만들어 유지하고, 필터·검색·리사이즈 시
+바뀐 부분(사이드바 내용, 카드 목록, 너비)만 갱신해 Flet 이 작은 diff 만 보내도록 한다.
+"""
+import threading
+from typing import Callable, List, Optional
+
+import flet as ft
+from flet import Colors
+
+from components.header import create_header
+from components.prompt_card import load_prompt_cards, resize_prompt_cards
+from config.app_config import config
+from config.constants import UI_CONSTANTS
+from utils.log_utils import get_logger
+
+logger = get_logger("home")
+
+SESSION_KEY = "home_controller"
+
+
+class HomeViewController:
+    """홈 View 와 하위 컨트롤을 보관하고 부분 갱신하는 컨트롤러"""
+
+    def __init__(self, page: ft.Page, sidebar_builder: Callable[[ft.Page], ft.Control],
+                 sidebar_refresher: Optional[Callable[[ft.Page, ft.Control], Optional[List[ft.Control]]]] = None):
+        self.page = page
+        self._sidebar_builder = sidebar_builder
+        # 기존 사이드바의 개수/활성 표시만 고치고 바뀐 컨트롤을 돌려줌 (None 이면 새로 생성)
+        self._sidebar_refresher = sidebar_refresher
+        self.page_width = getattr(page, 'window_width', 1200) or 1200
+        self.layout_bucket = config.get_layout_bucket(self.page_width)
+        self._sidebar_stale = True
+        self._resize_timer: Optional[threading.Timer] = None
+        self._resize_lock = threading.Lock()
+
+        self.header = create_header(page)
+        self.cards_container = ft.Column([], spacing=0, expand=True, scroll=ft.ScrollMode.AUTO)
+        self.sidebar_slot = ft.Container(alignment=ft.alignment.top_left)  # 사이드바 상단 고정
+        self.main_slot = ft.Container(content=self.cards_container, expand=True)
+        self.content_wrapper = ft.Container(
+            content=ft.Row(
+                [self.sidebar_slot, self.main_slot],
+                alignment=ft.MainAxisAlignment.START,
+                vertical_alignment=ft.CrossAxisAlignment.START,
+            ),
+            alignment=ft.alignment.top_center,
+        )
+        self.view = ft.View(
+            route="/",
+            controls=[
+                self.header,
+                ft.Container(
+                    content=self.content_wrapper,
+                    bgcolor=Colors.GREY_50,
+                    expand=True,
+                    alignment=ft.alignment.top_center,
+                ),
+            ],
+            scroll=ft.ScrollMode.AUTO,
+        )
+
+        self._apply_layout()
+        load_prompt_cards(self.cards_container, page, self.page_width)
+
+    def _show_sidebar(self) -> bool:
+        # large 구간에서만 필터 사이드바 표시 (카드 너비 계산과 같은 기준)
+        return self.layout_bucket == "large"
+
+    def _apply_layout(self) -> None:
+        """현재 너비에 맞게 사이드바 표시 여부/패딩/폭 설정"""
+        show_sidebar = self._show_sidebar()
+        self.sidebar_slot.visible = show_sidebar
+        if show_sidebar and self._sidebar_stale:
+            self.sidebar_slot.content = self._sidebar_builder(self.page)
+            self._sidebar_stale = False
+        if show_sidebar:
+            self.main_slot.padding = ft.padding.only(left=20, right=20, top=20, bottom=20)
+            self.content_wrapper.padding = None
+        else:
+            self.main_slot.padding = None
+            self.content_wrapper.padding = 20
+        self.content_wrapper.width = min(UI_CONSTANTS["MAX_CONTENT_WIDTH"], self.page_width)
+
+    def is_active(self) -> bool:
+        """현재 화면에 표시 중인 홈 View 인지"""
+        return bool(self.page.views) and self.page.views[-1] is self.view
+
+    def refresh_results(self) -> None:
+        """필터/검색 조건이 바뀐 뒤 카드 목록을 교체하고 사이드바는 버튼 텍스트/스타일만 갱신
+        - 바뀐 버튼과 카드 컨테이너만 update() (사이드바 컨트롤은 그대로 유지)
+        - 숨겨진 사이드바는 다음에 표시될 때 새로 만든다
+        """
+        changed: List[ft.Control] = []
+        if not self._show_sidebar() or self.sidebar_slot.content is None:
+            self._sidebar_stale = True
+        else:
+            refreshed = None
+            if self._sidebar_refresher is not None:
+                refreshed = self._sidebar_refresher(self.page, self.sidebar_slot.content)
+            if refreshed is None:
+                # 카테고리/모델 목록이 바뀌었으면 사이드바를 새로 만든다
+                self.sidebar_slot.content = self._sidebar_builder(self.page)
+                self._sidebar_stale = False
+                changed.append(self.sidebar_slot)
+            else:
+                changed.extend(refreshed)
+        load_prompt_cards(self.cards_container, self.page, self.page_width)
+        changed.append(self.cards_container)
+        for control in changed:
+            control.update()
+
+    def schedule_resize(self, page_width: int) -> None:
+        """리사이즈 이벤트 디바운스: 마지막 이벤트 후 RESIZE_DEBOUNCE_MS 뒤에 한 번만 반영"""
+        with self._resize_lock:
+            if self._resize_timer is not None:
+                self._resize_timer.cancel()
+            self._resize_timer = threading.Timer(
+                config.ui.RESIZE_DEBOUNCE_MS / 1000, self._run_resize, args=(page_width,)
+            )
+            self._resize_timer.daemon = True
+            self._resize_timer.start()
+
+    def _run_resize(self, page_width: int) -> None:
+        with self._resize_lock:
+            self._resize_timer = None
+        try:
+            if self.is_active():
+                self.resize(page_width)
+        except Exception as ex:
+            logger.debug("리사이즈 반영 오류: %s", ex)
+
+    def resize(self, page_width: int) -> None:
+        """너비 변경 반영 (카드 재생성 없음)
+        - 같은 브레이크포인트 구간: 콘텐츠 폭과 카드 너비만 조정
+        - 구간이 바뀌면 사이드바 표시 여부/패딩까지 다시 배치
+        """
+        if page_width == self.page_width:
+            return
+        self.page_width = page_width
+        bucket = config.get_layout_bucket(page_width)
+        if bucket != self.layout_bucket:
+            self.layout_bucket = bucket
+            self._apply_layout()
+        else:
+            self.content_wrapper.width = min(UI_CONSTANTS["MAX_CONTENT_WIDTH"], page_width)
+        resize_prompt_cards(self.cards_container, page_width)
+        self.content_wrapper.update()
+
+
+def get_home_controller(page: ft.Page) -> Optional[HomeViewController]:
+    """현재 화면에 떠 있는 홈 컨트롤러 (없으면 None)"""
+    try:
+        controller = page.session.get(SESSION_KEY)
+    except Exception:
+        return None
+    if isinstance(controller, HomeViewController) and controller.is_active():
+        return controller
+    return None
+
+
+def refresh_home(page: ft.Page) -> None:
+    """홈 화면 결과 갱신 (홈이 아니면 홈으로 이동)"""
+    controller = get_home_controller(page)
+    if controller is not None:
+        controller.refresh_results()
+    elif page.route == "/":
+        # 홈 라우트지만 컨트롤러가 없으면 뷰를 새로 구성
+        from app import build_home_view
+        page.views[-1] = build_home_view(page)
+        page.update()
+    else:
+        page.go("/")
@@ -1,6 +1,6 @@
 """
 프롬프트 카드 컴포넌트 모듈
 """
-from .card_main import create_prompt_card, load_prompt_cards
+from .card_main import create_prompt_card, load_prompt_cards, resize_prompt_cards
 
-__all__ = ['create_prompt_card', 'load_prompt_cards']
+__all__ = ['create_prompt_card', 'load_prompt_cards', 'resize_prompt_cards']
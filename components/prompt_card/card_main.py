@@ -3,7 +3,8 @@
 """
 import flet as ft
 from flet import Colors
-from typing import Dict, Any, Optional
+from collections import OrderedDict
+from typing import Dict, Any, List, Optional, Tuple
 from pathlib import Path
 
 from config.app_config import config
@@ -11,23 +12,111 @@ from ..common_handlers import create_navigation_handler, create_hover_handler
 from utils.error_handler import safe_execute, ErrorType, handle_error
 from .card_thumbnails import create_thumbnail_area
 from .card_badges import create_ai_badge, create_category_badge, create_tags_row
-from .card_stats import create_stats_controls, create_stats_row
+from .card_stats import apply_interaction_state, create_stats_controls, create_stats_row
+from utils.log_utils import get_logger
+
+logger = get_logger("prompt_card")
+
+
+# 카드 컨트롤 캐시 (세션별, prompt_id 키). 재렌더링 시 내용이 같으면 컨트롤을 재사용하고 통계 값만 갱신
+CARD_CACHE_SESSION_KEY = "prompt_card_cache"
+CARD_CACHE_MAX_SIZE = 200
+STAT_FIELDS = ("likes", "shares", "comments", "bookmarks", "views")
+
+# 모든 카드가 공유하는 호버 핸들러 (상태 없음)
+_card_hover_handler = None
 
 
 def create_prompt_card(
     prompt_data: Dict[str, Any], 
     page: ft.Page, 
-    card_width: Optional[int] = None
+    card_width: Optional[int] = None,
+    interaction_state: Optional[Dict[str, bool]] = None
 ) -> ft.Container:
     """리팩토링된 프롬프트 카드 생성"""
+    card, _ = _build_prompt_card(prompt_data, page, card_width, _get_current_user_id(page), interaction_state)
+    return card
+
+
+def get_or_create_prompt_card(
+    prompt_data: Dict[str, Any],
+    page: ft.Page,
+    card_width: Optional[int] = None,
+    interaction_state: Optional[Dict[str, bool]] = None
+) -> ft.Container:
+    """캐시된 카드가 있으면 통계/너비/좋아요·북마크 상태만 갱신해 재사용, 없거나 내용이 바뀌었으면 새로 생성"""
+    current_user_id = _get_current_user_id(page)
+    prompt_id = str(prompt_data.get("prompt_id") or prompt_data.get("id") or "")
+    signature = _card_signature(prompt_data, current_user_id)
+    cache = _get_card_cache(page)
+    
+    entry = cache.get(prompt_id)
+    if entry is not None and entry["signature"] == signature:
+        cache.move_to_end(prompt_id)
+        card = entry["card"]
+        stats_controls = entry["stats"]
+        for field, text_control in stats_controls["texts"].items():
+            text_control.value = str(prompt_data.get(field, "0"))
+        if interaction_state is not None:
+            apply_interaction_state(stats_controls, interaction_state)
+        if card_width is not None:
+            card.width = card_width
+        return card
+    
+    card, stats_controls = _build_prompt_card(prompt_data, page, card_width, current_user_id, interaction_state)
+    cache[prompt_id] = {"signature": signature, "card": card, "stats": stats_controls}
+    cache.move_to_end(prompt_id)
+    while len(cache) > CARD_CACHE_MAX_SIZE:
+        cache.popitem(last=False)
+    return card
+
+
+def _get_card_cache(page: ft.Page) -> "OrderedDict[str, Dict[str, Any]]":
+    cache = page.session.get(CARD_CACHE_SESSION_KEY)
+    if not isinstance(cache, OrderedDict):
+        cache = OrderedDict()
+        page.session.set(CARD_CACHE_SESSION_KEY, cache)
+    return cache
+
+
+def _card_signature(prompt_data: Dict[str, Any], current_user_id: str) -> tuple:
+    """카드 모양을 결정하는 값들 (통계 값 제외). 바뀌면 카드를 새로 만든다"""
+    return (
+        current_user_id,
+        prompt_data.get("user_id"),
+        prompt_data.get("title"),
+        prompt_data.get("content"),
+        prompt_data.get("tags"),
+        prompt_data.get("category"),
+        prompt_data.get("ai_model_key"),
+        prompt_data.get("thumbnail_path"),
+    )
+
+
+def _get_card_hover_handler():
+    global _card_hover_handler
+    if _card_hover_handler is None:
+        _card_hover_handler = create_hover_handler(
+            hover_style=_convert_hover_style(config.ui.CARD_HOVER_STYLE),
+            normal_style=_convert_hover_style(config.ui.CARD_NORMAL_STYLE)
+        )
+    return _card_hover_handler
+
+
+def _build_prompt_card(
+    prompt_data: Dict[str, Any],
+    page: ft.Page,
+    card_width: Optional[int],
+    current_user_id: str,
+    interaction_state: Optional[Dict[str, bool]] = None
+) -> Tuple[ft.Container, Dict[str, Any]]:
+    """카드 컨트롤과 통계 컨트롤(texts/icons/clusters) 생성"""
     
     # 카드 너비 설정
     if card_width is None:
         page_width = getattr(page, 'window_width', 1200)
         card_width = config.get_responsive_card_width(page_width)
     
-    # 현재 사용자 정보
-    current_user_id = _get_current_user_id(page)
     prompt_id = str(prompt_data.get("prompt_id") or prompt_data.get("id") or "")
     
     # 카드 구성 요소들 생성
@@ -36,7 +125,7 @@ def create_prompt_card(
     tags_row = create_tags_row(prompt_data.get("tags", ""))
     
     # 통계 컨트롤들 생성
-    stats_controls = create_stats_controls(prompt_data, current_user_id, page)
+    stats_controls = create_stats_controls(prompt_data, current_user_id, page, interaction_state)
     stats_row = create_stats_row(stats_controls)
     
     # 카드 클릭 핸들러
@@ -45,17 +134,12 @@ def create_prompt_card(
         route=f"/prompt/{prompt_id}",
         auth_required=True,
         point_cost=config.business.POINT_COST_PER_VIEW,
-        error_msg="프롬프트 상세보기 중 오류가 발생했습니다."
-    )
-    
-    # 호버 핸들러
-    hover_handler = create_hover_handler(
-        hover_style=_convert_hover_style(config.ui.CARD_HOVER_STYLE),
-        normal_style=_convert_hover_style(config.ui.CARD_NORMAL_STYLE)
+        error_msg="프롬프트 상세보기 중 오류가 발생했습니다.",
+        view_prompt_id=prompt_id,
     )
     
     # 카드 컨테이너 생성
-    return ft.Container(
+    card = ft.Container(
         content=ft.Column([
             header_row,
             ft.Container(height=8),
@@ -79,9 +163,10 @@ def create_prompt_card(
         )],
         animate=config.ui.ANIMATION_DURATION,
         animate_scale=config.ui.ANIMATION_DURATION,
-        on_hover=hover_handler,
+        on_hover=_get_card_hover_handler(),
         on_click=_create_card_click_wrapper(card_click_handler, stats_controls),
     )
+    return card, stats_controls
 
 
 def _get_current_user_id(page: ft.Page) -> str:
@@ -235,7 +320,7 @@ def _delete_prompt(prompt_data: Dict[str, Any], page: ft.Page):
                 show_toast(page, "삭제 중 오류가 발생했습니다.", 1000)
                 
         except Exception as ex:
-            print(f"[ERROR] 프롬프트 삭제 오류: {ex}")
+            logger.error("프롬프트 삭제 오류: %s", ex)
             from components.toast import show_toast
             show_toast(page, "삭제 중 오류가 발생했습니다.", 1000)
     
@@ -260,132 +345,181 @@ def _delete_prompt(prompt_data: Dict[str, Any], page: ft.Page):
     page.update()
 
 
-def load_prompt_cards(container: ft.Column, page: ft.Page, page_width: Optional[int] = None):
-    """프롬프트 카드 로딩 및 그리드 배치"""
+# 무한 스크롤: 스크롤이 끝에서 이 픽셀 이내로 오면 다음 페이지 로드
+SCROLL_LOAD_THRESHOLD = 200
+
+
+def load_prompt_cards(
+    container: ft.Column,
+    page: ft.Page,
+    page_width: Optional[int] = None,
+    page_size: Optional[int] = None,
+):
+    """프롬프트 카드 로딩 및 그리드 배치
+    - 결과는 ID 목록으로만 조회하고 카드는 page_size 개씩 생성 (첫 페이지만 즉시 렌더링)
+    - 나머지는 스크롤이 끝에 닿거나 '더 보기' 버튼을 누를 때 이어서 추가
+    """
     
     # 반응형 카드 너비 계산을 함수 밖으로 이동
     if page_width is None:
         page_width = getattr(page, 'window_width', 1200)
     
     card_width = config.get_responsive_card_width(page_width)
+    page_size = page_size or config.business.DEFAULT_PAGE_SIZE
+    previous_state = container.data if isinstance(container.data, dict) else None
+    container.data = None
     
     def _load_cards():
-        from services.csv_utils import read_csv_rows
+        from services.prompt_service import get_prompts_by_ids
+        from services.interactions_service import get_interaction_states
+        from services.filter_service import query_prompt_ids
+        from services.search_service import search_prompt_ids
         
-        # 검색 결과 또는 필터 결과 확인
-        search_results = page.session.get("search_results")
+        # 세션에는 검색어/필터 조건만 저장되어 있음 -> 인덱스로 ID 목록 조회
         search_query = page.session.get("search_query")
         filter_category = page.session.get("filter_category")
         filter_ai_model = page.session.get("filter_ai_model")
         
-        print(f"[DEBUG] load_prompt_cards - search_results: {len(search_results) if search_results else 'None'}")
-        print(f"[DEBUG] load_prompt_cards - search_query: {search_query}")
-        print(f"[DEBUG] load_prompt_cards - filter_category: {filter_category}")
-        print(f"[DEBUG] load_prompt_cards - filter_ai_model: {filter_ai_model}")
-        
-        header_info = None
+        logger.debug(
+            "load_prompt_cards - search_query: %s, filter_category: %s, filter_ai_model: %s",
+            search_query, filter_category, filter_ai_model,
+        )
         
-        if search_results is not None:
-            # 검색 또는 필터 결과만 표시 (헤더 없이 깔끔하게)
-            prompts_data = search_results
-            print(f"[DEBUG] 필터링된 데이터만 사용: {len(prompts_data)}개 프롬프트")
-            
-            if not prompts_data:
-                # 결과가 없을 때만 메시지 표시
-                no_results_text = "결과가 없습니다."
-                if search_query:
-                    no_results_text = f"'{search_query}' 검색 결과가 없습니다."
-                elif filter_category:
-                    no_results_text = f"'{filter_category}' 카테고리에 프롬프트가 없습니다."
-                elif filter_ai_model:
-                    no_results_text = f"해당 AI 모델의 프롬프트가 없습니다."
-                
-                container.controls = [
-                    ft.Container(
-                        content=ft.Text(no_results_text, size=16, color=Colors.GREY_600),
-                        alignment=ft.alignment.center,
-                        padding=50
-                    )
-                ]
-                return
+        if search_query:
+            # 검색은 페이지마다 상위 offset+page_size(+1) 개만 힙으로 골라 받는다 (전체 정렬 없음)
+            def fetch_page(offset: int) -> Tuple[List[str], bool]:
+                ids = search_prompt_ids(search_query, limit=page_size + 1, offset=offset)
+                return ids[:page_size], len(ids) > page_size
         else:
-            # 전체 프롬프트 로드
-            prompts_data = read_csv_rows(Path("data/prompts.csv"))
-            print(f"[DEBUG] 전체 데이터 로드: {len(prompts_data) if prompts_data else 0}개 프롬프트")
+            # 필터가 없으면 전체 (최신순). facet 조회는 정렬된 ID 목록이므로 잘라서 사용
+            prompt_ids = query_prompt_ids(filter_category, filter_ai_model)
+            logger.debug("표시 대상: %d개 프롬프트", len(prompt_ids))
             
-            if not prompts_data:
+            def fetch_page(offset: int) -> Tuple[List[str], bool]:
+                return prompt_ids[offset:offset + page_size], offset + page_size < len(prompt_ids)
+        
+        first_page = fetch_page(0)
+        if not first_page[0]:
+            no_results_text = "결과가 없습니다."
+            if search_query:
+                no_results_text = f"'{search_query}' 검색 결과가 없습니다."
+            elif filter_category:
+                no_results_text = f"'{filter_category}' 카테고리에 프롬프트가 없습니다."
+            elif filter_ai_model:
+                no_results_text = f"해당 AI 모델의 프롬프트가 없습니다."
+            else:
                 container.controls = [ft.Text("프롬프트가 없습니다.", size=16, color=Colors.GREY_600)]
                 return
             
-            # 최신순으로 정렬
-            prompts_data.sort(key=lambda x: _safe_sort_key(x), reverse=True)
-            print(f"[DEBUG] 정렬 완료: {len(prompts_data)}개 프롬프트")
-        
-        # 카드들 생성
-        cards = []
-        for prompt in prompts_data:
-            card = create_prompt_card(prompt, page, card_width)
-            cards.append(card)
+            container.controls = [
+                ft.Container(
+                    content=ft.Text(no_results_text, size=16, color=Colors.GREY_600),
+                    alignment=ft.alignment.center,
+                    padding=50
+                )
+            ]
+            return
         
-        # 그리드 배치
-        if cards:
+        # 그리드 배치 (페이지 단위로 카드 추가). 이전 그리드가 있으면 재사용해 diff 를 작게 유지
+        if previous_state and "cards_row" in previous_state:
+            cards_row = previous_state["cards_row"]
+            cards_row.controls = []
+        else:
             cards_row = ft.Row(
-                controls=cards,
+                controls=[],
                 spacing=config.ui.GRID_SPACING,
                 alignment=ft.MainAxisAlignment.START,
                 wrap=True,
                 run_spacing=10,
             )
-            
-            # 필터링된 결과든 전체 결과든 헤더 없이 카드만 표시
-            container.controls = [cards_row]
-            print(f"[DEBUG] 카드 표시 완료: {len(cards)}개 카드")
-        else:
-            container.controls = [
-                ft.Container(
-                    content=ft.Text("프롬프트가 없습니다.", size=16, color=Colors.GREY_500),
-                    alignment=ft.alignment.center,
-                    height=200,
-                )
-            ]
+        # 페이지 로딩 상태 (resize_prompt_cards 에서 카드 너비를 바꿀 수 있도록 컨테이너에 보관)
+        state = {"offset": 0, "has_more": True, "loading": False, "card_width": card_width, "cards_row": cards_row}
+        container.data = state
+        
+        def load_next_page() -> bool:
+            """다음 페이지 카드 추가 (화면이 바뀌었으면 True)"""
+            if state["loading"] or not state["has_more"]:
+                return False
+            state["loading"] = True
+            try:
+                page_ids, state["has_more"] = first_page if state["offset"] == 0 else fetch_page(state["offset"])
+                if not page_ids:
+                    # 그 사이 결과가 줄어든 경우: '더 보기' 버튼만 숨김
+                    state["has_more"] = False
+                    more_area.visible = False
+                    return True
+                state["offset"] += len(page_ids)
+                # 좋아요/북마크 상태는 페이지 단위로 한 번에 조회
+                states = get_interaction_states(_get_current_user_id(page), page_ids)
+                for prompt in get_prompts_by_ids(page_ids):
+                    prompt_id = str(prompt.get("prompt_id") or prompt.get("id") or "")
+                    cards_row.controls.append(get_or_create_prompt_card(
+                        prompt, page, state["card_width"], states.get(prompt_id)
+                    ))
+                more_area.visible = state["has_more"]
+                logger.debug("카드 표시: %d개 (더 있음: %s)", len(cards_row.controls), state["has_more"])
+                return True
+            finally:
+                state["loading"] = False
+        
+        def show_more(e=None):
+            try:
+                if load_next_page():
+                    container.update()
+            except Exception as ex:
+                logger.error("추가 카드 로딩 오류: %s", ex)
+        
+        def on_scroll(e: ft.OnScrollEvent):
+            if e.max_scroll_extent - e.pixels <= SCROLL_LOAD_THRESHOLD:
+                show_more()
+        
+        # 스크롤 이벤트가 오지 않는 레이아웃(바깥 View 스크롤)용 폴백 버튼
+        more_area = ft.Container(
+            content=ft.TextButton("더 보기", on_click=show_more),
+            alignment=ft.alignment.center,
+            padding=10,
+        )
+        
+        load_next_page()
+        container.on_scroll = on_scroll
+        container.on_scroll_interval = 100
+        
+        # 필터링된 결과든 전체 결과든 헤더 없이 카드만 표시
+        container.controls = [cards_row, more_area]
     
     # 직접 실행으로 디버깅
     try:
         _load_cards()
     except Exception as e:
-        print(f"[ERROR] 프롬프트 카드 로딩 오류: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("프롬프트 카드 로딩 오류: %s", e)
         container.controls = [ft.Text(f"카드 로딩 오류: {e}", color=Colors.RED)]
 
 
+def resize_prompt_cards(container: ft.Column, page_width: int) -> bool:
+    """이미 렌더링된 카드 너비만 변경 (카드 재생성 없음). 변경했으면 True"""
+    state = container.data
+    if not isinstance(state, dict) or "cards_row" not in state:
+        return False
+    card_width = config.get_responsive_card_width(page_width)
+    if card_width == state["card_width"]:
+        return False
+    state["card_width"] = card_width
+    for card in state["cards_row"].controls:
+        card.width = card_width
+    return True
+
+
 def _clear_search_results(page: ft.Page):
     """검색 결과 초기화"""
     try:
         # 검색 관련 세션 데이터 제거
-        if page.session.get("search_results") is not None:
-            page.session.remove("search_results")
         if page.session.get("search_query") is not None:
             page.session.remove("search_query")
         
-        # 메인 페이지 새로고침
-        if page.route == "/":
-            from app import build_home_view
-            page.views[-1] = build_home_view(page)
-            page.update()
-        else:
-            page.go("/")
+        # 메인 페이지면 카드 목록만 갱신
+        from components.home_controller import refresh_home
+        refresh_home(page)
             
     except Exception as e:
-        print(f"[ERROR] 검색 결과 초기화 오류: {e}")
-
+        logger.error("검색 결과 초기화 오류: %s", e)
 
-def _safe_sort_key(prompt_data: Dict[str, Any]) -> int:
-    """안전한 정렬 키 생성"""
-    created_at = prompt_data.get("created_at", "0")
-    if not created_at or str(created_at).strip() == "":
-        return 0
-    try:
-        return int(created_at)
-    except (ValueError, TypeError):
-        return 0
@@ -3,18 +3,35 @@
 """
 import flet as ft
 from flet import Colors
-from typing import Callable, Optional
+from typing import Callable, Dict, Optional, Union
 from ..common_handlers import create_stat_handler, stop_event_propagation
 from utils.error_handler import safe_execute, ErrorType
 
 
+LIKE_ICONS = {True: "❤️", False: "🤍"}
+BOOKMARK_ACTIVE_BGCOLOR = Colors.BLUE_50
+
+
 def create_stats_controls(
     prompt_data: dict,
     current_user_id: str,
-    page: ft.Page
+    page: ft.Page,
+    interaction_state: Optional[Dict[str, bool]] = None
 ) -> dict:
-    """통계 컨트롤들 생성"""
+    """통계 컨트롤들 생성
+    - interaction_state: {"like": bool, "bookmark": bool}. 없으면 상태 인덱스에서 조회
+      (목록은 load_prompt_cards 에서 페이지 단위로 한 번에 조회해 넘긴다)
+    """
     prompt_id = str(prompt_data.get("prompt_id") or prompt_data.get("id") or "")
+    if interaction_state is None:
+        from services.interactions_service import get_interaction_states
+        interaction_state = get_interaction_states(current_user_id, [prompt_id])[prompt_id]
+    
+    # 좋아요/북마크 상태 표시용 아이콘
+    icons = {
+        'like': ft.Text(LIKE_ICONS[False], size=10),
+        'bookmark': ft.Text("🔖", size=10),
+    }
     
     # 텍스트 컨트롤들
     stats_texts = {
@@ -26,31 +43,51 @@ def create_stats_controls(
     }
     
     # 핸들러들 생성
-    handlers = _create_stat_handlers(stats_texts, current_user_id, prompt_id, page)
+    stats_controls = {'texts': stats_texts, 'icons': icons}
+    
+    # 토글 성공 시 아이콘/강조 상태 갱신
+    def on_toggled(itype: str):
+        def callback(active, total):
+            apply_interaction_state(stats_controls, {itype: bool(active)})
+            stats_controls['clusters'][itype].update()
+        return callback
+    
+    handlers = _create_stat_handlers(stats_texts, current_user_id, prompt_id, page, on_toggled)
     
     # 클러스터들 생성
     clusters = {
-        'like': _create_stat_cluster("❤️", stats_texts['likes'], handlers['like']),
+        'like': _create_stat_cluster(icons['like'], stats_texts['likes'], handlers['like']),
         'share': _create_stat_cluster("📤", stats_texts['shares'], handlers['share']),
         'comment': _create_stat_cluster("💬", stats_texts['comments'], None),  # 읽기 전용
-        'bookmark': _create_stat_cluster("🔖", stats_texts['bookmarks'], handlers['bookmark']),
+        'bookmark': _create_stat_cluster(icons['bookmark'], stats_texts['bookmarks'], handlers['bookmark']),
         'views': _create_stat_cluster("👁️", stats_texts['views'], None),  # 읽기 전용
     }
     
-    return {
-        'texts': stats_texts,
-        'handlers': handlers,
-        'clusters': clusters
-    }
+    stats_controls['handlers'] = handlers
+    stats_controls['clusters'] = clusters
+    apply_interaction_state(stats_controls, interaction_state)
+    
+    return stats_controls
+
+
+def apply_interaction_state(stats_controls: dict, interaction_state: Dict[str, bool]) -> None:
+    """좋아요(❤️/🤍)/북마크(배경 강조) 상태를 컨트롤에 반영 (update 는 호출자가)"""
+    if 'like' in interaction_state:
+        stats_controls['icons']['like'].value = LIKE_ICONS[bool(interaction_state['like'])]
+    if 'bookmark' in interaction_state:
+        stats_controls['clusters']['bookmark'].bgcolor = (
+            BOOKMARK_ACTIVE_BGCOLOR if interaction_state['bookmark'] else None
+        )
 
 
 def _create_stat_handlers(
     stats_texts: dict,
     current_user_id: str,
     prompt_id: str,
-    page: ft.Page
+    page: ft.Page,
+    on_toggled: Optional[Callable[[str], Callable]] = None
 ) -> dict:
-    """통계 핸들러들 생성"""
+    """통계 핸들러들 생성 (on_toggled(type) -> 좋아요/북마크 성공 콜백)"""
     from services.interactions_service import toggle_like, toggle_bookmark, record_share
     
     handlers = {}
@@ -61,7 +98,8 @@ def _create_stat_handlers(
         text_control=stats_texts['likes'],
         current_user_id=current_user_id,
         prompt_id=prompt_id,
-        error_msg="좋아요 처리 중 오류가 발생했습니다."
+        error_msg="좋아요 처리 중 오류가 발생했습니다.",
+        success_callback=on_toggled('like') if on_toggled else None
     )
     
     # 공유 핸들러
@@ -83,20 +121,22 @@ def _create_stat_handlers(
         text_control=stats_texts['bookmarks'],
         current_user_id=current_user_id,
         prompt_id=prompt_id,
-        error_msg="북마크 처리 중 오류가 발생했습니다."
+        error_msg="북마크 처리 중 오류가 발생했습니다.",
+        success_callback=on_toggled('bookmark') if on_toggled else None
     )
     
     return handlers
 
 
 def _create_stat_cluster(
-    icon: str, 
+    icon: Union[str, ft.Text], 
     text_control: ft.Text, 
     handler: Optional[Callable] = None
 ) -> ft.Container:
-    """통계 클러스터 생성"""
+    """통계 클러스터 생성 (icon 이 컨트롤이면 상태에 따라 바꿀 수 있도록 그대로 사용)"""
+    icon_control = icon if isinstance(icon, ft.Text) else ft.Text(icon, size=10)
     content = ft.Row([
-        ft.Text(icon, size=10), 
+        icon_control, 
         text_control
     ], spacing=2, tight=True)
     
@@ -27,6 +27,7 @@ class UIConfig:
     # 반응형 브레이크포인트
     BREAKPOINT_LARGE: int = 1000  # 3열 그리드
     BREAKPOINT_MEDIUM: int = 550  # 2열 그리드
+    RESIZE_DEBOUNCE_MS: int = 150  # 리사이즈 이벤트가 멈춘 뒤 레이아웃 반영까지 대기
     
     # 애니메이션
     ANIMATION_DURATION: int = 200
@@ -210,6 +211,14 @@ class AppConfig:
         """AI 모델 설정 조회"""
         return self.ai_model.AI_MODELS.get(model_key, self.ai_model.DEFAULT_MODEL)
     
+    def get_layout_bucket(self, page_width: int) -> str:
+        """브레이크포인트 구간 (large: 사이드바 표시, medium, small)"""
+        if page_width >= self.ui.BREAKPOINT_LARGE:
+            return "large"
+        if page_width >= self.ui.BREAKPOINT_MEDIUM:
+            return "medium"
+        return "small"
+    
     def get_responsive_card_width(self, page_width: int) -> int:
         """반응형 카드 너비 계산"""
         sidebar_width = self.ui.SIDEBAR_WIDTH if page_width >= self.ui.BREAKPOINT_LARGE else 0
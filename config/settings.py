@@ -32,6 +32,10 @@ CSV_FILES = {
    "interactions": DATA_DIR / "interactions.csv",
 }
 
+#매니저 저장소 엔진 ("csv" 또는 "sqlite")
+STORAGE_BACKEND = os.environ.get("STORAGE_BACKEND", "csv")
+SQLITE_DB_PATH = DATA_DIR / "promptub.db"
+
 #페이지 설정
 PAGINATION = {
     "prompts_per_page": 10,
@@ -42,3 +46,32 @@ PAGINATION = {
     "notifications_per_page": 10,
     "messages_per_page": 10,
 }
+
+#로깅 설정 (utils.log_utils)
+# - LOG_LEVEL: 기본 레벨, MODULE_LOG_LEVELS: 모듈별 레벨 (get_logger 이름 기준, 없으면 LOG_LEVEL)
+# - 모듈별 레벨은 LOG_LEVEL_<모듈명 대문자> 환경 변수로 덮어쓴다 (예: LOG_LEVEL_PROMPT_CARD=DEBUG)
+# - LOG_SAMPLE_EVERY: DEBUG 레코드를 N개 중 1개만 남길 모듈 (반복 루프용)
+LOG_LEVEL = os.environ.get("LOG_LEVEL", "INFO")
+
+
+def _module_log_level(name: str, default: str) -> str:
+    return os.environ.get(f"LOG_LEVEL_{name.upper()}", default)
+
+
+MODULE_LOG_LEVELS = {
+    # 카드/사이드바/리사이즈처럼 화면 갱신마다 여러 번 도는 경로는 기본 WARNING
+    "prompt_card": _module_log_level("prompt_card", "WARNING"),
+    "sidebar": _module_log_level("sidebar", "WARNING"),
+    "home": _module_log_level("home", "WARNING"),
+    "header": _module_log_level("header", "WARNING"),
+    # 서비스 계층은 기본 레벨을 따르되 개별 조정 가능
+    "comment_service": _module_log_level("comment_service", LOG_LEVEL),
+    "search_service": _module_log_level("search_service", LOG_LEVEL),
+    "filter_service": _module_log_level("filter_service", LOG_LEVEL),
+    "prompt_service": _module_log_level("prompt_service", LOG_LEVEL),
+    "prompt_detail": _module_log_level("prompt_detail", LOG_LEVEL),
+    "app": _module_log_level("app", LOG_LEVEL),
+}
+LOG_SAMPLE_EVERY = {
+    "sidebar": 10,
+}
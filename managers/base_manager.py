@@ -1,131 +1,139 @@
 """
 CSV 기반 데이터 매니저 기본 클래스
 """
-import csv
-import os
 from pathlib import Path
-from typing import List, Dict, Any, Optional, TypeVar, Generic
+from typing import List, Dict, Any, Optional, TypeVar, Generic, Sequence
 from abc import ABC, abstractmethod
 
+from managers.storage_engine import StorageEngine, create_storage_engine, to_storage_value
+
 T = TypeVar('T')  # 제네릭 타입 (User, PromptCard 등)
 
 class BaseManager(ABC, Generic[T]):
-    """CSV 파일 기반 데이터 매니저 기본 클래스"""
-    
-    def __init__(self, csv_file_path: Path):
+    """데이터 매니저 기본 클래스 (저장소 엔진: CSV 또는 SQLite)"""
+
+    # 저장소 엔진이 보조 인덱스를 만들 필드들 (하위 클래스에서 선언)
+    INDEX_FIELDS: Sequence[str] = ()
+
+    def __init__(self, csv_file_path: Path, engine: Optional[StorageEngine] = None):
         self.csv_file_path = csv_file_path
+        if engine is None:
+            from config.settings import STORAGE_BACKEND
+            engine = create_storage_engine(
+                STORAGE_BACKEND, csv_file_path, self.get_table_name(),
+                self.get_fieldnames(), self.get_id_field(), self.INDEX_FIELDS,
+            )
+        self.engine = engine
         self.ensure_file_exists()
-    
+
     def ensure_file_exists(self):
-        """CSV 파일이 없으면 생성"""
-        if not self.csv_file_path.exists():
-            # 디렉토리 생성
-            self.csv_file_path.parent.mkdir(parents=True, exist_ok=True)
-            # 빈 CSV 파일 생성 (헤더만)
-            with open(self.csv_file_path, 'w', newline='', encoding='utf-8') as f:
-                writer = csv.DictWriter(f, fieldnames=self.get_fieldnames())
-                writer.writeheader()
-    
+        """저장소(CSV 파일/테이블)가 없으면 생성"""
+        self.engine.ensure_storage()
+
+    def get_table_name(self) -> str:
+        """저장소 테이블 이름 (기본: CSV 파일명)"""
+        return Path(self.csv_file_path).stem
+
+    def get_id_field(self) -> str:
+        """기본 키 필드명"""
+        return 'id'
+
     @abstractmethod
     def get_fieldnames(self) -> List[str]:
         """CSV 파일의 컬럼명 리스트 반환"""
         pass
-    
+
     @abstractmethod
     def dict_to_model(self, data: Dict[str, Any]) -> T:
         """딕셔너리를 모델 객체로 변환"""
         pass
-    
+
     @abstractmethod
     def model_to_dict(self, model: T) -> Dict[str, Any]:
         """모델 객체를 딕셔너리로 변환"""
         pass
-    
+
+    def _rows_to_models(self, rows: List[Dict[str, Any]]) -> List[T]:
+        return [self.dict_to_model(row) for row in rows]
+
     def load_all(self) -> List[T]:
         """모든 데이터 로드"""
         try:
-            with open(self.csv_file_path, 'r', encoding='utf-8') as f:
-                reader = csv.DictReader(f)
-                return [self.dict_to_model(row) for row in reader]
+            return self._rows_to_models(self.engine.load_rows())
         except FileNotFoundError:
             return []
         except Exception as e:
             print(f"데이터 로드 오류: {e}")
             return []
-    
+
     def save_all(self, models: List[T]):
         """모든 데이터 저장"""
         try:
-            with open(self.csv_file_path, 'w', newline='', encoding='utf-8') as f:
-                writer = csv.DictWriter(f, fieldnames=self.get_fieldnames())
-                writer.writeheader()
-                for model in models:
-                    writer.writerow(self.model_to_dict(model))
+            self.engine.save_rows([self.model_to_dict(model) for model in models])
         except Exception as e:
             print(f"데이터 저장 오류: {e}")
-    
+
     def find_by_id(self, id_value: str, id_field: str = 'id') -> Optional[T]:
         """ID로 데이터 찾기"""
-        all_data = self.load_all()
-        for item in all_data:
-            if getattr(item, id_field) == id_value:
-                return item
-        return None
-    
+        try:
+            rows = self.engine.find_rows({id_field: to_storage_value(id_value)})
+        except Exception as e:
+            print(f"데이터 로드 오류: {e}")
+            return None
+        return self.dict_to_model(rows[0]) if rows else None
+
     def create(self, model: T) -> bool:
         """새 데이터 생성"""
         try:
-            all_data = self.load_all()
-            all_data.append(model)
-            self.save_all(all_data)
+            self.engine.insert_row(self.model_to_dict(model))
             return True
         except Exception as e:
             print(f"데이터 생성 오류: {e}")
             return False
-    
+
     def update(self, model: T, id_field: str = 'id') -> bool:
         """데이터 업데이트"""
         try:
-            all_data = self.load_all()
             id_value = getattr(model, id_field)
-            
-            for i, item in enumerate(all_data):
-                if getattr(item, id_field) == id_value:
-                    all_data[i] = model
-                    self.save_all(all_data)
-                    return True
-            return False  # 해당 ID 찾을 수 없음
+            return self.engine.update_row(
+                id_field, to_storage_value(id_value), self.model_to_dict(model)
+            )  # False: 해당 ID 찾을 수 없음
         except Exception as e:
             print(f"데이터 업데이트 오류: {e}")
             return False
-    
+
     def delete(self, id_value: str, id_field: str = 'id') -> bool:
         """데이터 삭제"""
         try:
-            all_data = self.load_all()
-            original_count = len(all_data)
-            
-            all_data = [item for item in all_data 
-                       if getattr(item, id_field) != id_value]
-            
-            if len(all_data) < original_count:
-                self.save_all(all_data)
-                return True
-            return False  # 해당 ID 찾을 수 없음
+            return self.engine.delete_row(id_field, to_storage_value(id_value))  # False: 해당 ID 찾을 수 없음
         except Exception as e:
             print(f"데이터 삭제 오류: {e}")
             return False
-    
+
     def count(self) -> int:
         """전체 데이터 개수"""
-        return len(self.load_all())
-    
+        try:
+            return self.engine.count()
+        except Exception as e:
+            print(f"데이터 로드 오류: {e}")
+            return 0
+
     def filter(self, **kwargs) -> List[T]:
-        """조건에 맞는 데이터 필터링"""
-        all_data = self.load_all()
+        """조건에 맞는 데이터 필터링
+        - 인덱스 필드 조건은 저장소 엔진에서 먼저 좁히고, 최종 일치 여부는 모델 값으로 확인
+        """
+        indexed = {
+            key: to_storage_value(value) for key, value in kwargs.items()
+            if key in self.engine.index_fields and isinstance(value, (str, int, bool))
+        }
+        try:
+            candidates = self._rows_to_models(self.engine.find_rows(indexed))
+        except Exception as e:
+            print(f"데이터 로드 오류: {e}")
+            return []
         result = []
-        
-        for item in all_data:
+
+        for item in candidates:
             match = True
             for key, value in kwargs.items():
                 if getattr(item, key, None) != value:
@@ -133,5 +141,5 @@ class BaseManager(ABC, Generic[T]):
                     break
             if match:
                 result.append(item)
-        
-        return result
\ No newline at end of file
+
+        return result
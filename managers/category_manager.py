@@ -10,9 +10,14 @@ from config.settings import CSV_FILES
 class CategoryManager(BaseManager[Category]):
     """카테고리 데이터 관리 클래스"""
     
+    INDEX_FIELDS = ('name', 'parent_id', 'is_active')
+    
     def __init__(self):
         super().__init__(CSV_FILES["categories"])
     
+    def get_id_field(self) -> str:
+        return 'category_id'
+    
     def get_fieldnames(self) -> List[str]:
         """CSV 파일의 컬럼명 리스트 반환"""
         return [
@@ -1,19 +1,41 @@
 """
 프롬프트 데이터 매니저
 """
+import threading
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, List, Optional
 from datetime import datetime
 from managers.base_manager import BaseManager
+from managers.sort_index import SortedKeyIndex, SortKey
 from models.prompt_card import PromptCard
 from config.settings import CSV_FILES
 
+def _created_ts(prompt: PromptCard) -> float:
+    return prompt.created_at.timestamp()
+
+
+# 게시 프롬프트 정렬 순서 (모두 내림차순, 동률이면 최신순)
+SORT_KEYS = {
+    "created_at": lambda p: (-_created_ts(p),),
+    "views": lambda p: (-p.views, -_created_ts(p)),
+    "likes": lambda p: (-p.likes, -_created_ts(p)),
+}
+
+
 class PromptManager(BaseManager[PromptCard]):
     """프롬프트 데이터 관리 클래스"""
     
+    INDEX_FIELDS = ('status', 'category_id', 'ai_model_key', 'user_id', 'tier')
+    
     def __init__(self):
+        self._sort_orders: Optional[Dict[str, SortedKeyIndex]] = None
+        self._sort_version = None
+        self._sort_lock = threading.RLock()
         super().__init__(CSV_FILES["prompts"])
     
+    def get_id_field(self) -> str:
+        return 'prompt_id'
+    
     def get_fieldnames(self) -> List[str]:
         """CSV 파일의 컬럼명 리스트 반환"""
         return [
@@ -53,20 +75,112 @@ class PromptManager(BaseManager[PromptCard]):
         """추천 프롬프트 조회"""
         return self.filter(tier="featured", status="published")
     
+    # === 정렬 순서 인덱스 (저장소 데이터 버전이 바뀌면 재구성, 매니저 쓰기는 증분 반영) ===
+    
+    def _get_sort_orders(self) -> Dict[str, SortedKeyIndex]:
+        with self._sort_lock:
+            version = self.engine.data_version()
+            if self._sort_orders is None or version != self._sort_version:
+                published = [(p.prompt_id, p) for p in self.get_published_prompts()]
+                orders = {}
+                for sort_by, key_func in SORT_KEYS.items():
+                    orders[sort_by] = SortedKeyIndex(key_func)
+                    orders[sort_by].rebuild(published)
+                self._sort_orders = orders
+                self._sort_version = version
+            return self._sort_orders
+    
+    def _apply_sort_change(self, prompt_id: str, prompt: Optional[PromptCard], version_before) -> None:
+        """쓰기 직전 인덱스가 최신이었다면 해당 프롬프트만 갱신, 아니면 다음 조회 때 재구성"""
+        with self._sort_lock:
+            if self._sort_orders is None or version_before != self._sort_version:
+                self._sort_orders = None
+                return
+            for order in self._sort_orders.values():
+                if prompt is not None and prompt.status == "published":
+                    order.upsert(prompt_id, prompt)
+                else:
+                    order.remove(prompt_id)
+            self._sort_version = self.engine.data_version()
+    
+    def create(self, model: PromptCard) -> bool:
+        with self._sort_lock:
+            version_before = self.engine.data_version()
+            ok = super().create(model)
+            if ok:
+                self._apply_sort_change(model.prompt_id, model, version_before)
+            return ok
+    
+    def update(self, model: PromptCard, id_field: str = 'id') -> bool:
+        with self._sort_lock:
+            version_before = self.engine.data_version()
+            ok = super().update(model, id_field)
+            if ok:
+                if id_field == 'prompt_id':
+                    self._apply_sort_change(model.prompt_id, model, version_before)
+                else:
+                    self._sort_orders = None
+            return ok
+    
+    def delete(self, id_value: str, id_field: str = 'id') -> bool:
+        with self._sort_lock:
+            version_before = self.engine.data_version()
+            ok = super().delete(id_value, id_field)
+            if ok:
+                if id_field == 'prompt_id':
+                    self._apply_sort_change(str(id_value), None, version_before)
+                else:
+                    self._sort_orders = None
+            return ok
+    
+    def _load_by_keys(self, keys: List[SortKey]) -> List[PromptCard]:
+        """정렬 키(마지막 요소 prompt_id) 순서대로 프롬프트 로드"""
+        prompts = []
+        for key in keys:
+            prompt = self.find_by_id(key[-1], "prompt_id")
+            if prompt is not None:
+                prompts.append(prompt)
+        return prompts
+    
+    def get_prompts_page(self, sort_by: str = "created_at", limit: int = 12,
+                         cursor: Optional[SortKey] = None) -> dict:
+        """커서 기반 페이지 조회 (sort_by: created_at, views, likes)
+        - cursor: 이전 페이지 결과의 next_cursor (없으면 첫 페이지)
+        """
+        if sort_by not in SORT_KEYS:
+            raise ValueError(f"지원하지 않는 정렬 기준: {sort_by}")
+        with self._sort_lock:
+            order = self._get_sort_orders()[sort_by]
+            keys = order.page(limit + 1, cursor)
+            total = len(order)
+        has_next = len(keys) > limit
+        keys = keys[:limit]
+        return {
+            "prompts": self._load_by_keys(keys),
+            "total": total,
+            "per_page": limit,
+            "sort_by": sort_by,
+            "next_cursor": keys[-1] if has_next else None,
+            "has_next": has_next,
+            "has_prev": cursor is not None,
+        }
+    
+    def _top_prompts(self, sort_by: str, limit: int) -> List[PromptCard]:
+        with self._sort_lock:
+            keys = self._get_sort_orders()[sort_by].top(limit)
+        return self._load_by_keys(keys)
+    
     def get_popular_prompts(self, limit: int = 10) -> List[PromptCard]:
         """인기 프롬프트 조회 (조회수 기준)"""
-        published_prompts = self.get_published_prompts()
-        return sorted(published_prompts, key=lambda p: p.views, reverse=True)[:limit]
+        return self._top_prompts("views", limit)
     
     def get_trending_prompts(self, limit: int = 10) -> List[PromptCard]:
         """트렌딩 프롬프트 조회 (좋아요 기준)"""
-        published_prompts = self.get_published_prompts()
-        return sorted(published_prompts, key=lambda p: p.likes, reverse=True)[:limit]
+        return self._top_prompts("likes", limit)
     
     def get_recent_prompts(self, limit: int = 10) -> List[PromptCard]:
         """최신 프롬프트 조회"""
-        published_prompts = self.get_published_prompts()
-        return sorted(published_prompts, key=lambda p: p.created_at, reverse=True)[:limit]
+        return self._top_prompts("created_at", limit)
     
     def search_prompts(self, query: str) -> List[PromptCard]:
         """프롬프트 검색 (제목, 설명, 태그에서 검색)"""
@@ -150,21 +264,23 @@ class PromptManager(BaseManager[PromptCard]):
         return False
     
     def get_prompts_with_pagination(self, page: int = 1, per_page: int = 12) -> dict:
-        """페이지네이션이 적용된 프롬프트 조회"""
-        all_prompts = self.get_published_prompts()
-        total = len(all_prompts)
-        
+        """페이지네이션이 적용된 프롬프트 조회 (최신순, 페이지 번호 방식)
+        - 정렬 인덱스에서 해당 구간만 잘라 로드 (연속 조회는 get_prompts_page 권장)
+        """
         start = (page - 1) * per_page
         end = start + per_page
         
-        prompts = sorted(all_prompts, key=lambda p: p.created_at, reverse=True)[start:end]
+        with self._sort_lock:
+            order = self._get_sort_orders()["created_at"]
+            keys = order.top(per_page, offset=start)
+            total = len(order)
         
         return {
-            "prompts": prompts,
+            "prompts": self._load_by_keys(keys),
             "total": total,
             "page": page,
             "per_page": per_page,
             "total_pages": (total + per_page - 1) // per_page,
             "has_next": end < total,
             "has_prev": page > 1
-        }
\ No newline at end of file
+        }
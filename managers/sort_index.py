@@ -0,0 +1,55 @@
+"""
+정렬 순서 인덱스 (keyset/cursor 페이지네이션용)
+
+정렬 키 튜플을 오름차순 배열로 유지하고, 커서(마지막으로 받은 키) 다음 위치를
+bisect 로 찾아 한 페이지를 O(log n + 페이지 크기)로 잘라낸다.
+내림차순 정렬은 키 함수에서 값을 음수로 바꿔 표현한다.
+"""
+from bisect import bisect_left, bisect_right, insort
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+SortKey = Tuple[Any, ...]
+
+
+class SortedKeyIndex:
+    """id -> 정렬 키, 정렬된 키 배열 (키 마지막 요소는 id 로 유일성 보장)"""
+
+    def __init__(self, key_func: Callable[[Any], SortKey]):
+        self._key_func = key_func
+        self._keys: List[SortKey] = []
+        self._key_of: Dict[str, SortKey] = {}
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def _make_key(self, item_id: str, item: Any) -> SortKey:
+        return tuple(self._key_func(item)) + (item_id,)
+
+    def rebuild(self, items: Iterable[Tuple[str, Any]]) -> None:
+        """(id, item) 목록으로 재구성"""
+        self._key_of = {item_id: self._make_key(item_id, item) for item_id, item in items}
+        self._keys = sorted(self._key_of.values())
+
+    def upsert(self, item_id: str, item: Any) -> None:
+        self.remove(item_id)
+        key = self._make_key(item_id, item)
+        self._key_of[item_id] = key
+        insort(self._keys, key)
+
+    def remove(self, item_id: str) -> None:
+        key = self._key_of.pop(item_id, None)
+        if key is None:
+            return
+        pos = bisect_left(self._keys, key)
+        if pos < len(self._keys) and self._keys[pos] == key:
+            del self._keys[pos]
+
+    def page(self, limit: int, cursor: Optional[SortKey] = None) -> List[SortKey]:
+        """cursor 다음부터 limit 개의 키 (cursor 없으면 처음부터)"""
+        start = 0 if cursor is None else bisect_right(self._keys, tuple(cursor))
+        return self._keys[start:start + max(0, limit)]
+
+    def top(self, limit: int, offset: int = 0) -> List[SortKey]:
+        """상위 offset 번째부터 limit 개의 키"""
+        offset = max(0, offset)
+        return self._keys[offset:offset + max(0, limit)]
@@ -0,0 +1,395 @@
+"""
+매니저용 저장소 엔진 (CSV / SQLite)
+"""
+import sqlite3
+import threading
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import List, Dict, Any, Optional, Sequence, Set
+
+from services.csv_utils import read_csv_rows, write_csv_rows, file_signature, file_lock
+
+
+def to_storage_value(value: Any) -> str:
+    """CSV에 기록되는 것과 같은 문자열 표현으로 변환"""
+    if value is None:
+        return ""
+    return str(value)
+
+
+class StorageEngine(ABC):
+    """행(dict) 단위 저장소 엔진 기본 클래스
+
+    모든 값은 CSV와 동일하게 문자열로 저장/조회한다.
+    """
+
+    def __init__(self, table_name: str, fieldnames: List[str], id_field: str,
+                 index_fields: Sequence[str] = ()):
+        self.table_name = table_name
+        self.fieldnames = list(fieldnames)
+        self.id_field = id_field
+        self.index_fields = [f for f in index_fields if f in self.fieldnames]
+
+    @abstractmethod
+    def ensure_storage(self):
+        """저장소(파일/테이블)가 없으면 생성"""
+        pass
+
+    @abstractmethod
+    def load_rows(self) -> List[Dict[str, str]]:
+        """모든 행 로드"""
+        pass
+
+    @abstractmethod
+    def save_rows(self, rows: List[Dict[str, Any]]):
+        """모든 행 교체 저장"""
+        pass
+
+    @abstractmethod
+    def find_rows(self, criteria: Dict[str, str]) -> List[Dict[str, str]]:
+        """필드=값 조건(AND)에 맞는 행 조회"""
+        pass
+
+    @abstractmethod
+    def insert_row(self, row: Dict[str, Any]):
+        """행 추가"""
+        pass
+
+    @abstractmethod
+    def update_row(self, field: str, value: str, row: Dict[str, Any]) -> bool:
+        """field=value 인 첫 행 교체"""
+        pass
+
+    @abstractmethod
+    def delete_row(self, field: str, value: str) -> bool:
+        """field=value 인 행 모두 삭제"""
+        pass
+
+    @abstractmethod
+    def count(self) -> int:
+        """전체 행 개수"""
+        pass
+
+    @abstractmethod
+    def data_version(self) -> Any:
+        """데이터가 바뀌면 달라지는 값 (파생 인덱스 무효화 판단용)"""
+        pass
+
+    def _normalize(self, row: Dict[str, Any]) -> Dict[str, str]:
+        return {f: to_storage_value(row.get(f)) for f in self.fieldnames}
+
+
+class CsvStorageEngine(StorageEngine):
+    """CSV 파일 저장소 (기존 동작)
+
+    로드한 행과 기본 키 해시 인덱스(id -> 행 위치)를 파일 시그니처 단위로 보관해
+    ID 조회/수정/삭제 시 전체 스캔을 피한다. index_fields 에는 값 -> 행 위치 집합
+    (posting set) 보조 인덱스를 만들고, 다중 조건은 집합 교집합으로 처리한다.
+    쓰기는 csv_utils.file_lock 안에서 파일을 다시 확인한 뒤 원자적으로 교체한다.
+    """
+
+    def __init__(self, csv_file_path: Path, table_name: str, fieldnames: List[str],
+                 id_field: str, index_fields: Sequence[str] = ()):
+        super().__init__(table_name, fieldnames, id_field, index_fields)
+        self.csv_file_path = csv_file_path
+        self._signature = None
+        self._rows: List[Dict[str, str]] = []
+        self._pk_index: Dict[str, int] = {}
+        self._has_duplicate_ids = False  # 예전 파일에 같은 ID 행이 여러 개 있는 경우
+        self._secondary: Dict[str, Dict[str, Set[int]]] = {}
+        self._lock = threading.RLock()
+
+    def ensure_storage(self):
+        if not self.csv_file_path.exists():
+            write_csv_rows(self.csv_file_path, [], self.fieldnames)
+
+    def _table(self) -> List[Dict[str, str]]:
+        """파일이 바뀌었을 때만 다시 읽고 인덱스 재구성"""
+        signature = file_signature(self.csv_file_path)
+        if signature is None:
+            self._set_rows([], None)
+        elif signature != self._signature:
+            self._set_rows(read_csv_rows(self.csv_file_path), signature)
+        return self._rows
+
+    def _set_rows(self, rows: List[Dict[str, str]], signature):
+        self._rows = rows
+        self._signature = signature
+        self._rebuild_indexes()
+
+    def _rebuild_indexes(self):
+        self._pk_index = {}
+        self._secondary = {f: {} for f in self.index_fields}
+        for pos, r in enumerate(self._rows):
+            self._pk_index.setdefault(r.get(self.id_field), pos)
+            self._index_row(pos, r)
+        self._has_duplicate_ids = len(self._pk_index) < len(self._rows)
+
+    def _index_row(self, pos: int, row: Dict[str, str]):
+        for f, postings in self._secondary.items():
+            postings.setdefault(row.get(f), set()).add(pos)
+
+    def _unindex_row(self, pos: int, row: Dict[str, str]):
+        for f, postings in self._secondary.items():
+            bucket = postings.get(row.get(f))
+            if bucket is not None:
+                bucket.discard(pos)
+                if not bucket:
+                    del postings[row.get(f)]
+
+    def _remove_position(self, pos: int):
+        """pos 행 삭제 후 뒤쪽 행 위치를 한 칸씩 당겨 인덱스를 증분 갱신 (행 순서 유지)"""
+        removed = self._rows.pop(pos)
+        self._unindex_row(pos, removed)
+        self._pk_index.pop(removed.get(self.id_field), None)
+        for key, p in self._pk_index.items():
+            if p > pos:
+                self._pk_index[key] = p - 1
+        for postings in self._secondary.values():
+            for value, bucket in postings.items():
+                if any(p > pos for p in bucket):
+                    postings[value] = {p - 1 if p > pos else p for p in bucket}
+
+    def _candidate_positions(self, criteria: Dict[str, str]) -> Optional[List[int]]:
+        """인덱스로 후보 행 위치 계산 (인덱스 조건이 없으면 None = 전체)"""
+        if self.id_field in criteria:
+            pos = self._pk_index.get(criteria[self.id_field])
+            return [pos] if pos is not None else []
+        postings = [self._secondary[f].get(v, set()) for f, v in criteria.items() if f in self._secondary]
+        if not postings:
+            return None
+        postings.sort(key=len)
+        matched = set(postings[0])
+        for other in postings[1:]:
+            matched &= other
+            if not matched:
+                break
+        return sorted(matched)
+
+    def _position(self, field: str, value: str) -> Optional[int]:
+        if field == self.id_field:
+            return self._pk_index.get(value)
+        for pos, r in enumerate(self._rows):
+            if r.get(field) == value:
+                return pos
+        return None
+
+    def _commit(self):
+        write_csv_rows(self.csv_file_path, self._rows, self.fieldnames)
+        self._signature = file_signature(self.csv_file_path)
+
+    def load_rows(self) -> List[Dict[str, str]]:
+        with self._lock:
+            return list(self._table())
+
+    def save_rows(self, rows: List[Dict[str, Any]]):
+        with self._lock, file_lock(self.csv_file_path):
+            self._rows = [self._normalize(r) for r in rows]
+            self._commit()
+            self._rebuild_indexes()
+
+    def find_rows(self, criteria: Dict[str, str]) -> List[Dict[str, str]]:
+        with self._lock:
+            rows = self._table()
+            positions = self._candidate_positions(criteria)
+            candidates = rows if positions is None else [rows[pos] for pos in positions]
+            return [r for r in candidates
+                    if all(r.get(k) == v for k, v in criteria.items())]
+
+    def insert_row(self, row: Dict[str, Any]):
+        with self._lock, file_lock(self.csv_file_path):
+            rows = self._table()
+            normalized = self._normalize(row)
+            if normalized.get(self.id_field) in self._pk_index:
+                # SqliteStorageEngine(PRIMARY KEY) 과 같이 중복 ID는 거부 (create() 는 False)
+                raise ValueError(f"중복 ID: {normalized.get(self.id_field)}")
+            rows.append(normalized)
+            self._pk_index[normalized.get(self.id_field)] = len(rows) - 1
+            self._index_row(len(rows) - 1, normalized)
+            self._commit()
+
+    def update_row(self, field: str, value: str, row: Dict[str, Any]) -> bool:
+        with self._lock, file_lock(self.csv_file_path):
+            self._table()
+            pos = self._position(field, value)
+            if pos is None:
+                return False
+            old_row = self._rows[pos]
+            self._rows[pos] = self._normalize(row)
+            if self._rows[pos].get(self.id_field) != old_row.get(self.id_field):
+                self._rebuild_indexes()
+            else:
+                self._unindex_row(pos, old_row)
+                self._index_row(pos, self._rows[pos])
+            self._commit()
+            return True
+
+    def delete_row(self, field: str, value: str) -> bool:
+        with self._lock, file_lock(self.csv_file_path):
+            rows = self._table()
+            if field == self.id_field and value not in self._pk_index:
+                return False
+            if field == self.id_field and not self._has_duplicate_ids:
+                self._remove_position(self._pk_index[value])
+                self._commit()
+                return True
+            remaining = [r for r in rows if r.get(field) != value]
+            if len(remaining) == len(rows):
+                return False
+            self._rows = remaining
+            self._commit()
+            self._rebuild_indexes()
+            return True
+
+    def count(self) -> int:
+        with self._lock:
+            return len(self._table())
+
+    def data_version(self):
+        with self._lock:
+            self._table()
+            return self._signature
+
+
+class SqliteStorageEngine(StorageEngine):
+    """내장 SQLite 저장소 (매니저별 테이블 + PK/보조 인덱스)"""
+
+    # 같은 DB 파일을 쓰는 엔진끼리 연결과 락을 공유
+    _connections: Dict[str, sqlite3.Connection] = {}
+    _locks: Dict[str, threading.RLock] = {}
+    _registry_lock = threading.Lock()
+
+    def __init__(self, db_path: Path, table_name: str, fieldnames: List[str],
+                 id_field: str, index_fields: Sequence[str] = ()):
+        super().__init__(table_name, fieldnames, id_field, index_fields)
+        self.db_path = Path(db_path)
+        key = str(self.db_path.resolve())
+        with SqliteStorageEngine._registry_lock:
+            if key not in SqliteStorageEngine._connections:
+                self.db_path.parent.mkdir(parents=True, exist_ok=True)
+                SqliteStorageEngine._connections[key] = sqlite3.connect(key, check_same_thread=False)
+                SqliteStorageEngine._locks[key] = threading.RLock()
+        self._conn = SqliteStorageEngine._connections[key]
+        self._lock = SqliteStorageEngine._locks[key]
+
+    def _q(self, name: str) -> str:
+        return '"' + name.replace('"', '""') + '"'
+
+    def ensure_storage(self):
+        columns = []
+        for f in self.fieldnames:
+            if f == self.id_field:
+                columns.append(f"{self._q(f)} TEXT PRIMARY KEY")
+            else:
+                columns.append(f"{self._q(f)} TEXT NOT NULL DEFAULT ''")
+        with self._lock, self._conn:
+            self._conn.execute(
+                f"CREATE TABLE IF NOT EXISTS {self._q(self.table_name)} ({', '.join(columns)})"
+            )
+            for f in self.index_fields:
+                if f == self.id_field:
+                    continue
+                index_name = f"idx_{self.table_name}_{f}"
+                self._conn.execute(
+                    f"CREATE INDEX IF NOT EXISTS {self._q(index_name)} "
+                    f"ON {self._q(self.table_name)} ({self._q(f)})"
+                )
+
+    def _select(self, where: str = "", params: Sequence[str] = ()) -> List[Dict[str, str]]:
+        cols = ", ".join(self._q(f) for f in self.fieldnames)
+        sql = f"SELECT {cols} FROM {self._q(self.table_name)} {where} ORDER BY rowid"
+        with self._lock:
+            cursor = self._conn.execute(sql, list(params))
+            return [dict(zip(self.fieldnames, values)) for values in cursor.fetchall()]
+
+    def load_rows(self) -> List[Dict[str, str]]:
+        return self._select()
+
+    def save_rows(self, rows: List[Dict[str, Any]]):
+        with self._lock, self._conn:
+            self._conn.execute(f"DELETE FROM {self._q(self.table_name)}")
+            self._insert_many(rows)
+
+    def _insert_many(self, rows: List[Dict[str, Any]]):
+        # 같은 ID가 이미 있으면 덮어쓰지 않고 sqlite3.IntegrityError (create() 는 False)
+        cols = ", ".join(self._q(f) for f in self.fieldnames)
+        marks = ", ".join("?" for _ in self.fieldnames)
+        self._conn.executemany(
+            f"INSERT INTO {self._q(self.table_name)} ({cols}) VALUES ({marks})",
+            [[self._normalize(r)[f] for f in self.fieldnames] for r in rows],
+        )
+
+    def find_rows(self, criteria: Dict[str, str]) -> List[Dict[str, str]]:
+        criteria = {k: v for k, v in criteria.items() if k in self.fieldnames}
+        if not criteria:
+            return self.load_rows()
+        where = "WHERE " + " AND ".join(f"{self._q(k)} = ?" for k in criteria)
+        return self._select(where, list(criteria.values()))
+
+    def insert_row(self, row: Dict[str, Any]):
+        with self._lock, self._conn:
+            self._insert_many([row])
+
+    def update_row(self, field: str, value: str, row: Dict[str, Any]) -> bool:
+        normalized = self._normalize(row)
+        assignments = ", ".join(f"{self._q(f)} = ?" for f in self.fieldnames)
+        with self._lock, self._conn:
+            cursor = self._conn.execute(
+                f"UPDATE {self._q(self.table_name)} SET {assignments} "
+                f"WHERE rowid = (SELECT rowid FROM {self._q(self.table_name)} "
+                f"WHERE {self._q(field)} = ? ORDER BY rowid LIMIT 1)",
+                [normalized[f] for f in self.fieldnames] + [value],
+            )
+            return cursor.rowcount > 0
+
+    def delete_row(self, field: str, value: str) -> bool:
+        with self._lock, self._conn:
+            cursor = self._conn.execute(
+                f"DELETE FROM {self._q(self.table_name)} WHERE {self._q(field)} = ?", [value]
+            )
+            return cursor.rowcount > 0
+
+    def count(self) -> int:
+        with self._lock:
+            return self._conn.execute(f"SELECT COUNT(*) FROM {self._q(self.table_name)}").fetchone()[0]
+
+    def data_version(self):
+        # data_version: 다른 연결의 커밋, total_changes: 이 연결의 변경
+        with self._lock:
+            external = self._conn.execute("PRAGMA data_version").fetchone()[0]
+            return (external, self._conn.total_changes)
+
+
+def create_storage_engine(backend: str, csv_file_path: Path, table_name: str,
+                          fieldnames: List[str], id_field: str,
+                          index_fields: Sequence[str] = ()) -> StorageEngine:
+    """설정값(backend)에 맞는 저장소 엔진 생성"""
+    if backend == "sqlite":
+        from config.settings import SQLITE_DB_PATH
+        return SqliteStorageEngine(SQLITE_DB_PATH, table_name, fieldnames, id_field, index_fields)
+    return CsvStorageEngine(csv_file_path, table_name, fieldnames, id_field, index_fields)
+
+
+def import_csv_to_sqlite(manager, db_path: Optional[Path] = None) -> int:
+    """매니저의 CSV 데이터를 SQLite 테이블로 일괄 이관. 반환: 이관된 행 수
+    - CSV에 같은 ID가 여러 번 있으면 아무것도 이관하지 않고 ValueError
+    """
+    from config.settings import SQLITE_DB_PATH
+    source = CsvStorageEngine(
+        manager.csv_file_path, manager.get_table_name(), manager.get_fieldnames(),
+        manager.get_id_field(), manager.INDEX_FIELDS,
+    )
+    target = SqliteStorageEngine(
+        db_path or SQLITE_DB_PATH, manager.get_table_name(), manager.get_fieldnames(),
+        manager.get_id_field(), manager.INDEX_FIELDS,
+    )
+    target.ensure_storage()
+    rows = source.load_rows() if manager.csv_file_path.exists() else []
+    seen, duplicates = set(), set()
+    for r in rows:
+        row_id = r.get(source.id_field)
+        (duplicates if row_id in seen else seen).add(row_id)
+    if duplicates:
+        raise ValueError(f"{manager.get_table_name()}: 중복 ID {sorted(duplicates)[:5]}")
+    target.save_rows(rows)
+    return target.count()
@@ -10,9 +10,14 @@ from config.settings import CSV_FILES
 class UserManager(BaseManager[User]):
     """사용자 데이터 관리 클래스"""
     
+    INDEX_FIELDS = ('email', 'username', 'status')
+    
     def __init__(self):
         super().__init__(CSV_FILES["users"])
     
+    def get_id_field(self) -> str:
+        return 'user_id'
+    
     def get_fieldnames(self) -> List[str]:
         """CSV 파일의 컬럼명 리스트 반환"""
         return [
@@ -25,10 +25,7 @@ class Comment:
 
     def is_reply(self) -> bool:
         """대댓글인지 확인"""
-        result = bool(self.parent_comment_id)
-        if result:
-            print(f"[DEBUG] 대댓글 확인: comment_id={self.comment_id}, parent_id={self.parent_comment_id}")
-        return result
+        return bool(self.parent_comment_id)
 
     def to_dict(self) -> dict:
         """딕셔너리로 변환"""
@@ -1,14 +1,21 @@
 import flet as ft
 from flet import Colors
-from typing import Dict
 
 from components.header import create_header
 from services.prompt_service import get_prompt_by_id
-from services.interactions_service import record_view, toggle_like, toggle_bookmark
-from services.comment_service import get_comments_by_prompt, add_comment, toggle_comment_like, organize_comments_tree
+from services.interactions_service import (
+    VIEW_RECORDED_SESSION_KEY, record_view, toggle_like, toggle_bookmark, get_interaction_states,
+)
+from services.comment_service import get_root_comments_page, get_replies, count_comments, add_comment, toggle_comment_like
 from services.auth_service import get_current_user
 from components.toast import show_toast
+from config.settings import PAGINATION
 from models.comment import Comment
+from utils.log_utils import get_logger
+
+logger = get_logger("prompt_detail")
+
+COMMENTS_PER_PAGE = PAGINATION["comments_per_page"]
 
 
 
@@ -21,37 +28,38 @@ def build_prompt_detail_view(page: ft.Page, prompt_id: str) -> ft.View:
     user_id = current_user.get("user_id") if current_user else ""
     username = current_user.get("username") if current_user else ""
 
-    # 조회수 증가: 상세 페이지 진입 시 기록 + 디버그 출력
+    # 조회수 증가: 상세 페이지 진입 시 기록 (카드 클릭은 포인트 소비 커밋에서 이미 기록)
     try:
-        new_views = record_view(user_id, prompt_id)
-        print(f"[DEBUG] detail enter: id={prompt_id}, views={new_views}")
-    except Exception as ex:
-        print(f"[DEBUG] record_view error: {ex}")
+        if page.session.get(VIEW_RECORDED_SESSION_KEY) == str(prompt_id):
+            page.session.remove(VIEW_RECORDED_SESSION_KEY)
+            logger.debug("detail enter: id=%s, view recorded with quota", prompt_id)
+        else:
+            new_views = record_view(user_id, prompt_id)
+            logger.debug("detail enter: id=%s, views=%s", prompt_id, new_views)
+    except Exception:
+        logger.exception("record_view error: prompt_id=%s", prompt_id)
 
     # 갱신된 데이터 재조회
     prompt = get_prompt_by_id(prompt_id) or {}
     if not prompt:
         return ft.View(route=f"/prompt/{prompt_id}", controls=[header, ft.Container(content=ft.Text("프롬프트를 찾을 수 없습니다."), padding=20)])
 
-    # 댓글 데이터 로드
-    comments = get_comments_by_prompt(prompt_id)
-    comment_tree = organize_comments_tree(comments)
-
-    # 좋아요/북마크 상태 (간단 구현)
+    # 좋아요/북마크 수와 현재 사용자의 상태 (상태 인덱스 조회)
     likes_count = int(prompt.get("likes", 0))
     bookmarks_count = int(prompt.get("bookmarks", 0))
+    interaction_state = get_interaction_states(user_id, [prompt_id])[prompt_id]
 
     def handle_like(e):
         if not current_user:
             show_toast(page, "로그인이 필요합니다.", 3000)
             return
         try:
-            new_count = toggle_like(user_id, prompt_id)
-            likes_text.value = f"❤️ {new_count}"
+            liked, new_count = toggle_like(user_id, prompt_id)
+            likes_text.value = f"{_like_icon(liked)} {new_count}"
             likes_text.update()
             show_toast(page, "좋아요가 반영되었습니다.", 2000)
-        except Exception as ex:
-            print(f"[DEBUG] like error: {ex}")
+        except Exception:
+            logger.exception("like error: prompt_id=%s", prompt_id)
             show_toast(page, "오류가 발생했습니다.", 2000)
 
     def handle_bookmark(e):
@@ -59,12 +67,13 @@ def build_prompt_detail_view(page: ft.Page, prompt_id: str) -> ft.View:
             show_toast(page, "로그인이 필요합니다.", 3000)
             return
         try:
-            new_count = toggle_bookmark(user_id, prompt_id)
+            bookmarked, new_count = toggle_bookmark(user_id, prompt_id)
             bookmark_text.value = f"🔖 {new_count}"
+            bookmark_text.weight = ft.FontWeight.BOLD if bookmarked else None
             bookmark_text.update()
             show_toast(page, "북마크가 반영되었습니다.", 2000)
-        except Exception as ex:
-            print(f"[DEBUG] bookmark error: {ex}")
+        except Exception:
+            logger.exception("bookmark error: prompt_id=%s", prompt_id)
             show_toast(page, "오류가 발생했습니다.", 2000)
 
     # 댓글 작성
@@ -77,48 +86,39 @@ def build_prompt_detail_view(page: ft.Page, prompt_id: str) -> ft.View:
         width=600
     )
 
-    def refresh_comments():
-        """댓글 목록을 다시 로드하여 UI 업데이트"""
+    # 댓글 목록 상태: 최상위 댓글을 페이지 단위로 붙이고, 새 댓글은 맨 앞에 끼워 넣는다
+    comments_state = {"offset": 0, "total_roots": 0, "count": count_comments(prompt_id)}
+
+    def _bump_comments_count(delta: int):
+        comments_state["count"] += delta
+        comments_count_text.value = f"💬 {comments_state['count']}"
+
+    def on_reply_added():
+        _bump_comments_count(1)
+        comments_count_text.update()
+
+    def _update_more_button():
+        remaining = comments_state["total_roots"] - comments_state["offset"]
+        more_comments_button.visible = remaining > 0
+        more_comments_button.text = f"댓글 더 보기 ({remaining}개 남음)"
+        empty_comments_text.visible = comments_state["total_roots"] == 0
+
+    def load_more_comments(e=None):
+        """다음 페이지의 최상위 댓글만 추가 (이미 그린 댓글은 유지)"""
         try:
-            print(f"[DEBUG] refresh_comments 시작")
-            
-            # 새로운 댓글 목록 로드
-            fresh_comments = get_comments_by_prompt(prompt_id)
-            fresh_tree = organize_comments_tree(fresh_comments)
-            print(f"[DEBUG] 새로운 댓글 로드 완료: {len(fresh_comments)}개")
-            
-            # 댓글 수 업데이트
-            comments_count_text.value = f"💬 {len(fresh_comments)}"
-            comments_count_text.update()
-            print(f"[DEBUG] 댓글 수 텍스트 업데이트: {len(fresh_comments)}개")
-            
-            # 기존 댓글 목록 완전 제거 (인덱스 5부터)
-            comment_list_start = 5
-            original_length = len(comments_section.controls)
-            while len(comments_section.controls) > comment_list_start:
-                comments_section.controls.pop()
-            
-            print(f"[DEBUG] 댓글 UI 정리: {original_length} -> {len(comments_section.controls)}")
-            
-            # 새 댓글 UI 생성 및 추가
-            if fresh_comments:
-                for comment in fresh_tree["root_comments"]:
-                    comment_ui = _create_comment_ui(comment, fresh_tree["replies_by_parent"], current_user, prompt_id, page, refresh_comments)
-                    comments_section.controls.append(comment_ui)
-                    comments_section.controls.append(ft.Container(height=8))
-                    print(f"[DEBUG] 댓글 UI 추가: {comment.content[:30]}...")
-            else:
-                comments_section.controls.append(ft.Text("아직 댓글이 없습니다.", size=14, color=Colors.GREY_500))
-                print(f"[DEBUG] '댓글 없음' 메시지 추가")
-            
-            # UI 업데이트
-            comments_section.update()
-            print(f"[DEBUG] 댓글 섹션 업데이트 완료: 총 {len(comments_section.controls)}개 컨트롤")
-            
-        except Exception as ex:
-            print(f"[DEBUG] 댓글 새로고침 오류: {ex}")
-            import traceback
-            traceback.print_exc()
+            page_data = get_root_comments_page(prompt_id, COMMENTS_PER_PAGE, comments_state["offset"])
+            for comment in page_data["root_comments"]:
+                comments_list.controls.append(_create_comment_ui(
+                    comment, page_data["reply_counts"].get(comment.comment_id, 0),
+                    current_user, prompt_id, page, on_reply_added,
+                ))
+            comments_state["offset"] += len(page_data["root_comments"])
+            comments_state["total_roots"] = page_data["total_roots"]
+            _update_more_button()
+            if e is not None:
+                comments_section.update()
+        except Exception:
+            logger.exception("댓글 페이지 로드 오류: prompt_id=%s", prompt_id)
 
     def submit_comment(e):
         current_user = get_current_user(page)
@@ -132,21 +132,11 @@ def build_prompt_detail_view(page: ft.Page, prompt_id: str) -> ft.View:
             return
         
         try:
-            print(f"[DEBUG] 댓글 등록 시도: prompt_id={prompt_id}, user_id={user_id}, username={username}")
-            print(f"[DEBUG] 댓글 내용: '{content}'")
-            
             new_comment = add_comment(prompt_id, user_id, username, content)
-            print(f"[DEBUG] add_comment 반환값: {new_comment}")
-            
-            # 저장 후 바로 조회해서 확인
-            fresh_comments = get_comments_by_prompt(prompt_id)
-            print(f"[DEBUG] 저장 후 댓글 조회 결과: {len(fresh_comments)}개")
-            for i, c in enumerate(fresh_comments[-3:]):  # 최근 3개만
-                print(f"[DEBUG] 댓글 {i}: {c.content[:50]}...")
+            logger.debug("댓글 등록: comment_id=%s, prompt_id=%s", new_comment.comment_id, prompt_id)
             
             comment_input.value = ""
             comment_input.update()
-            print(f"[DEBUG] 댓글 등록 성공: {new_comment.comment_id}")
             
             # 댓글 작성 포인트 지급 (토스트 없이)
             from services.points_service import add_points
@@ -156,20 +146,27 @@ def build_prompt_detail_view(page: ft.Page, prompt_id: str) -> ft.View:
             # 댓글 등록 완료 토스트 (포인트 정보 포함)
             show_toast(page, "댓글이 작성되었습니다. 포인트 +3개 획득!", 2000)
             
-            # 댓글 섹션만 동적 업데이트 (페이지 새로고침 X)
-            print(f"[DEBUG] 댓글 섹션 업데이트 시작")
-            refresh_comments()
+            # 새 댓글만 목록 맨 앞에 추가 (최신순). 저장소 목록도 앞에 하나 늘었으므로
+            # 다음 페이지 offset 을 함께 올려 중복 없이 이어서 불러온다
+            comments_list.controls.insert(0, _create_comment_ui(new_comment, 0, current_user, prompt_id, page, on_reply_added))
+            comments_state["offset"] += 1
+            comments_state["total_roots"] += 1
+            _bump_comments_count(1)
+            _update_more_button()
+            comments_section.update()
+            comments_count_text.update()
             
-        except Exception as ex:
-            print(f"[DEBUG] comment add error: {ex}")
-            import traceback
-            traceback.print_exc()
+        except Exception:
+            logger.exception("comment add error: prompt_id=%s", prompt_id)
             show_toast(page, "댓글 등록 중 오류가 발생했습니다.", 2000)
 
     # UI 요소들
-    likes_text = ft.Text(f"❤️ {likes_count}", size=14)
-    bookmark_text = ft.Text(f"🔖 {bookmarks_count}", size=14)
-    comments_count_text = ft.Text(f"💬 {len(comments)}", size=14, color=Colors.GREY_600)
+    likes_text = ft.Text(f"{_like_icon(interaction_state['like'])} {likes_count}", size=14)
+    bookmark_text = ft.Text(
+        f"🔖 {bookmarks_count}", size=14,
+        weight=ft.FontWeight.BOLD if interaction_state["bookmark"] else None,
+    )
+    comments_count_text = ft.Text(f"💬 {comments_state['count']}", size=14, color=Colors.GREY_600)
 
 
 
@@ -218,6 +215,9 @@ def build_prompt_detail_view(page: ft.Page, prompt_id: str) -> ft.View:
     ])
 
     # 댓글 섹션
+    comments_list = ft.Column([], spacing=8)
+    empty_comments_text = ft.Text("아직 댓글이 없습니다.", size=14, color=Colors.GREY_500, visible=False)
+    more_comments_button = ft.TextButton("댓글 더 보기", visible=False, on_click=load_more_comments)
     comments_section = ft.Column([
         ft.Container(height=24),
         ft.Text("💬 댓글", size=18, weight=ft.FontWeight.BOLD),
@@ -234,18 +234,13 @@ def build_prompt_detail_view(page: ft.Page, prompt_id: str) -> ft.View:
             )
         ], tight=True),
         ft.Container(height=16),
+        empty_comments_text,
+        comments_list,
+        more_comments_button,
     ])
 
-    # 댓글 목록 생성
-    comment_controls = []
-    for comment in comment_tree["root_comments"]:
-        comment_controls.append(_create_comment_ui(comment, comment_tree["replies_by_parent"], current_user, prompt_id, page, refresh_comments))
-        comment_controls.append(ft.Container(height=8))
-
-    if comment_controls:
-        comments_section.controls.extend(comment_controls)
-    else:
-        comments_section.controls.append(ft.Text("아직 댓글이 없습니다.", size=14, color=Colors.GREY_500))
+    # 댓글 목록 (첫 페이지만 그리고 나머지는 "더 보기"로 이어서 로드)
+    load_more_comments()
 
     # 전체 본문
     body = ft.Column([
@@ -267,9 +262,10 @@ def build_prompt_detail_view(page: ft.Page, prompt_id: str) -> ft.View:
     )
 
 
-def _create_comment_ui(comment: Comment, replies_by_parent: Dict, current_user: dict, prompt_id: str, page: ft.Page, refresh_comments_func=None) -> ft.Container:
-    """댓글 UI 생성"""
+def _create_comment_ui(comment: Comment, reply_count: int, current_user: dict, prompt_id: str, page: ft.Page, on_reply_added=None) -> ft.Column:
+    """댓글 UI 생성 (대댓글은 "답글 보기"를 누를 때 불러온다)"""
     user_id = current_user.get("user_id") if current_user else ""
+    replies_state = {"count": reply_count, "expanded": False}
     
     def handle_comment_like(e):
         if not current_user:
@@ -279,8 +275,8 @@ def _create_comment_ui(comment: Comment, replies_by_parent: Dict, current_user:
             new_count = toggle_comment_like(comment.comment_id, user_id)
             comment_like_text.value = f"❤️ {new_count}"
             comment_like_text.update()
-        except Exception as ex:
-            print(f"[DEBUG] comment like error: {ex}")
+        except Exception:
+            logger.exception("comment like error: comment_id=%s", comment.comment_id)
 
     def handle_reply(e):
         if not current_user:
@@ -293,6 +289,26 @@ def _create_comment_ui(comment: Comment, replies_by_parent: Dict, current_user:
             reply_input.visible = True
         reply_input.update()
 
+    def _update_toggle_button():
+        toggle_replies_button.visible = replies_state["count"] > 0
+        if replies_state["expanded"]:
+            toggle_replies_button.text = "답글 숨기기"
+        else:
+            toggle_replies_button.text = f"답글 {replies_state['count']}개 보기"
+
+    def toggle_replies(e):
+        """대댓글 펼치기/접기 (처음 펼칠 때만 조회해서 그린다)"""
+        if not replies_state["expanded"] and not replies_column.controls:
+            try:
+                replies_column.controls = [_create_reply_ui(r) for r in get_replies(prompt_id, comment.comment_id)]
+            except Exception:
+                logger.exception("대댓글 로드 오류: comment_id=%s", comment.comment_id)
+                return
+        replies_state["expanded"] = not replies_state["expanded"]
+        replies_column.visible = replies_state["expanded"]
+        _update_toggle_button()
+        comment_column.update()
+
     def submit_reply(e):
         content = reply_field.value.strip()
         if not content:
@@ -300,28 +316,25 @@ def _create_comment_ui(comment: Comment, replies_by_parent: Dict, current_user:
             return
         
         try:
-            print(f"[DEBUG] 대댓글 등록 시도: parent_id={comment.comment_id}, content='{content}'")
             new_reply = add_comment(prompt_id, user_id, current_user.get("username", ""), content, comment.comment_id)
-            print(f"[DEBUG] 대댓글 등록 성공: {new_reply.comment_id}")
+            logger.debug("대댓글 등록: comment_id=%s, parent_id=%s", new_reply.comment_id, comment.comment_id)
             
             reply_field.value = ""
             reply_input.visible = False
-            reply_input.update()
             show_toast(page, "대댓글이 등록되었습니다.", 2000)
             
-            # 댓글 섹션 업데이트 (refresh_comments 함수 사용)
-            print(f"[DEBUG] 대댓글 후 댓글 섹션 업데이트")
-            if refresh_comments_func:
-                refresh_comments_func()
-            else:
-                # 폴백: 페이지 새로고침
-                print(f"[DEBUG] refresh_comments_func 없음, 페이지 새로고침")
-                page.go(f"/prompt/{prompt_id}")
+            # 새 대댓글만 반영: 펼쳐져 있으면 맨 앞에 추가, 접혀 있으면 개수만 갱신
+            # (아직 한 번도 펼치지 않았다면 펼칠 때 새 대댓글까지 함께 조회된다)
+            replies_state["count"] += 1
+            if replies_column.controls:
+                replies_column.controls.insert(0, _create_reply_ui(new_reply))
+            _update_toggle_button()
+            comment_column.update()
+            if on_reply_added:
+                on_reply_added()
             
-        except Exception as ex:
-            print(f"[DEBUG] reply add error: {ex}")
-            import traceback
-            traceback.print_exc()
+        except Exception:
+            logger.exception("reply add error: parent_id=%s", comment.comment_id)
             show_toast(page, "대댓글 등록 중 오류가 발생했습니다.", 2000)
 
     comment_like_text = ft.Text(f"❤️ {comment.likes}", size=12)
@@ -345,6 +358,10 @@ def _create_comment_ui(comment: Comment, replies_by_parent: Dict, current_user:
         margin=ft.margin.only(top=8, left=20)
     )
 
+    toggle_replies_button = ft.TextButton(on_click=toggle_replies)
+    replies_column = ft.Column([], spacing=0, visible=False)
+    _update_toggle_button()
+
     # 댓글 본문
     comment_body = ft.Container(
         content=ft.Column([
@@ -362,6 +379,7 @@ def _create_comment_ui(comment: Comment, replies_by_parent: Dict, current_user:
                     on_click=handle_comment_like
                 ),
                 ft.TextButton("💬 답글", on_click=handle_reply),
+                toggle_replies_button,
             ], tight=True),
             reply_input,
         ]),
@@ -371,37 +389,40 @@ def _create_comment_ui(comment: Comment, replies_by_parent: Dict, current_user:
         border=ft.border.all(1, Colors.GREY_200)
     )
 
-    # 대댓글들 추가
-    reply_controls = []
-    replies = replies_by_parent.get(comment.comment_id, [])
-    for reply in replies:
-        reply_ui = ft.Container(
-            content=ft.Column([
-                ft.Row([
-                    ft.Text(f"👤 {reply.username}", size=11, weight=ft.FontWeight.BOLD, color=Colors.GREEN_600),
-                    ft.Container(expand=True),
-                    ft.Text(_format_time(reply.created_at), size=9, color=Colors.GREY_500),
-                ], tight=True),
-                ft.Container(height=2),
-                ft.Text(reply.content, size=13),
-                ft.Container(height=4),
-                ft.Row([
-                    ft.Text(f"❤️ {reply.likes}", size=11, color=Colors.GREY_600),
-                ], tight=True),
-            ]),
-            bgcolor=Colors.GREEN_50,
-            border_radius=6,
-            padding=10,
-            border=ft.border.all(1, Colors.GREEN_200),
-            margin=ft.margin.only(left=20, top=4)
-        )
-        reply_controls.append(reply_ui)
-
-    # 댓글 + 대댓글들을 포함한 전체 컨테이너
-    return ft.Column([
+    # 댓글 + 대댓글 영역을 포함한 전체 컨테이너
+    comment_column = ft.Column([
         comment_body,
-        *reply_controls
+        replies_column,
     ])
+    return comment_column
+
+
+def _create_reply_ui(reply: Comment) -> ft.Container:
+    """대댓글 UI 생성"""
+    return ft.Container(
+        content=ft.Column([
+            ft.Row([
+                ft.Text(f"👤 {reply.username}", size=11, weight=ft.FontWeight.BOLD, color=Colors.GREEN_600),
+                ft.Container(expand=True),
+                ft.Text(_format_time(reply.created_at), size=9, color=Colors.GREY_500),
+            ], tight=True),
+            ft.Container(height=2),
+            ft.Text(reply.content, size=13),
+            ft.Container(height=4),
+            ft.Row([
+                ft.Text(f"❤️ {reply.likes}", size=11, color=Colors.GREY_600),
+            ], tight=True),
+        ]),
+        bgcolor=Colors.GREEN_50,
+        border_radius=6,
+        padding=10,
+        border=ft.border.all(1, Colors.GREEN_200),
+        margin=ft.margin.only(left=20, top=4)
+    )
+
+
+def _like_icon(liked: bool) -> str:
+    return "❤️" if liked else "🤍"
 
 
 def _format_time(timestamp: float) -> str:
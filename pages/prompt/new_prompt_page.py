@@ -90,20 +90,11 @@ def build_prompt_new_view(page: ft.Page) -> ft.View:
         
         # 작성 완료 토스트 (포인트 정보 포함)
         show_toast(page, "프롬프트가 작성되었습니다. 포인트 +50개 획득!", 2000)
-        # 홈으로 이동 후 목록을 강제 갱신
+        # 홈으로 이동 (홈 뷰는 라우트 변경 시 새 목록으로 구성됨)
         try:
             page.go("/")
         except Exception:
             pass
-        try:
-            # 현재 뷰가 홈이면 재로딩 수행
-            for ctrl in page.views[-1].controls:
-                if isinstance(ctrl, ft.Container) and isinstance(ctrl.content, ft.Column):
-                    from app import load_prompt_cards
-                    load_prompt_cards(ctrl.content, page)
-                    break
-        except Exception:
-            pass
 
     form = ft.Column([
         ft.Text("새 프롬프트 작성", size=20, weight=ft.FontWeight.BOLD),
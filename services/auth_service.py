@@ -5,8 +5,7 @@ import time
 from pathlib import Path
 from typing import Dict, List, Optional
 
-from .csv_utils import read_csv_rows, write_csv_rows
-from .user_service import ensure_users_schema
+from .csv_utils import read_csv_rows, write_csv_rows, file_lock
 
 
 BASE_DIR = Path(__file__).resolve().parent.parent
@@ -79,7 +78,6 @@ def find_user_by_username(username: str) -> Optional[Dict[str, str]]:
 
 
 def register_user(username: str, password: str) -> Dict[str, str]:
-    ensure_users_schema()
     username = (username or "").strip()
     password = (password or "").strip()
     if len(username) < 3:
@@ -100,16 +98,19 @@ def register_user(username: str, password: str) -> Dict[str, str]:
             "points": "100",
             "level": "1",
         }
-        users = _load_users()
-        users.append(user_row)
-        _save_users(users)
+        # 중복 확인부터 저장까지 한 락 안에서 (동시 가입 시 같은 아이디 중복 방지)
+        with file_lock(USERS_CSV_PATH):
+            if find_user_by_username(username):
+                return {"ok": False, "msg": "이미 존재하는 아이디입니다."}
+            users = _load_users()
+            users.append(user_row)
+            _save_users(users)
         return {"ok": True, "msg": "회원가입이 완료되었습니다."}
     except Exception as ex:
         return {"ok": False, "msg": f"회원가입 중 오류: {ex} (경로: {USERS_CSV_PATH})"}
 
 
 def authenticate_user(username: str, password: str) -> Dict[str, str]:
-    ensure_users_schema()
     u = find_user_by_username(username)
     if not u:
         return {"ok": False, "msg": "존재하지 않는 아이디입니다."}
@@ -1,9 +1,14 @@
 import uuid
 import time
+import threading
 from pathlib import Path
 from typing import List, Optional, Dict
 from models.comment import Comment
-from services.csv_utils import read_csv_rows, write_csv_rows, ensure_fields_exist
+from services.csv_utils import read_csv_rows, write_csv_rows, ensure_fields_exist, file_signature
+from services.write_queue import WriteBatch, get_write_queue
+from utils.log_utils import get_logger
+
+logger = get_logger("comment_service")
 
 
 # CSV 파일 경로
@@ -17,7 +22,7 @@ COMMENT_FIELDS = [
 
 
 def ensure_comments_schema():
-    """comments.csv 파일과 스키마 확인"""
+    """comments.csv 파일과 스키마 확인 (services.migrations 에서 한 번만 실행)"""
     if not CSV_PATH.exists():
         # 빈 파일 생성
         write_csv_rows(CSV_PATH, [], COMMENT_FIELDS)
@@ -28,62 +33,113 @@ def ensure_comments_schema():
         write_csv_rows(CSV_PATH, rows, COMMENT_FIELDS)
 
 
+# 댓글 저장소 인덱스 (comments.csv 시그니처가 바뀐 경우에만 재구성, 읽기 전용)
+# - _by_id: comment_id -> Comment (모든 상태)
+# - _by_prompt: prompt_id -> 활성 댓글 목록 (최신순)
+# - _trees: prompt_id -> organize_comments_tree 결과 (조회 시 계산 후 보관)
+_by_id: Dict[str, Comment] = {}
+_by_prompt: Dict[str, List[Comment]] = {}
+_trees: Dict[str, Dict] = {}
+_store_signature = None
+_store_lock = threading.RLock()
+
+
+def _comment_store() -> Dict[str, List[Comment]]:
+    """prompt_id -> 활성 댓글 목록 (파일이 바뀌었을 때만 재구성)"""
+    global _by_id, _by_prompt, _trees, _store_signature
+    signature = file_signature(CSV_PATH)
+    with _store_lock:
+        if signature != _store_signature:
+            by_id: Dict[str, Comment] = {}
+            by_prompt: Dict[str, List[Comment]] = {}
+            for row in read_csv_rows(CSV_PATH) if signature else []:
+                try:
+                    comment = Comment.from_dict(row)
+                except Exception as e:
+                    logger.warning("comment parse error: %s", e)
+                    continue
+                by_id.setdefault(comment.comment_id, comment)
+                if comment.status == "active":
+                    by_prompt.setdefault(comment.prompt_id, []).append(comment)
+            for comments in by_prompt.values():
+                # 생성 시간순 정렬 (최신순)
+                comments.sort(key=lambda c: c.created_at, reverse=True)
+            _by_id, _by_prompt, _trees = by_id, by_prompt, {}
+            _store_signature = signature
+            logger.debug("댓글 인덱스 재구성: %d개 댓글, %d개 프롬프트", len(by_id), len(by_prompt))
+        return _by_prompt
+
+
+def _add_to_store(comment: Comment, signature_before, signature_after) -> None:
+    """기록 직전 인덱스가 최신이었다면 새 댓글만 반영, 아니면 다음 조회 때 재구성
+    - 같은 배치의 앞선 댓글이 이미 signature_after 로 올려 두었어도 이어서 반영
+    """
+    global _store_signature
+    with _store_lock:
+        if _store_signature is None or _store_signature not in (signature_before, signature_after):
+            return
+        if comment.comment_id in _by_id:
+            # 기록 후 다른 조회가 파일로 재구성하며 이미 포함한 경우
+            return
+        _by_id[comment.comment_id] = comment
+        if comment.status == "active":
+            # 새 댓글이 가장 최신이므로 맨 앞에 추가
+            _by_prompt.setdefault(comment.prompt_id, []).insert(0, comment)
+            _trees.pop(comment.prompt_id, None)
+        _store_signature = signature_after
+
+
 def get_comments_by_prompt(prompt_id: str) -> List[Comment]:
-    """특정 프롬프트의 댓글 목록 조회"""
-    print(f"[DEBUG] 댓글 조회 시작: prompt_id={prompt_id}")
-    
-    ensure_comments_schema()
-    
-    if not CSV_PATH.exists():
-        print(f"[DEBUG] 댓글 CSV 파일 없음: {CSV_PATH}")
-        return []
-    
-    rows = read_csv_rows(CSV_PATH)
-    print(f"[DEBUG] 전체 댓글 수: {len(rows)}")
-    
-    comments = []
-    
-    for row in rows:
-        row_prompt_id = row.get("prompt_id", "")
-        row_status = row.get("status", "active")
-        print(f"[DEBUG] 댓글 체크: prompt_id={row_prompt_id}, status={row_status}, content={row.get('content', '')[:30]}...")
-        
-        if row_prompt_id == prompt_id and row_status == "active":
-            try:
-                comment = Comment.from_dict(row)
-                comments.append(comment)
-                print(f"[DEBUG] 댓글 추가됨: {comment.comment_id}")
-            except Exception as e:
-                print(f"[DEBUG] comment parse error: {e}")
-                continue
-    
-    print(f"[DEBUG] 해당 프롬프트 댓글 수: {len(comments)}")
-    
-    # 생성 시간순 정렬 (최신순)
-    comments.sort(key=lambda c: c.created_at, reverse=True)
+    """특정 프롬프트의 댓글 목록 조회 (최신순, 반환된 Comment 는 읽기 전용)"""
+    comments = list(_comment_store().get(prompt_id, []))
+    logger.debug("댓글 조회: prompt_id=%s, %d개", prompt_id, len(comments))
     return comments
 
 
+def get_comment_tree(prompt_id: str) -> Dict:
+    """특정 프롬프트의 댓글 트리 (organize_comments_tree 결과를 캐시)"""
+    with _store_lock:
+        comments = _comment_store().get(prompt_id, [])
+        tree = _trees.get(prompt_id)
+        if tree is None:
+            tree = organize_comments_tree(comments)
+            _trees[prompt_id] = tree
+        return tree
+
+
+def get_root_comments_page(prompt_id: str, limit: int, offset: int = 0) -> Dict:
+    """최상위 댓글 한 페이지 (최신순) + 각 댓글의 대댓글 수 + 전체 최상위 댓글 수"""
+    tree = get_comment_tree(prompt_id)
+    roots = tree["root_comments"]
+    offset = max(0, offset)
+    page_comments = roots[offset:offset + max(0, limit)]
+    replies_by_parent = tree["replies_by_parent"]
+    return {
+        "root_comments": page_comments,
+        "reply_counts": {c.comment_id: len(replies_by_parent.get(c.comment_id, [])) for c in page_comments},
+        "total_roots": len(roots),
+    }
+
+
+def get_replies(prompt_id: str, parent_comment_id: str) -> List[Comment]:
+    """특정 댓글의 대댓글 목록 (최신순, 펼칠 때만 조회)"""
+    return list(get_comment_tree(prompt_id)["replies_by_parent"].get(parent_comment_id, []))
+
+
+def count_comments(prompt_id: str) -> int:
+    """특정 프롬프트의 활성 댓글 수 (대댓글 포함)"""
+    return len(_comment_store().get(prompt_id, []))
+
+
 def get_comment_by_id(comment_id: str) -> Optional[Comment]:
     """댓글 ID로 댓글 조회"""
-    ensure_comments_schema()
-    
-    rows = read_csv_rows(CSV_PATH)
-    for row in rows:
-        if row.get("comment_id") == comment_id:
-            try:
-                return Comment.from_dict(row)
-            except Exception:
-                continue
-    return None
+    with _store_lock:
+        _comment_store()
+        return _by_id.get(comment_id)
 
 
 def add_comment(prompt_id: str, user_id: str, username: str, content: str, parent_comment_id: Optional[str] = None) -> Comment:
     """새 댓글 추가"""
-    print(f"[DEBUG] 댓글 추가 시작: prompt_id={prompt_id}, user_id={user_id}, content={content[:50]}...")
-    
-    ensure_comments_schema()
-    
     # 새 댓글 생성
     comment = Comment(
         comment_id=str(uuid.uuid4()).replace("-", ""),
@@ -94,66 +150,60 @@ def add_comment(prompt_id: str, user_id: str, username: str, content: str, paren
         parent_comment_id=parent_comment_id
     )
     
-    print(f"[DEBUG] 댓글 객체 생성: {comment.comment_id}")
-    
-    # CSV에 추가
-    rows = read_csv_rows(CSV_PATH)
-    print(f"[DEBUG] 기존 댓글 수: {len(rows)}")
-    
-    rows.append(comment.to_dict())
-    write_csv_rows(CSV_PATH, rows, COMMENT_FIELDS)
-    
-    print(f"[DEBUG] CSV 저장 완료, 새 댓글 수: {len(rows)}")
+    # writer 큐로 CSV 끝에 추가 (전체 재작성 없음), 기록 직후 인덱스에 증분 반영
+    def op(batch: WriteBatch) -> None:
+        batch.append(comment.to_dict())
+        batch.on_commit(lambda: _add_to_store(comment, batch.signature_before, batch.signature_after))
+
+    get_write_queue().submit(CSV_PATH, COMMENT_FIELDS, op).result()
     
     # 프롬프트의 댓글 수 업데이트
     _update_prompt_comments_count(prompt_id)
-    print(f"[DEBUG] 댓글 카운트 업데이트 완료")
+    logger.debug("댓글 추가: comment_id=%s, prompt_id=%s, user_id=%s", comment.comment_id, prompt_id, user_id)
     
     return comment
 
 
 def toggle_comment_like(comment_id: str, user_id: str) -> int:
-    """댓글 좋아요 토글"""
-    ensure_comments_schema()
-    
-    rows = read_csv_rows(CSV_PATH)
-    for i, row in enumerate(rows):
-        if row.get("comment_id") == comment_id:
-            try:
-                current_likes = int(row.get("likes", 0))
-            except (ValueError, TypeError):
-                current_likes = 0
-            
-            # 좋아요 토글 (단순 증가/감소, 실제로는 interactions.csv에서 중복 체크 필요)
-            new_likes = current_likes + 1  # 간단 구현
-            
-            rows[i]["likes"] = str(new_likes)
-            rows[i]["updated_at"] = str(time.time())
-            
-            write_csv_rows(CSV_PATH, rows, COMMENT_FIELDS)
-            return new_likes
-    
-    return 0
+    """댓글 좋아요 토글 (writer 큐 op 로 다른 댓글 기록과 같은 커밋에 반영)"""
+    def op(batch: WriteBatch) -> int:
+        for row in batch.rows():
+            if row.get("comment_id") == comment_id:
+                try:
+                    current_likes = int(row.get("likes", 0))
+                except (ValueError, TypeError):
+                    current_likes = 0
+                
+                # 좋아요 토글 (단순 증가/감소, 실제로는 interactions.csv에서 중복 체크 필요)
+                new_likes = current_likes + 1  # 간단 구현
+                
+                row["likes"] = str(new_likes)
+                row["updated_at"] = str(time.time())
+                batch.mark_dirty()
+                return new_likes
+        return 0
+
+    return get_write_queue().submit(CSV_PATH, COMMENT_FIELDS, op).result()
 
 
 def delete_comment(comment_id: str, user_id: str) -> bool:
-    """댓글 삭제 (작성자만 가능)"""
-    ensure_comments_schema()
-    
-    rows = read_csv_rows(CSV_PATH)
-    for i, row in enumerate(rows):
-        if row.get("comment_id") == comment_id and row.get("user_id") == user_id:
-            rows[i]["status"] = "deleted"
-            rows[i]["content"] = "[삭제된 댓글입니다]"
-            rows[i]["updated_at"] = str(time.time())
-            
-            write_csv_rows(CSV_PATH, rows, COMMENT_FIELDS)
-            
-            # 프롬프트의 댓글 수 업데이트
-            _update_prompt_comments_count(row.get("prompt_id"))
-            return True
-    
-    return False
+    """댓글 삭제 (작성자만 가능, writer 큐 op 로 처리)"""
+    def op(batch: WriteBatch) -> Optional[str]:
+        for row in batch.rows():
+            if row.get("comment_id") == comment_id and row.get("user_id") == user_id:
+                row["status"] = "deleted"
+                row["content"] = "[삭제된 댓글입니다]"
+                row["updated_at"] = str(time.time())
+                batch.mark_dirty()
+                return row.get("prompt_id")
+        return None
+
+    deleted_prompt_id = get_write_queue().submit(CSV_PATH, COMMENT_FIELDS, op).result()
+    if deleted_prompt_id is None:
+        return False
+    # 프롬프트의 댓글 수 업데이트 (writer 밖에서, 인덱스 재구성 포함)
+    _update_prompt_comments_count(deleted_prompt_id)
+    return True
 
 
 def _update_prompt_comments_count(prompt_id: str):
@@ -170,11 +220,8 @@ def _update_prompt_comments_count(prompt_id: str):
 
 def organize_comments_tree(comments: List[Comment]) -> Dict:
     """댓글을 트리 구조로 정리 (부모-자식 관계)"""
-    print(f"[DEBUG] organize_comments_tree 시작: {len(comments)}개 댓글")
-    
     # 부모 댓글들
     root_comments = [c for c in comments if not c.is_reply()]
-    print(f"[DEBUG] 루트 댓글 수: {len(root_comments)}")
     
     # 대댓글들을 부모별로 그룹화
     replies_by_parent = {}
@@ -182,14 +229,14 @@ def organize_comments_tree(comments: List[Comment]) -> Dict:
     for comment in comments:
         if comment.is_reply():
             parent_id = comment.parent_comment_id
-            print(f"[DEBUG] 대댓글 발견: parent_id={parent_id}, content={comment.content[:30]}...")
             if parent_id not in replies_by_parent:
                 replies_by_parent[parent_id] = []
             replies_by_parent[parent_id].append(comment)
     
-    print(f"[DEBUG] 대댓글 그룹: {len(replies_by_parent)}개 부모에 대댓글 있음")
-    for parent_id, replies in replies_by_parent.items():
-        print(f"[DEBUG] 부모 {parent_id}: {len(replies)}개 대댓글")
+    logger.debug(
+        "댓글 트리: 전체 %d개, 루트 %d개, 대댓글 부모 %d개",
+        len(comments), len(root_comments), len(replies_by_parent),
+    )
     
     return {
         "root_comments": root_comments,
@@ -1,6 +1,29 @@
 import csv
+import os
+import tempfile
+import threading
+from contextlib import contextmanager
 from pathlib import Path
-from typing import List, Dict, Optional
+from typing import Dict, Iterator, List, Optional, Tuple
+
+try:  # 프로세스 간 advisory lock (Windows 에는 없음 -> 스레드 락만 사용)
+    import fcntl
+except ImportError:  # pragma: no cover
+    fcntl = None
+
+
+# 프로세스 전역 테이블 캐시: 경로 -> (파일 시그니처, 파싱된 행들)
+# 파일의 mtime/size가 바뀌었을 때만 다시 파싱한다.
+_TABLE_CACHE: Dict[str, Tuple[Tuple[int, int, int], List[Dict[str, str]]]] = {}
+_CACHE_LOCK = threading.Lock()
+_CACHE_STATS = {"hits": 0, "misses": 0}
+
+# 경로별 쓰기 락: 스레드 간 RLock + 프로세스 간 <파일>.lock 에 대한 flock.
+# 같은 스레드가 다시 잡으면 깊이만 늘리고 flock 은 가장 바깥에서 한 번만 잡는다.
+_PATH_LOCKS: Dict[str, threading.RLock] = {}
+_PATH_LOCK_DEPTH: Dict[str, int] = {}
+_PATH_LOCK_FILES: Dict[str, int] = {}
+_PATH_LOCKS_GUARD = threading.Lock()
 
 
 def safe_int(value: Optional[str], default: int = 0) -> int:
@@ -12,21 +35,163 @@ def safe_int(value: Optional[str], default: int = 0) -> int:
         return default
 
 
+def _cache_key(file_path: Path) -> str:
+    return str(Path(file_path).resolve())
+
+
+def file_signature(file_path: Path) -> Optional[Tuple[int, int, int]]:
+    """파일 변경 감지용 시그니처 (mtime_ns, size, inode). 파일이 없으면 None
+    - os.replace 로 교체된 파일은 inode 가 바뀌므로 mtime/size 가 같아도 구분된다
+    """
+    try:
+        st = Path(file_path).stat()
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size, st.st_ino)
+
+
+@contextmanager
+def file_lock(file_path: Path) -> Iterator[None]:
+    """파일 단위 쓰기 락 (재진입 가능)
+    - 읽고-수정하고-쓰는 호출자는 read_csv_rows 부터 쓰기까지 이 락을 잡고 있어야
+      동시 요청의 변경이 유실되지 않는다
+    - 다른 프로세스와는 <파일>.lock 에 대한 fcntl.flock 으로 직렬화
+    """
+    key = _cache_key(file_path)
+    with _PATH_LOCKS_GUARD:
+        lock = _PATH_LOCKS.setdefault(key, threading.RLock())
+    with lock:
+        depth = _PATH_LOCK_DEPTH.get(key, 0)
+        if depth == 0 and fcntl is not None:
+            Path(key).parent.mkdir(parents=True, exist_ok=True)
+            fd = os.open(key + ".lock", os.O_RDWR | os.O_CREAT, 0o644)
+            try:
+                fcntl.flock(fd, fcntl.LOCK_EX)
+            except OSError:
+                os.close(fd)
+                raise
+            _PATH_LOCK_FILES[key] = fd
+        _PATH_LOCK_DEPTH[key] = depth + 1
+        try:
+            yield
+        finally:
+            _PATH_LOCK_DEPTH[key] = depth
+            if depth == 0:
+                del _PATH_LOCK_DEPTH[key]
+                fd = _PATH_LOCK_FILES.pop(key, None)
+                if fd is not None:
+                    try:
+                        fcntl.flock(fd, fcntl.LOCK_UN)
+                    finally:
+                        os.close(fd)
+
+
 def read_csv_rows(file_path: Path) -> List[Dict[str, str]]:
-    if not file_path.exists():
+    """CSV 행 목록 반환 (캐시 사용)
+    - 호출자가 행을 수정해도 캐시가 오염되지 않도록 행 단위 복사본을 반환
+    """
+    signature = file_signature(file_path)
+    if signature is None:
         return []
+    key = _cache_key(file_path)
+    with _CACHE_LOCK:
+        cached = _TABLE_CACHE.get(key)
+        if cached is not None and cached[0] == signature:
+            _CACHE_STATS["hits"] += 1
+            return [dict(r) for r in cached[1]]
+        _CACHE_STATS["misses"] += 1
     with open(file_path, "r", encoding="utf-8") as f:
         reader = csv.DictReader(f)
-        return list(reader)
+        rows = list(reader)
+    with _CACHE_LOCK:
+        _TABLE_CACHE[key] = (signature, rows)
+    return [dict(r) for r in rows]
 
 
 def write_csv_rows(file_path: Path, rows: List[Dict[str, str]], fieldnames: List[str]) -> None:
+    """CSV 전체 저장 (원자적 교체)
+    - 같은 디렉터리의 임시 파일에 쓰고 fsync 후 os.replace 로 교체하므로
+      쓰는 도중 중단돼도 기존 파일이 잘린 채로 남지 않는다
+    """
+    file_path = Path(file_path)
     file_path.parent.mkdir(parents=True, exist_ok=True)
-    with open(file_path, "w", encoding="utf-8", newline="") as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        writer.writeheader()
-        for r in rows:
-            writer.writerow(r)
+    with file_lock(file_path):
+        fd, tmp_name = tempfile.mkstemp(prefix=f".{file_path.name}.", suffix=".tmp", dir=str(file_path.parent))
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8", newline="") as f:
+                writer = csv.DictWriter(f, fieldnames=fieldnames)
+                writer.writeheader()
+                for r in rows:
+                    writer.writerow(r)
+                f.flush()
+                os.fsync(f.fileno())
+            if file_path.exists():
+                # mkstemp 는 0600 으로 만들므로 기존 파일 권한 유지
+                os.chmod(tmp_name, file_path.stat().st_mode & 0o777)
+            os.replace(tmp_name, file_path)
+        except BaseException:
+            try:
+                os.unlink(tmp_name)
+            except OSError:
+                pass
+            raise
+        # 방금 쓴 내용으로 캐시 갱신 (다음 읽기에서 재파싱 생략)
+        signature = file_signature(file_path)
+        if signature is None:
+            return
+        cached_rows = [{k: ("" if r.get(k) is None else str(r.get(k))) for k in fieldnames} for r in rows]
+        with _CACHE_LOCK:
+            _TABLE_CACHE[_cache_key(file_path)] = (signature, cached_rows)
+
+
+def append_csv_rows(file_path: Path, rows: List[Dict[str, str]], fieldnames: List[str]) -> None:
+    """기존 CSV 끝에 행을 추가 (전체 재작성 없이 append + fsync)
+    - 파일이 없으면 헤더부터 생성
+    """
+    if not rows:
+        return
+    file_path = Path(file_path)
+    file_path.parent.mkdir(parents=True, exist_ok=True)
+    with file_lock(file_path):
+        before = file_signature(file_path)
+        with open(file_path, "a", encoding="utf-8", newline="") as f:
+            writer = csv.DictWriter(f, fieldnames=fieldnames)
+            if before is None or before[1] == 0:
+                writer.writeheader()
+            for r in rows:
+                writer.writerow(r)
+            f.flush()
+            os.fsync(f.fileno())
+        # 캐시가 append 직전 상태와 일치할 때만 이어붙여 갱신, 아니면 다음 읽기에서 재파싱
+        after = file_signature(file_path)
+        key = _cache_key(file_path)
+        with _CACHE_LOCK:
+            cached = _TABLE_CACHE.get(key)
+            if cached is not None and before is not None and cached[0] == before and after is not None:
+                appended = [{k: ("" if r.get(k) is None else str(r.get(k))) for k in fieldnames} for r in rows]
+                cached[1].extend(appended)
+                _TABLE_CACHE[key] = (after, cached[1])
+            else:
+                _TABLE_CACHE.pop(key, None)
+
+
+def invalidate_csv_cache(file_path: Optional[Path] = None) -> None:
+    """캐시 무효화 (file_path가 없으면 전체)"""
+    with _CACHE_LOCK:
+        if file_path is None:
+            _TABLE_CACHE.clear()
+        else:
+            _TABLE_CACHE.pop(_cache_key(file_path), None)
+
+
+def get_csv_cache_stats() -> Dict[str, int]:
+    """캐시 적중/미스 카운터 조회"""
+    with _CACHE_LOCK:
+        return {
+            "hits": _CACHE_STATS["hits"],
+            "misses": _CACHE_STATS["misses"],
+            "tables": len(_TABLE_CACHE),
+        }
 
 
 def ensure_fields_exist(rows: List[Dict[str, str]], fieldnames: List[str], required_fields: List[str]) -> List[str]:
@@ -39,5 +204,3 @@ def ensure_fields_exist(rows: List[Dict[str, str]], fieldnames: List[str], requi
             if rf not in r or r[rf] is None or r[rf] == "":
                 r[rf] = "0"
     return updated_fieldnames
-
-
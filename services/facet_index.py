@@ -0,0 +1,155 @@
+"""
+필터 사이드바용 facet 카운트 엔진
+
+카테고리별, AI 모델별, (카테고리 × 모델) 조합별 프롬프트 수와 posting 집합을
+메모리에 유지하고 프롬프트 쓰기 시 증분 갱신한다. 필터 조회는 posting 교집합을
+최신순으로 정렬한 prompt_id 목록만 돌려준다 (행 복사 없음).
+"""
+import threading
+from collections import Counter
+from typing import Dict, List, Optional, Set, Tuple
+
+from .csv_utils import safe_int
+from .prompt_service import register_derived_index
+
+
+def _facet_values(row: Dict[str, str]) -> Tuple[str, str]:
+    return (row.get("category") or "").strip(), (row.get("ai_model_key") or "").strip()
+
+
+class FacetIndex:
+    """prompt_id -> (category, ai_model_key) 와 각 facet 카운트"""
+
+    def __init__(self):
+        self._doc_facets: Dict[str, Tuple[str, str]] = {}
+        self._category_counts: Counter = Counter()
+        self._model_counts: Counter = Counter()
+        self._pair_counts: Counter = Counter()
+        self._category_ids: Dict[str, Set[str]] = {}
+        self._model_ids: Dict[str, Set[str]] = {}
+        # 정렬 키: (-created_at, 파일 내 순서) -> 최신순, 동률이면 원래 순서
+        self._doc_created: Dict[str, int] = {}
+        self._doc_order: Dict[str, int] = {}
+        self._next_order = 0
+        self._built = False
+        self._lock = threading.RLock()
+
+    def is_built(self) -> bool:
+        return self._built
+
+    def rebuild(self, rows) -> None:
+        with self._lock:
+            self._doc_facets.clear()
+            self._category_counts.clear()
+            self._model_counts.clear()
+            self._pair_counts.clear()
+            self._category_ids.clear()
+            self._model_ids.clear()
+            self._doc_created.clear()
+            self._doc_order.clear()
+            self._next_order = 0
+            for row in rows:
+                self._add(row)
+            self._built = True
+
+    def upsert(self, row: Dict[str, str]) -> None:
+        with self._lock:
+            self._remove(str(row.get("prompt_id") or row.get("id") or ""), keep_order=True)
+            self._add(row)
+
+    def remove(self, prompt_id: str) -> None:
+        with self._lock:
+            self._remove(str(prompt_id))
+
+    def _add(self, row: Dict[str, str]) -> None:
+        pid = str(row.get("prompt_id") or row.get("id") or "")
+        if not pid or pid in self._doc_facets:
+            return
+        category, model = _facet_values(row)
+        self._doc_facets[pid] = (category, model)
+        self._category_counts[category] += 1
+        self._model_counts[model] += 1
+        self._pair_counts[(category, model)] += 1
+        self._category_ids.setdefault(category, set()).add(pid)
+        self._model_ids.setdefault(model, set()).add(pid)
+        self._doc_created[pid] = safe_int(row.get("created_at"), 0)
+        if pid not in self._doc_order:
+            self._doc_order[pid] = self._next_order
+            self._next_order += 1
+
+    def _remove(self, pid: str, keep_order: bool = False) -> None:
+        facets = self._doc_facets.pop(pid, None)
+        if facets is None:
+            return
+        category, model = facets
+        self._doc_created.pop(pid, None)
+        if not keep_order:
+            self._doc_order.pop(pid, None)
+        for postings, key in ((self._category_ids, category), (self._model_ids, model)):
+            bucket = postings.get(key)
+            if bucket is not None:
+                bucket.discard(pid)
+                if not bucket:
+                    del postings[key]
+        for counter, key in (
+            (self._category_counts, category),
+            (self._model_counts, model),
+            (self._pair_counts, (category, model)),
+        ):
+            counter[key] -= 1
+            if counter[key] <= 0:
+                del counter[key]
+
+    def total(self) -> int:
+        with self._lock:
+            return len(self._doc_facets)
+
+    def category_counts(self, ai_model: Optional[str] = None) -> Dict[str, int]:
+        """카테고리별 프롬프트 수 (ai_model 지정 시 해당 모델과의 조합 수)"""
+        with self._lock:
+            if not ai_model:
+                return dict(self._category_counts)
+            return {c: n for (c, m), n in self._pair_counts.items() if m == ai_model}
+
+    def model_counts(self, category: Optional[str] = None) -> Dict[str, int]:
+        """AI 모델별 프롬프트 수 (category 지정 시 해당 카테고리와의 조합 수)"""
+        with self._lock:
+            if not category:
+                return dict(self._model_counts)
+            return {m: n for (c, m), n in self._pair_counts.items() if c == category}
+
+    def count(self, category: Optional[str] = None, ai_model: Optional[str] = None) -> int:
+        """조건에 맞는 프롬프트 수 (None 은 전체)"""
+        with self._lock:
+            if category and ai_model:
+                return self._pair_counts.get((category, ai_model), 0)
+            if category:
+                return self._category_counts.get(category, 0)
+            if ai_model:
+                return self._model_counts.get(ai_model, 0)
+            return len(self._doc_facets)
+
+    def query_ids(self, category: Optional[str] = None, ai_model: Optional[str] = None) -> List[str]:
+        """조건에 맞는 prompt_id 목록 (최신순, None 은 조건 없음)"""
+        with self._lock:
+            postings = []
+            if category:
+                postings.append(self._category_ids.get(category, set()))
+            if ai_model:
+                postings.append(self._model_ids.get(ai_model, set()))
+            if not postings:
+                matched = set(self._doc_facets)
+            else:
+                postings.sort(key=len)
+                matched = set(postings[0])
+                for other in postings[1:]:
+                    matched &= other
+            return sorted(matched, key=lambda pid: (-self._doc_created[pid], self._doc_order[pid]))
+
+
+_get_index = register_derived_index(FacetIndex())
+
+
+def get_facet_index() -> FacetIndex:
+    """프로세스 공용 facet 인덱스 (최초 호출 시, 또는 prompts.csv 가 바뀌었으면 다시 구축)"""
+    return _get_index()
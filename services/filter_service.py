@@ -1,98 +1,83 @@
 """
 필터링 서비스
 """
-from pathlib import Path
 from typing import List, Dict, Any, Optional
-from .csv_utils import read_csv_rows
+from .prompt_service import load_prompt_rows, get_prompts_by_ids
+from .facet_index import get_facet_index
+from utils.log_utils import get_logger
+
+logger = get_logger("filter_service")
+
+
+def _normalize_filter(value: Optional[str]) -> Optional[str]:
+    """'전체'/빈 값은 조건 없음(None)으로 취급"""
+    value = (value or "").strip()
+    if not value or value == "전체":
+        return None
+    return value
+
+
+def query_prompt_ids(category: Optional[str] = None, ai_model_key: Optional[str] = None) -> List[str]:
+    """카테고리 × AI 모델 필터 결과의 prompt_id 목록 (최신순)
+    - facet posting 교집합으로 계산하며 행 데이터는 복사하지 않는다
+    - 카드 표시 시 get_prompts_by_ids 로 필요한 행만 로드
+    """
+    try:
+        return get_facet_index().query_ids(_normalize_filter(category), _normalize_filter(ai_model_key))
+    except Exception as e:
+        logger.error("필터 조회 오류: %s", e)
+        return []
 
 
 def filter_prompts_by_category(category: str) -> List[Dict[str, Any]]:
     """카테고리별 프롬프트 필터링"""
     try:
-        prompts_data = read_csv_rows(Path("data/prompts.csv"))
-        if not prompts_data:
-            return []
-        
         if category == "전체":
-            return prompts_data
+            return load_prompt_rows()
         
-        results = []
-        for prompt in prompts_data:
-            prompt_category = prompt.get("category", "").strip()
-            if prompt_category == category:
-                results.append(prompt)
+        results = get_prompts_by_ids(query_prompt_ids(category=category))
         
-        # 최신순으로 정렬
-        results.sort(key=lambda x: _safe_sort_key(x), reverse=True)
-        
-        print(f"[DEBUG] 카테고리 '{category}' 필터링: {len(results)}개 결과")
+        logger.debug("카테고리 '%s' 필터링: %d개 결과", category, len(results))
         return results
         
     except Exception as e:
-        print(f"[ERROR] 카테고리 필터링 오류: {e}")
+        logger.error("카테고리 필터링 오류: %s", e)
         return []
 
 
 def filter_prompts_by_ai_model(ai_model_key: str) -> List[Dict[str, Any]]:
     """AI 모델별 프롬프트 필터링"""
     try:
-        prompts_data = read_csv_rows(Path("data/prompts.csv"))
-        if not prompts_data:
-            return []
-        
         if ai_model_key == "전체":
-            return prompts_data
+            return load_prompt_rows()
         
-        results = []
-        for prompt in prompts_data:
-            prompt_ai_model = prompt.get("ai_model_key", "").strip()
-            if prompt_ai_model == ai_model_key:
-                results.append(prompt)
+        results = get_prompts_by_ids(query_prompt_ids(ai_model_key=ai_model_key))
         
-        # 최신순으로 정렬
-        results.sort(key=lambda x: _safe_sort_key(x), reverse=True)
-        
-        print(f"[DEBUG] AI 모델 '{ai_model_key}' 필터링: {len(results)}개 결과")
+        logger.debug("AI 모델 '%s' 필터링: %d개 결과", ai_model_key, len(results))
         return results
         
     except Exception as e:
-        print(f"[ERROR] AI 모델 필터링 오류: {e}")
+        logger.error("AI 모델 필터링 오류: %s", e)
         return []
 
 
 def get_available_categories() -> List[str]:
     """사용 가능한 카테고리 목록 반환"""
     try:
-        prompts_data = read_csv_rows(Path("data/prompts.csv"))
-        if not prompts_data:
-            return ["전체"]
-        
-        categories = set()
-        for prompt in prompts_data:
-            category = prompt.get("category", "").strip()
-            if category:
-                categories.add(category)
+        categories = [c for c in get_facet_index().category_counts() if c]
         
         result = ["전체"] + sorted(list(categories))
         return result
         
     except Exception as e:
-        print(f"[ERROR] 카테고리 목록 조회 오류: {e}")
+        logger.error("카테고리 목록 조회 오류: %s", e)
         return ["전체"]
 
 
 def get_available_ai_models() -> List[Dict[str, str]]:
     """사용 가능한 AI 모델 목록 반환"""
     try:
-        prompts_data = read_csv_rows(Path("data/prompts.csv"))
-        if not prompts_data:
-            return [{"key": "전체", "name": "전체"}]
-        
-        ai_models = set()
-        for prompt in prompts_data:
-            ai_model_key = prompt.get("ai_model_key", "").strip()
-            if ai_model_key:
-                ai_models.add(ai_model_key)
+        ai_models = [m for m in get_facet_index().model_counts() if m]
         
         # AI 모델 키를 이름으로 변환
         model_mapping = {
@@ -111,16 +96,5 @@ def get_available_ai_models() -> List[Dict[str, str]]:
         return result
         
     except Exception as e:
-        print(f"[ERROR] AI 모델 목록 조회 오류: {e}")
+        logger.error("AI 모델 목록 조회 오류: %s", e)
         return [{"key": "전체", "name": "전체"}]
-
-
-def _safe_sort_key(x):
-    """안전한 정렬 키 생성"""
-    created_at = x.get("created_at", "0")
-    if not created_at or created_at.strip() == "":
-        return 0
-    try:
-        return int(created_at)
-    except ValueError:
-        return 0
@@ -0,0 +1,118 @@
+"""
+사용자별 좋아요/북마크 상태 인덱스
+
+interactions.csv 로그를 한 번 재생해 현재 활성인 (user_id, prompt_id, type) 집합을
+메모리에 유지한다. 토글은 writer 큐 op 안에서 이 집합으로 O(1) 판단하고 바로 갱신하며,
+카드 목록은 한 페이지 분량의 prompt_id 에 대한 상태를 한 번에 조회한다.
+구축/커밋 시점의 파일 시그니처를 함께 기억해 다른 프로세스가 로그를 바꾸면 다시 구성한다.
+"""
+import threading
+from typing import Dict, Iterable, Optional, Sequence, Set, Tuple
+
+TOGGLE_TYPES = ("like", "bookmark")
+CANCEL_PREFIX = "un"  # 취소 행 type 접두사 ("unlike", "unbookmark")
+
+
+class InteractionIndex:
+    """활성 (user_id, prompt_id, type) 집합"""
+
+    def __init__(self):
+        self._active: Set[Tuple[str, str, str]] = set()
+        self._built = False
+        self._signature: Optional[Tuple[int, int, int]] = None
+        self._lock = threading.RLock()
+
+    def is_built(self) -> bool:
+        return self._built
+
+    def is_current(self, signature: Optional[Tuple[int, int, int]]) -> bool:
+        """signature 시점의 파일 내용을 반영하고 있는지"""
+        with self._lock:
+            return self._built and self._signature == signature
+
+    def rebuild(self, rows: Iterable[Dict[str, str]],
+                signature: Optional[Tuple[int, int, int]] = None) -> None:
+        """로그를 순서대로 재생해 재구성 (취소 행은 직전 활성 상태를 해제)"""
+        active: Set[Tuple[str, str, str]] = set()
+        for r in rows:
+            rtype = r.get("type") or ""
+            if rtype in TOGGLE_TYPES:
+                active.add((r.get("user_id") or "", r.get("prompt_id") or "", rtype))
+            elif rtype.startswith(CANCEL_PREFIX) and rtype[len(CANCEL_PREFIX):] in TOGGLE_TYPES:
+                active.discard((r.get("user_id") or "", r.get("prompt_id") or "", rtype[len(CANCEL_PREFIX):]))
+        with self._lock:
+            self._active = active
+            self._signature = signature
+            self._built = True
+
+    def invalidate(self) -> None:
+        """다음 조회 때 파일에서 다시 구성"""
+        with self._lock:
+            self._built = False
+            self._signature = None
+            self._active = set()
+
+    def mark_committed(self, signature_before, signature_after,
+                       changes: Sequence[Tuple[str, str, str, bool]] = ()) -> None:
+        """writer 배치 커밋 후 호출: 커밋된 변경을 다시 적용하고 시그니처를 커밋 이후로 갱신
+        - 커밋 사이에 조회 경로가 파일로 재구성했어도 변경을 잃지 않도록 changes 를 재적용 (멱등)
+        - 그 사이 다른 프로세스의 변경으로 시그니처가 달라졌으면 다음 조회 때 재구성되도록 둔다
+        """
+        with self._lock:
+            if not self._built or self._signature not in (signature_before, signature_after):
+                return
+            for user_id, prompt_id, itype, active in changes:
+                self.set_active(user_id, prompt_id, itype, active)
+            self._signature = signature_after
+
+    def is_active(self, user_id: str, prompt_id: str, itype: str) -> bool:
+        with self._lock:
+            return (user_id, prompt_id, itype) in self._active
+
+    def set_active(self, user_id: str, prompt_id: str, itype: str, active: bool) -> None:
+        with self._lock:
+            if active:
+                self._active.add((user_id, prompt_id, itype))
+            else:
+                self._active.discard((user_id, prompt_id, itype))
+
+    def states(self, user_id: str, prompt_ids: Sequence[str],
+               types: Sequence[str] = TOGGLE_TYPES) -> Dict[str, Dict[str, bool]]:
+        """prompt_id -> {type: 활성 여부} (user_id 가 없으면 모두 False)"""
+        with self._lock:
+            return {
+                pid: {t: bool(user_id) and (user_id, pid, t) in self._active for t in types}
+                for pid in prompt_ids
+            }
+
+
+_index = InteractionIndex()
+_build_lock = threading.Lock()
+
+
+def note_append(signature_before, signature_after) -> None:
+    """토글과 무관한 행(view 등)만 append 한 뒤 호출: 재구성 없이 시그니처만 옮긴다"""
+    _index.mark_committed(signature_before, signature_after)
+
+
+def ensure_current(rows_loader, signature) -> InteractionIndex:
+    """인덱스가 signature 시점 파일과 다르면 rows_loader() 결과로 재구성
+    (writer op 는 batch.signature_before 와 배치 행으로 확인)
+    - writer 는 파일 락 -> _build_lock 순서로 잡으므로 rows_loader 는 파일 락을 잡으면 안 된다
+    """
+    if not _index.is_current(signature):
+        with _build_lock:
+            if not _index.is_current(signature):
+                _index.rebuild(rows_loader(), signature)
+    return _index
+
+
+def get_interaction_index() -> InteractionIndex:
+    """프로세스 공용 상태 인덱스 (interactions.csv 가 바뀌었으면 다시 구축)"""
+    from .csv_utils import file_signature, read_csv_rows
+    from .interactions_service import INTERACTIONS_CSV_PATH, _ensure_interactions_file
+    # 파일 생성(파일 락)은 _build_lock 밖에서 먼저 끝낸다 (writer 와 락 순서가 뒤집히지 않도록)
+    _ensure_interactions_file()
+    # 읽기 전에 시그니처를 잡아, 읽는 도중 바뀌었으면 다음 조회 때 다시 구성되게 한다
+    return ensure_current(lambda: read_csv_rows(INTERACTIONS_CSV_PATH),
+                          file_signature(INTERACTIONS_CSV_PATH))
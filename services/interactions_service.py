@@ -2,23 +2,32 @@ import time
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
-from .csv_utils import read_csv_rows, write_csv_rows
+from .csv_utils import append_csv_rows, file_lock, file_signature, read_csv_rows, write_csv_rows
 from .prompt_service import PROMPTS_CSV_PATH, increment_prompt_stat
+from .interaction_index import CANCEL_PREFIX, TOGGLE_TYPES, ensure_current, get_interaction_index, note_append
+from .write_queue import WriteBatch, get_write_queue
 
 
 BASE_DIR = Path(__file__).resolve().parent.parent
 DATA_DIR = BASE_DIR / "data"
 INTERACTIONS_CSV_PATH = DATA_DIR / "interactions.csv"
 
+INTERACTION_FIELDS = ["interaction_id", "user_id", "prompt_id", "type", "created_at"]
+
+# try_consume_view 가 조회 기록까지 마친 prompt_id (상세 페이지가 record_view 를 다시 하지 않도록)
+VIEW_RECORDED_SESSION_KEY = "view_recorded_prompt_id"
+
+# 토글 해제는 행 삭제 대신 취소 행("unlike", "unbookmark")을 append 하고,
+# 취소 행이 일정 수 이상 쌓이면 compact_interactions()로 정리한다. (CANCEL_PREFIX: interaction_index)
+COMPACT_THRESHOLD = 200
+_cancel_appends = 0
+
 
 def _ensure_interactions_file() -> None:
     if not INTERACTIONS_CSV_PATH.exists():
-        INTERACTIONS_CSV_PATH.parent.mkdir(parents=True, exist_ok=True)
-        write_csv_rows(
-            INTERACTIONS_CSV_PATH,
-            [],
-            ["interaction_id", "user_id", "prompt_id", "type", "created_at"],
-        )
+        with file_lock(INTERACTIONS_CSV_PATH):
+            if not INTERACTIONS_CSV_PATH.exists():
+                write_csv_rows(INTERACTIONS_CSV_PATH, [], INTERACTION_FIELDS)
 
 
 def _load_interactions() -> List[Dict[str, str]]:
@@ -26,98 +35,154 @@ def _load_interactions() -> List[Dict[str, str]]:
     return read_csv_rows(INTERACTIONS_CSV_PATH)
 
 
-def _save_interactions(rows: List[Dict[str, str]]) -> None:
-    write_csv_rows(
-        INTERACTIONS_CSV_PATH,
-        rows,
-        ["interaction_id", "user_id", "prompt_id", "type", "created_at"],
-    )
+def _append_interaction(row: Dict[str, str]) -> None:
+    """writer 큐로 append (같은 커밋 윈도우의 다른 기록과 함께 한 번에 기록)"""
+    get_write_queue().submit_append(INTERACTIONS_CSV_PATH, INTERACTION_FIELDS, row).result()
 
 
 def _now_ts() -> str:
     return str(int(time.time()))
 
 
-def _exists_interaction(rows: List[Dict[str, str]], user_id: str, prompt_id: str, itype: str) -> Optional[int]:
+def _toggle_interaction(user_id: str, prompt_id: str, itype: str, stat_field: str) -> Tuple[bool, int]:
+    def op(batch: WriteBatch) -> bool:
+        # writer 스레드에서 순서대로 실행되므로 같은 배치의 앞선 토글까지 반영된 상태로 판단
+        # (상태 인덱스가 없거나 파일이 다른 프로세스에서 바뀌었을 때만 배치 행으로 구성, 이후 O(1) 조회)
+        global _cancel_appends
+        index = ensure_current(batch.rows, batch.signature_before)
+        active = not index.is_active(user_id, prompt_id, itype)
+        index.set_active(user_id, prompt_id, itype, active)
+        batch.on_commit(lambda: index.mark_committed(
+            batch.signature_before, batch.signature_after, [(user_id, prompt_id, itype, active)]))
+        if not active:
+            # 해제: 취소 행 append
+            batch.append(
+                {
+                    "interaction_id": f"i_{user_id}_{prompt_id}_{CANCEL_PREFIX}{itype}_{_now_ts()}",
+                    "user_id": user_id,
+                    "prompt_id": prompt_id,
+                    "type": CANCEL_PREFIX + itype,
+                    "created_at": _now_ts(),
+                }
+            )
+            _cancel_appends += 1
+            if _cancel_appends >= COMPACT_THRESHOLD:
+                _compact_batch(batch)
+            return False
+        batch.append(
+            {
+                "interaction_id": f"i_{user_id}_{prompt_id}_{itype}",
+                "user_id": user_id,
+                "prompt_id": prompt_id,
+                "type": itype,
+                "created_at": _now_ts(),
+            }
+        )
+        return True
+
+    try:
+        active = get_write_queue().submit(INTERACTIONS_CSV_PATH, INTERACTION_FIELDS, op).result()
+    except Exception:
+        # 기록 실패 시 메모리 상태가 파일과 어긋났을 수 있으므로 다음 조회 때 재구성
+        get_interaction_index().invalidate()
+        raise
+    new_count = increment_prompt_stat(prompt_id, stat_field, 1 if active else -1) or 0
+    return (active, new_count)
+
+
+def _compact_batch(batch: WriteBatch) -> int:
+    global _cancel_appends
+    rows = batch.rows()
+    # (user, prompt, type) -> 마지막 활성 행의 인덱스 (취소되면 None)
+    latest: Dict[Tuple[str, str, str], Optional[int]] = {}
     for idx, r in enumerate(rows):
-        if (
-            r.get("user_id") == user_id
-            and r.get("prompt_id") == prompt_id
-            and r.get("type") == itype
-        ):
-            return idx
-    return None
+        rtype = r.get("type") or ""
+        if rtype.startswith(CANCEL_PREFIX):
+            latest[(r.get("user_id"), r.get("prompt_id"), rtype[len(CANCEL_PREFIX):])] = None
+        elif rtype in TOGGLE_TYPES:
+            latest[(r.get("user_id"), r.get("prompt_id"), rtype)] = idx
+    keep_toggles = {idx for idx in latest.values() if idx is not None}
+    compacted = [
+        r for idx, r in enumerate(rows)
+        if (r.get("type") not in TOGGLE_TYPES and not (r.get("type") or "").startswith(CANCEL_PREFIX))
+        or idx in keep_toggles
+    ]
+    removed = len(rows) - len(compacted)
+    if removed:
+        batch.replace(compacted)
+        # 활성 상태는 그대로이므로 인덱스는 시그니처만 압축 이후로 옮긴다
+        index = ensure_current(lambda: rows, batch.signature_before)
+        batch.on_commit(lambda: index.mark_committed(batch.signature_before, batch.signature_after))
+    _cancel_appends = 0
+    return removed
+
+
+def compact_interactions() -> int:
+    """취소된 좋아요/북마크와 취소 행을 제거해 로그를 압축. 반환: 제거된 행 수"""
+    return get_write_queue().submit(INTERACTIONS_CSV_PATH, INTERACTION_FIELDS, _compact_batch).result()
+
+
+def get_interaction_states(user_id: Optional[str], prompt_ids: List[str]) -> Dict[str, Dict[str, bool]]:
+    """한 페이지 분량 prompt_id 의 좋아요/북마크 상태. 반환: {prompt_id: {"like": bool, "bookmark": bool}}"""
+    return get_interaction_index().states(user_id or "", prompt_ids)
+
+
+def is_interaction_active(user_id: Optional[str], prompt_id: str, itype: str) -> bool:
+    """사용자가 해당 프롬프트에 좋아요/북마크 중인지"""
+    if not user_id:
+        return False
+    return get_interaction_index().is_active(user_id, prompt_id, itype)
 
 
 def toggle_like(user_id: str, prompt_id: str) -> Tuple[bool, int]:
     """좋아요 토글. 반환: (현재 좋아요 상태, 총 좋아요 수)"""
-    rows = _load_interactions()
-    found_idx = _exists_interaction(rows, user_id, prompt_id, "like")
-    if found_idx is not None:
-        # 좋아요 해제
-        rows.pop(found_idx)
-        _save_interactions(rows)
-        # 카운트 감소
-        new_count = increment_prompt_stat(prompt_id, "likes", -1) or 0
-        return (False, new_count)
-    # 좋아요 추가
-    rows.append(
-        {
-            "interaction_id": f"i_{user_id}_{prompt_id}_like",
-            "user_id": user_id,
-            "prompt_id": prompt_id,
-            "type": "like",
-            "created_at": _now_ts(),
-        }
-    )
-    _save_interactions(rows)
-    new_count = increment_prompt_stat(prompt_id, "likes", 1) or 0
-    return (True, new_count)
+    return _toggle_interaction(user_id, prompt_id, "like", "likes")
 
 
 def toggle_bookmark(user_id: str, prompt_id: str) -> Tuple[bool, int]:
     """북마크 토글. 반환: (현재 북마크 상태, 총 북마크 수)"""
-    rows = _load_interactions()
-    found_idx = _exists_interaction(rows, user_id, prompt_id, "bookmark")
-    if found_idx is not None:
-        rows.pop(found_idx)
-        _save_interactions(rows)
-        new_count = increment_prompt_stat(prompt_id, "bookmarks", -1) or 0
-        return (False, new_count)
-    rows.append(
-        {
-            "interaction_id": f"i_{user_id}_{prompt_id}_bookmark",
-            "user_id": user_id,
-            "prompt_id": prompt_id,
-            "type": "bookmark",
-            "created_at": _now_ts(),
-        }
-    )
-    _save_interactions(rows)
-    new_count = increment_prompt_stat(prompt_id, "bookmarks", 1) or 0
-    return (True, new_count)
+    return _toggle_interaction(user_id, prompt_id, "bookmark", "bookmarks")
+
+
+def _view_row(user_id: Optional[str], prompt_id: str) -> Dict[str, str]:
+    return {
+        "interaction_id": f"i_{user_id or 'guest'}_{prompt_id}_view_{_now_ts()}",
+        "user_id": user_id or "",
+        "prompt_id": prompt_id,
+        "type": "view",
+        "created_at": _now_ts(),
+    }
 
 
 def record_view(user_id: Optional[str], prompt_id: str) -> int:
-    """조회 기록 + 카운트 증가. 반환: 총 조회수"""
-    rows = _load_interactions()
-    rows.append(
-        {
-            "interaction_id": f"i_{user_id or 'guest'}_{prompt_id}_view_{_now_ts()}",
-            "user_id": user_id or "",
-            "prompt_id": prompt_id,
-            "type": "view",
-            "created_at": _now_ts(),
-        }
-    )
-    _save_interactions(rows)
+    """조회 기록(append) + 카운트 증가. 반환: 총 조회수
+    - 일일 무료 조회 한도는 points_service.try_consume_view 에서 소비 시점에 센다
+      (try_consume_view(prompt_id=...) 는 이 기록까지 같은 커밋에서 처리)
+    """
+    def op(batch: WriteBatch) -> None:
+        batch.append(_view_row(user_id, prompt_id))
+        # view 행은 좋아요/북마크 상태와 무관하므로 상태 인덱스는 시그니처만 옮긴다
+        batch.on_commit(lambda: note_append(batch.signature_before, batch.signature_after))
+
+    get_write_queue().submit(INTERACTIONS_CSV_PATH, INTERACTION_FIELDS, op).result()
+    return increment_prompt_stat(prompt_id, "views", 1) or 0
+
+
+def append_view_in_commit(user_id: str, prompt_id: str) -> int:
+    """writer 스레드의 커밋 콜백에서 view 행을 바로 append (큐를 다시 거치지 않음). 반환: 총 조회수
+    - 락 순서: 호출자가 잡은 파일 락(users.csv) -> interactions.csv 파일 락
+    """
+    _ensure_interactions_file()
+    with file_lock(INTERACTIONS_CSV_PATH):
+        signature_before = file_signature(INTERACTIONS_CSV_PATH)
+        append_csv_rows(INTERACTIONS_CSV_PATH, [_view_row(user_id, prompt_id)], INTERACTION_FIELDS)
+        note_append(signature_before, file_signature(INTERACTIONS_CSV_PATH))
     return increment_prompt_stat(prompt_id, "views", 1) or 0
 
 
 def record_share(user_id: Optional[str], prompt_id: str) -> int:
-    """공유 기록 + 카운트 증가. 반환: 총 공유수"""
-    rows = _load_interactions()
-    rows.append(
+    """공유 기록(append) + 카운트 증가. 반환: 총 공유수"""
+    _append_interaction(
         {
             "interaction_id": f"i_{user_id or 'guest'}_{prompt_id}_share_{_now_ts()}",
             "user_id": user_id or "",
@@ -126,7 +191,4 @@ def record_share(user_id: Optional[str], prompt_id: str) -> int:
             "created_at": _now_ts(),
         }
     )
-    _save_interactions(rows)
     return increment_prompt_stat(prompt_id, "shares", 1) or 0
-
-
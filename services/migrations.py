@@ -0,0 +1,82 @@
+"""
+CSV 스키마 마이그레이션
+
+data/schema_version.json 에 적용된 스키마 버전을 기록하고, 앱 시작 시 한 번만
+새 마이그레이션을 순서대로 실행한다. 일반 조회/저장 경로에서는 스키마 검사나
+파일 재작성을 하지 않는다.
+"""
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Callable, List, Tuple
+
+from services.csv_utils import file_lock
+from utils.log_utils import get_logger
+
+logger = get_logger("migrations")
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+SCHEMA_VERSION_PATH = BASE_DIR / "data" / "schema_version.json"
+
+_migrate_lock = threading.Lock()
+_migrated = False
+
+
+def _migrate_comments_schema() -> None:
+    """comments.csv 생성 및 누락 필드 보완"""
+    from .comment_service import CSV_PATH, ensure_comments_schema
+    with file_lock(CSV_PATH):
+        ensure_comments_schema()
+
+
+def _migrate_users_schema() -> None:
+    """users.csv 필드 정규화 (plaintext password 제거, 누락 필드 기본값)"""
+    from .user_service import USERS_CSV_PATH, ensure_users_schema
+    with file_lock(USERS_CSV_PATH):
+        ensure_users_schema()
+
+
+# (버전, 이름, 함수). 새 마이그레이션은 항상 끝에 더 큰 버전으로 추가한다.
+MIGRATIONS: List[Tuple[int, str, Callable[[], None]]] = [
+    (1, "comments_schema", _migrate_comments_schema),
+    (2, "users_schema", _migrate_users_schema),
+]
+
+
+def get_schema_version() -> int:
+    """기록된 스키마 버전 (마커가 없으면 0)"""
+    try:
+        with open(SCHEMA_VERSION_PATH, "r", encoding="utf-8") as f:
+            return int(json.load(f).get("version", 0))
+    except (FileNotFoundError, ValueError, TypeError, AttributeError):
+        return 0
+
+
+def _set_schema_version(version: int) -> None:
+    SCHEMA_VERSION_PATH.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = SCHEMA_VERSION_PATH.with_suffix(".json.tmp")
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump({"version": version}, f)
+    os.replace(tmp_path, SCHEMA_VERSION_PATH)
+
+
+def run_migrations() -> int:
+    """미적용 마이그레이션 실행 (프로세스당 한 번). 반환: 적용한 개수"""
+    global _migrated
+    if _migrated:
+        return 0
+    with _migrate_lock:
+        if _migrated:
+            return 0
+        current = get_schema_version()
+        applied = 0
+        for version, name, migrate in MIGRATIONS:
+            if version <= current:
+                continue
+            logger.info("스키마 마이그레이션 %d (%s) 실행", version, name)
+            migrate()
+            _set_schema_version(version)
+            applied += 1
+        _migrated = True
+        return applied
@@ -1,10 +1,12 @@
+import threading
 import time
-from datetime import datetime
+from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Dict, Optional
 
-from .csv_utils import read_csv_rows
-from .user_service import update_user_points
+from .csv_utils import file_signature, read_csv_rows, safe_int, write_csv_rows
+from .user_service import USERS_CSV_PATH, update_user_points
+from .write_queue import WriteBatch, get_write_queue
 from config.constants import FREE_VIEWS_PER_DAY, VIEW_COST
 
 
@@ -30,51 +32,139 @@ def add_points_with_toast(user_id: str, points: int, reason: str, page) -> bool:
         return add_points(user_id, points, reason)
 
 
-INTERACTIONS_CSV_PATH = Path("data/interactions.csv")
+BASE_DIR = Path(__file__).resolve().parent.parent
+DAILY_VIEWS_CSV_PATH = BASE_DIR / "data" / "daily_views.csv"
+DAILY_VIEW_FIELDS = ["user_id", "day", "views"]
 
 # 라이트 버전 설정은 config/constants.py에서 관리
 
+# 오늘 날짜의 사용자별 조회 수 (메모리). daily_views.csv 에는 오늘 것만 저장하고,
+# 날짜가 바뀌면 비운다. 파일이 아예 없을 때만 interactions.csv 로 한 번 시드한다.
+# 여러 프로세스가 같은 파일을 쓰므로 파일 시그니처가 마지막으로 읽거나 쓴 것과 다르면 다시 읽는다.
+# (daily_views.csv 는 users.csv 파일 락 안에서만 기록한다)
+_daily_counts: Dict[str, int] = {}
+_daily_day: Optional[str] = None
+_day_end_ts = 0.0
+_daily_signature = None
+_daily_lock = threading.RLock()
 
-def _today_str(ts: Optional[int] = None) -> str:
+
+def _today_str(ts: Optional[float] = None) -> str:
     dt = datetime.fromtimestamp(ts or time.time())
     return dt.strftime("%Y-%m-%d")
 
 
-def _count_views_today(user_id: str) -> int:
-    rows = read_csv_rows(INTERACTIONS_CSV_PATH)
-    if not rows:
-        return 0
-    today = _today_str()
-    cnt = 0
-    for r in rows:
-        if r.get("type") != "view":
-            continue
-        if r.get("user_id") != user_id:
+def _next_midnight_ts(ts: float) -> float:
+    tomorrow = datetime.fromtimestamp(ts).date() + timedelta(days=1)
+    return datetime.combine(tomorrow, datetime.min.time()).timestamp()
+
+
+def _load_daily_counts(today: str) -> Optional[Dict[str, int]]:
+    """저장된 오늘 조회 수 (파일이 없으면 None)"""
+    if not DAILY_VIEWS_CSV_PATH.exists():
+        return None
+    return {
+        r.get("user_id") or "": safe_int(r.get("views"), 0)
+        for r in read_csv_rows(DAILY_VIEWS_CSV_PATH)
+        if r.get("day") == today and r.get("user_id")
+    }
+
+
+def _seed_daily_counts(today: str) -> Dict[str, int]:
+    """interactions.csv 의 오늘 view 행으로 초기값 구성 (카운터 파일 도입 전 데이터용)"""
+    from .interactions_service import INTERACTIONS_CSV_PATH
+    counts: Dict[str, int] = {}
+    for r in read_csv_rows(INTERACTIONS_CSV_PATH):
+        if r.get("type") != "view" or not r.get("user_id"):
             continue
-        try:
-            created_at = int(r.get("created_at") or 0)
-        except Exception:
-            created_at = 0
-        if _today_str(created_at) == today:
-            cnt += 1
-    return cnt
-
-
-def try_consume_view(user_id: str) -> Dict[str, object]:
-    """조회 시 무료/유료 소비 처리.
-    반환: {ok: bool, used_free: bool, charged: bool, remaining_points: int | None, msg: str}
-    """
-    if not user_id:
-        return {"ok": True, "used_free": True, "charged": False, "remaining_points": None, "msg": "게스트 허용"}
+        if _today_str(safe_int(r.get("created_at"), 0)) == today:
+            counts[r["user_id"]] = counts.get(r["user_id"], 0) + 1
+    return counts
 
-    views_today = _count_views_today(user_id)
-    if views_today < FREE_VIEWS_PER_DAY:
-        return {"ok": True, "used_free": True, "charged": False, "remaining_points": None, "msg": "일일 무료 조회"}
 
-    # 유료 차감 단계
-    new_points = update_user_points(user_id, -VIEW_COST)
-    if new_points is None:
-        return {"ok": False, "used_free": False, "charged": False, "remaining_points": None, "msg": "포인트 부족"}
-    return {"ok": True, "used_free": False, "charged": True, "remaining_points": new_points, "msg": "포인트 차감"}
+def _ensure_today() -> None:
+    """날짜가 바뀌었거나 다른 프로세스가 daily_views.csv 를 고쳤으면 카운터를 파일 기준으로 다시 구성
+    (호출자는 _daily_lock 보유. 소비 op 는 users.csv 파일 락 안에서 호출하므로 읽은 값이 최신)
+    """
+    global _daily_day, _day_end_ts, _daily_signature
+    now = time.time()
+    signature = file_signature(DAILY_VIEWS_CSV_PATH)
+    if _daily_day is not None and now < _day_end_ts and signature == _daily_signature:
+        return
+    today = _today_str(now)
+    counts = _load_daily_counts(today)
+    if counts is None:
+        counts = _seed_daily_counts(today) if _daily_day is None else {}
+    _daily_counts.clear()
+    _daily_counts.update(counts)
+    _daily_day = today
+    _day_end_ts = _next_midnight_ts(now)
+    _daily_signature = signature
+
+
+def _save_daily_counts() -> None:
+    """오늘 카운터로 daily_views.csv 교체 (writer 스레드에서 users.csv 커밋 직후, 같은 파일 락 안에서 호출)
+    - 카운터는 같은 락 안에서 파일 기준으로 다시 읽은 뒤 증가시킨 값이라 다른 프로세스의 조회 수를 덮어쓰지 않는다
+    """
+    global _daily_signature
+    with _daily_lock:
+        rows = [{"user_id": u, "day": _daily_day, "views": str(n)} for u, n in _daily_counts.items()]
+        write_csv_rows(DAILY_VIEWS_CSV_PATH, rows, DAILY_VIEW_FIELDS)
+        _daily_signature = file_signature(DAILY_VIEWS_CSV_PATH)
 
 
+def _count_views_today(user_id: str) -> int:
+    """오늘 조회 수 (메모리 카운터, O(1))"""
+    if not user_id:
+        return 0
+    with _daily_lock:
+        _ensure_today()
+        return _daily_counts.get(user_id, 0)
+
+
+def try_consume_view(user_id: str, prompt_id: Optional[str] = None) -> Dict[str, object]:
+    """조회 시 무료/유료 소비 처리 (한 번의 writer 큐 op 로 원자적으로)
+    - users.csv 파일 락 안에서 daily_views.csv 를 다시 확인해 무료 한도를 판단하고, 포인트 차감과
+      오늘 조회 수 증가를 users.csv 커밋 하나로 처리. 커밋 직후 같은 락 안에서 daily_views.csv 저장
+    - prompt_id 를 주면 조회 기록(interactions.csv view 행 + 조회수)도 같은 커밋 단계에서 남긴다
+    - 동시 클릭/여러 프로세스도 같은 파일 락 안에서 차례로 판단하므로 무료 조회 초과/포인트 중복 차감이 없다
+    반환: {ok: bool, used_free: bool, charged: bool, remaining_points: int | None, views_today: int, msg: str}
+    """
+    global _daily_day
+    if not user_id:
+        return {"ok": True, "used_free": True, "charged": False, "remaining_points": None, "views_today": 0, "msg": "게스트 허용"}
+
+    def op(batch: WriteBatch) -> Dict[str, object]:
+        row = next((r for r in batch.rows() if r.get("user_id") == user_id), None)
+        points = safe_int(row.get("points"), 0) if row is not None else None
+        with _daily_lock:
+            _ensure_today()
+            views_today = _daily_counts.get(user_id, 0)
+            used_free = views_today < FREE_VIEWS_PER_DAY
+            if not used_free:
+                # 유료 차감 단계
+                if points is None or points - VIEW_COST < 0:
+                    return {"ok": False, "used_free": False, "charged": False, "remaining_points": points,
+                            "views_today": views_today, "msg": "포인트 부족"}
+                points -= VIEW_COST
+                row["points"] = str(points)
+                batch.mark_dirty()
+            views_today += 1
+            _daily_counts[user_id] = views_today
+        batch.on_commit(_save_daily_counts)
+        if prompt_id:
+            from .interactions_service import append_view_in_commit
+            batch.on_commit(lambda: append_view_in_commit(user_id, prompt_id))
+        if used_free:
+            return {"ok": True, "used_free": True, "charged": False, "remaining_points": points,
+                    "views_today": views_today, "msg": "일일 무료 조회"}
+        return {"ok": True, "used_free": False, "charged": True, "remaining_points": points,
+                "views_today": views_today, "msg": "포인트 차감"}
+
+    try:
+        return get_write_queue().submit(USERS_CSV_PATH, [], op).result()
+    except Exception:
+        # 기록 실패: 메모리 카운터를 파일 기준으로 다시 읽도록 초기화
+        with _daily_lock:
+            _daily_day = None
+        raise
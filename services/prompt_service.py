@@ -1,7 +1,13 @@
+import atexit
+import threading
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
-from .csv_utils import read_csv_rows, write_csv_rows, ensure_fields_exist, safe_int
+from .csv_utils import read_csv_rows, write_csv_rows, ensure_fields_exist, safe_int, file_signature, file_lock
+from .write_queue import WriteBatch, get_write_queue
+from utils.log_utils import get_logger
+
+logger = get_logger("prompt_service")
 
 
 BASE_DIR = Path(__file__).resolve().parent.parent
@@ -9,59 +15,276 @@ DATA_DIR = BASE_DIR / "data"
 PROMPTS_CSV_PATH = DATA_DIR / "prompts.csv"
 
 
+# 통계 카운터 저장소: (prompt_id, field) -> 아직 파일에 반영되지 않은 증감값
+# 증감은 메모리에서 즉시 적용하고, STATS_FLUSH_INTERVAL 뒤(또는 종료 시) 파일 락 안에서
+# 파일의 현재 값에 더해 기록한다 (다른 프로세스의 증감을 덮어쓰지 않도록).
+# set_value 로 직접 설정한 값은 _pending_sets 에 따로 두고, 그 뒤의 증감은 설정값 기준으로 쌓는다.
+STATS_FLUSH_INTERVAL = 2.0
+_pending_stats: Dict[Tuple[str, str], int] = {}
+_pending_sets: Dict[Tuple[str, str], Tuple[int, int]] = {}  # key -> (설정 순번, 값)
+_set_seq = 0
+_stats_lock = threading.RLock()
+_flush_timer: Optional[threading.Timer] = None
+
+# prompt_id 조회 테이블과 변경 리스너 (검색 인덱스 등 파생 데이터 갱신용)
+_lookup_rows: Dict[str, Dict[str, str]] = {}
+_lookup_signature = None
+_lookup_lock = threading.Lock()
+_prompt_listeners: List[Callable[[str, str, Optional[Dict[str, str]]], None]] = []
+_derived_indexes: List["_DerivedIndex"] = []
+
+
+def _row_id(r: Dict[str, str]) -> str:
+    return str(r.get("prompt_id") or r.get("id") or "")
+
+
+def _schedule_stats_flush() -> None:
+    global _flush_timer
+    if _flush_timer is not None:
+        return
+    _flush_timer = threading.Timer(STATS_FLUSH_INTERVAL, flush_prompt_stats)
+    _flush_timer.daemon = True
+    _flush_timer.start()
+
+
+def _pending_value(key: Tuple[str, str], file_value) -> int:
+    """파일 값에 대기 중인 설정값/증감값을 반영한 값 (_stats_lock 안에서 호출)"""
+    base = _pending_sets[key][1] if key in _pending_sets else safe_int(file_value, 0)
+    return max(0, base + _pending_stats.get(key, 0))
+
+
 def increment_prompt_stat(prompt_id: str, field: str, delta: int = 1, set_value: Optional[int] = None) -> Optional[int]:
-    """프롬프트 통계 업데이트
+    """프롬프트 통계 업데이트 (메모리 반영 후 지연 기록)
     - delta: 증감값 (기본 1)
     - set_value: 직접 설정할 값 (delta 무시)
     """
+    global _set_seq
     if not PROMPTS_CSV_PATH.exists() or not prompt_id:
         return None
-    rows = read_csv_rows(PROMPTS_CSV_PATH)
-    if not rows:
+    row = _find_prompt_row(prompt_id)
+    if row is None:
         return None
-    fieldnames = list(rows[0].keys())
-    fieldnames = ensure_fields_exist(rows, fieldnames, [field])
-    updated_value: Optional[int] = None
+    key = (str(prompt_id), field)
+    with _stats_lock:
+        if set_value is not None:
+            # 직접 값 설정 (이전 증감은 버리고 이 값 기준으로 다시 쌓음)
+            _set_seq += 1
+            _pending_sets[key] = (_set_seq, max(0, set_value))
+            _pending_stats.pop(key, None)
+        else:
+            # 증감값 적용
+            _pending_stats[key] = _pending_stats.get(key, 0) + delta
+        new_value = _pending_value(key, row.get(field))
+        _schedule_stats_flush()
+    return new_value
+
+
+def _flush_stats_op(batch: WriteBatch) -> int:
+    """writer 큐 op: 대기 중인 통계를 prompts.csv 행에 반영
+    - 파일 락 안에서 읽은 현재 값에 증감값을 더해 기록 (다른 writer 의 증감 보존)
+    - 기록이 끝난 뒤에야 대기 값을 빼므로 그 사이 조회도 최신 값을 본다
+    - 그 사이 새로 쌓인 증감은 남겨 두고 다음 flush 에서 기록
+    """
+    global _flush_timer
+    # 락 순서: 파일 락(writer) -> _stats_lock (delete_prompt_by_id 와 동일)
+    with _stats_lock:
+        _flush_timer = None
+        deltas = dict(_pending_stats)
+        sets = dict(_pending_sets)
+    keys = set(deltas) | set(sets)
+    if not keys:
+        return 0
+    rows = batch.rows()
+    if rows:
+        batch.add_fields(ensure_fields_exist(rows, batch.fieldnames, sorted({f for _, f in keys})))
+    by_pid: Dict[str, List[str]] = {}
+    for pid, field in keys:
+        by_pid.setdefault(pid, []).append(field)
+    applied = 0
     for r in rows:
-        pid = r.get("prompt_id") or r.get("id")
-        if str(pid) == str(prompt_id):
-            if set_value is not None:
-                # 직접 값 설정
-                new_value = max(0, set_value)
+        for field in by_pid.get(_row_id(r), ()):
+            key = (_row_id(r), field)
+            base = sets[key][1] if key in sets else safe_int(r.get(field), 0)
+            r[field] = str(max(0, base + deltas.get(key, 0)))
+            applied += 1
+    if rows:
+        batch.mark_dirty()
+
+    def clear_flushed():
+        with _stats_lock:
+            for key in keys:
+                if _pending_sets.get(key) != sets.get(key):
+                    # 스냅샷 뒤에 새로 설정됨: 남은 증감은 새 설정값 기준이므로 그대로 둔다
+                    continue
+                _pending_sets.pop(key, None)
+                remaining = _pending_stats.get(key, 0) - deltas.get(key, 0)
+                if remaining:
+                    _pending_stats[key] = remaining
+                else:
+                    _pending_stats.pop(key, None)
+            if _pending_stats or _pending_sets:
+                _schedule_stats_flush()
+        # 통계 열만 바뀌었으므로 파생 인덱스는 재구축 없이 시그니처만 옮긴다
+        for entry in list(_derived_indexes):
+            entry.advance(batch.signature_before, batch.signature_after)
+
+    batch.on_commit(clear_flushed)
+    return applied
+
+
+def flush_prompt_stats() -> int:
+    """대기 중인 통계 변경을 prompts.csv에 한 번에 기록 (writer 큐 경유). 반환: 반영된 값 개수"""
+    with _stats_lock:
+        if not _pending_stats and not _pending_sets:
+            return 0
+    return get_write_queue().submit(PROMPTS_CSV_PATH, [], _flush_stats_op).result()
+
+
+def apply_pending_stats(row: Dict[str, str]) -> Dict[str, str]:
+    """아직 기록되지 않은 통계 변경을 파일 값에 반영해 반환"""
+    pid = _row_id(row)
+    with _stats_lock:
+        for key in set(_pending_stats) | set(_pending_sets):
+            if key[0] == pid:
+                row[key[1]] = str(_pending_value(key, row.get(key[1])))
+    return row
+
+
+def load_prompt_rows() -> List[Dict[str, str]]:
+    """전체 프롬프트 행 (대기 중인 통계 반영)"""
+    rows = read_csv_rows(PROMPTS_CSV_PATH)
+    with _stats_lock:
+        if not _pending_stats and not _pending_sets:
+            return rows
+    return [apply_pending_stats(r) for r in rows]
+
+
+def _prompt_lookup() -> Dict[str, Dict[str, str]]:
+    """prompt_id -> 행 조회 테이블 (파일이 바뀐 경우에만 재구성, 읽기 전용)"""
+    global _lookup_rows, _lookup_signature
+    signature = file_signature(PROMPTS_CSV_PATH)
+    with _lookup_lock:
+        if signature != _lookup_signature:
+            lookup: Dict[str, Dict[str, str]] = {}
+            for r in read_csv_rows(PROMPTS_CSV_PATH) if signature else []:
+                lookup.setdefault(_row_id(r), r)
+            _lookup_rows = lookup
+            _lookup_signature = signature
+        return _lookup_rows
+
+
+def _find_prompt_row(prompt_id: str) -> Optional[Dict[str, str]]:
+    row = _prompt_lookup().get(str(prompt_id))
+    return dict(row) if row is not None else None
+
+
+def get_prompts_by_ids(prompt_ids: List[str]) -> List[Dict[str, str]]:
+    """ID 순서대로 프롬프트 행 반환 (대기 중인 통계 반영, 없는 ID는 제외)"""
+    lookup = _prompt_lookup()
+    return [apply_pending_stats(dict(lookup[pid])) for pid in prompt_ids if pid in lookup]
+
+
+def add_prompt_listener(listener: Callable[[str, str, Optional[Dict[str, str]]], None]) -> None:
+    """프롬프트 생성/수정/삭제 알림 등록. listener(event, prompt_id, row)
+    - event: "create" | "update" | "delete" (delete 시 row는 None)
+    """
+    if listener not in _prompt_listeners:
+        _prompt_listeners.append(listener)
+
+
+class _DerivedIndex:
+    """prompts.csv 파생 인덱스 등록 정보 (구축/갱신 시점의 파일 시그니처 포함)"""
+
+    def __init__(self, index: Any):
+        self.index = index
+        self.signature = None
+        self.built = False
+        self.lock = threading.Lock()
+
+    def get(self) -> Any:
+        """파일이 마지막으로 반영한 시그니처와 다르면 (다른 프로세스 기록 등) 다시 구축"""
+        if self.built and self.signature == file_signature(PROMPTS_CSV_PATH):
+            return self.index
+        with self.lock:
+            # 읽기 전에 시그니처를 잡아, 읽는 도중 바뀌었으면 다음 조회 때 다시 구축되게 한다
+            signature = file_signature(PROMPTS_CSV_PATH)
+            if not self.built or self.signature != signature:
+                self.index.rebuild(load_prompt_rows())
+                self.signature = signature
+                self.built = True
+        return self.index
+
+    def apply(self, event: str, prompt_id: str, row: Optional[Dict[str, str]],
+              signature_before, signature_after) -> None:
+        with self.lock:
+            if not self.built:
+                return
+            if event == "delete" or row is None:
+                self.index.remove(prompt_id)
             else:
-                # 증감값 적용
-                current = safe_int(r.get(field), 0)
-                new_value = max(0, current + delta)
-            r[field] = str(new_value)
-            updated_value = new_value
-            break
-    write_csv_rows(PROMPTS_CSV_PATH, rows, fieldnames)
-    return updated_value
+                self.index.upsert(row)
+            if self.signature == signature_before:
+                self.signature = signature_after
+
+    def advance(self, signature_before, signature_after) -> None:
+        with self.lock:
+            if self.built and self.signature == signature_before:
+                self.signature = signature_after
+
+
+def register_derived_index(index: Any) -> Callable[[], Any]:
+    """prompts.csv 로 만드는 파생 인덱스(검색, 자동완성, facet 등) 등록
+    - index 는 rebuild(rows), upsert(row), remove(prompt_id) 를 제공해야 한다
+    - 이 프로세스의 생성/수정/삭제는 증분 반영하고, 파일 시그니처가 달라지면 다시 구축
+    반환: 최신 상태의 index 를 돌려주는 getter (최초 호출 시 구축)
+    """
+    entry = _DerivedIndex(index)
+    _derived_indexes.append(entry)
+    return entry.get
+
+
+def _notify_prompt_change(event: str, prompt_id: str, row: Optional[Dict[str, str]],
+                          signature_before=None, signature_after=None) -> None:
+    """signature_before/after: 이 변경을 기록하기 직전/직후의 prompts.csv 시그니처"""
+    for entry in list(_derived_indexes):
+        try:
+            entry.apply(event, str(prompt_id), dict(row) if row is not None else None,
+                        signature_before, signature_after)
+        except Exception as e:
+            logger.error("파생 인덱스 갱신 오류: %s", e)
+    for listener in list(_prompt_listeners):
+        try:
+            listener(event, str(prompt_id), dict(row) if row is not None else None)
+        except Exception as e:
+            logger.error("프롬프트 변경 알림 오류: %s", e)
+
+
+atexit.register(flush_prompt_stats)
 
 
 def save_new_prompt(row: Dict[str, str]) -> None:
-    rows = read_csv_rows(PROMPTS_CSV_PATH)
-    fieldnames = list(rows[0].keys()) if rows else []
-    base_fields = [
-        "prompt_id","user_id","title","content","category","ai_model_key",
-        "tags","likes","bookmarks","shares","comments","views","created_at","updated_at",
-    ]
-    for f in base_fields:
-        if f not in fieldnames:
-            fieldnames.append(f)
-    rows.append(row)
-    write_csv_rows(PROMPTS_CSV_PATH, rows, fieldnames)
+    with file_lock(PROMPTS_CSV_PATH):
+        signature_before = file_signature(PROMPTS_CSV_PATH)
+        rows = read_csv_rows(PROMPTS_CSV_PATH)
+        fieldnames = list(rows[0].keys()) if rows else []
+        base_fields = [
+            "prompt_id","user_id","title","content","category","ai_model_key",
+            "tags","likes","bookmarks","shares","comments","views","created_at","updated_at",
+        ]
+        for f in base_fields:
+            if f not in fieldnames:
+                fieldnames.append(f)
+        rows.append(row)
+        write_csv_rows(PROMPTS_CSV_PATH, rows, fieldnames)
+        signature_after = file_signature(PROMPTS_CSV_PATH)
+    _notify_prompt_change("create", _row_id(row), row, signature_before, signature_after)
 
 
 def get_prompt_by_id(prompt_id: str) -> Optional[Dict[str, str]]:
     if not prompt_id:
         return None
-    rows = read_csv_rows(PROMPTS_CSV_PATH)
-    for r in rows:
-        pid = r.get("prompt_id") or r.get("id")
-        if str(pid) == str(prompt_id):
-            return r
-    return None
+    row = _find_prompt_row(prompt_id)
+    return apply_pending_stats(row) if row is not None else None
 
 
 def update_prompt_field(prompt_id: str, field: str, value: str) -> bool:
@@ -69,24 +292,30 @@ def update_prompt_field(prompt_id: str, field: str, value: str) -> bool:
     if not PROMPTS_CSV_PATH.exists() or not prompt_id:
         return False
     
-    rows = read_csv_rows(PROMPTS_CSV_PATH)
-    if not rows:
-        return False
-    
-    fieldnames = list(rows[0].keys())
-    fieldnames = ensure_fields_exist(rows, fieldnames, [field])
-    
-    updated = False
-    for r in rows:
-        pid = r.get("prompt_id") or r.get("id")
-        if str(pid) == str(prompt_id):
-            r[field] = value
-            updated = True
-            break
-    
+    with file_lock(PROMPTS_CSV_PATH):
+        signature_before = file_signature(PROMPTS_CSV_PATH)
+        rows = read_csv_rows(PROMPTS_CSV_PATH)
+        if not rows:
+            return False
+        
+        fieldnames = list(rows[0].keys())
+        fieldnames = ensure_fields_exist(rows, fieldnames, [field])
+        
+        updated_row = None
+        for r in rows:
+            pid = r.get("prompt_id") or r.get("id")
+            if str(pid) == str(prompt_id):
+                r[field] = value
+                updated_row = r
+                break
+        
+        updated = updated_row is not None
+        if updated:
+            write_csv_rows(PROMPTS_CSV_PATH, rows, fieldnames)
+            signature_after = file_signature(PROMPTS_CSV_PATH)
     if updated:
-        write_csv_rows(PROMPTS_CSV_PATH, rows, fieldnames)
-        print(f"[DEBUG] 프롬프트 {field} 업데이트: {prompt_id} -> {value}")
+        _notify_prompt_change("update", prompt_id, updated_row, signature_before, signature_after)
+        logger.debug("프롬프트 %s 업데이트: %s -> %s", field, prompt_id, value)
     
     return updated
 
@@ -97,27 +326,38 @@ def delete_prompt_by_id(prompt_id: str) -> bool:
         return False
     
     try:
-        rows = read_csv_rows(PROMPTS_CSV_PATH)
-        if not rows:
-            return False
-        
-        fieldnames = list(rows[0].keys())
-        original_count = len(rows)
-        
-        # 해당 ID의 프롬프트 제거
-        rows = [r for r in rows 
-                if str(r.get("prompt_id") or r.get("id") or "") != str(prompt_id)]
+        with file_lock(PROMPTS_CSV_PATH):
+            signature_before = file_signature(PROMPTS_CSV_PATH)
+            rows = read_csv_rows(PROMPTS_CSV_PATH)
+            if not rows:
+                return False
+            
+            fieldnames = list(rows[0].keys())
+            original_count = len(rows)
+            
+            # 해당 ID의 프롬프트 제거
+            rows = [r for r in rows 
+                    if str(r.get("prompt_id") or r.get("id") or "") != str(prompt_id)]
+            
+            deleted = len(rows) < original_count
+            if deleted:
+                write_csv_rows(PROMPTS_CSV_PATH, rows, fieldnames)
+                signature_after = file_signature(PROMPTS_CSV_PATH)
+                with _stats_lock:
+                    for key in [k for k in set(_pending_stats) | set(_pending_sets) if k[0] == str(prompt_id)]:
+                        _pending_stats.pop(key, None)
+                        _pending_sets.pop(key, None)
         
-        if len(rows) < original_count:
-            write_csv_rows(PROMPTS_CSV_PATH, rows, fieldnames)
-            print(f"[DEBUG] 프롬프트 삭제 완료: {prompt_id}")
+        if deleted:
+            _notify_prompt_change("delete", prompt_id, None, signature_before, signature_after)
+            logger.debug("프롬프트 삭제 완료: %s", prompt_id)
             return True
         else:
-            print(f"[DEBUG] 삭제할 프롬프트를 찾지 못함: {prompt_id}")
+            logger.debug("삭제할 프롬프트를 찾지 못함: %s", prompt_id)
             return False
             
     except Exception as e:
-        print(f"[ERROR] 프롬프트 삭제 실패: {e}")
+        logger.error("프롬프트 삭제 실패: %s", e)
         return False
 
 
@@ -0,0 +1,190 @@
+"""
+프롬프트 검색용 역색인 (문자 n-gram)
+
+한국어 제목("테스트 프롬프트" 등)은 형태소 분석 없이도 부분 일치가 되도록
+문자 단위 1-gram/2-gram 으로 색인한다. 질의 n-gram 의 posting 교집합으로
+후보를 좁힌 뒤 실제 부분 문자열 포함 여부로 확정하고, BM25F 점수
+(필드 가중치 title > tags > category > content)로 순위를 매긴다.
+"""
+import heapq
+import math
+import threading
+from collections import Counter
+from typing import Dict, List, Optional, Set, Tuple
+
+from .csv_utils import safe_int
+from .prompt_service import register_derived_index
+
+
+SEARCH_FIELDS = ["title", "content", "tags", "category"]
+
+# BM25F 파라미터
+FIELD_BOOSTS = {"title": 3.0, "tags": 2.0, "category": 1.5, "content": 1.0}
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+
+def char_ngrams(text: str) -> Set[str]:
+    """소문자 텍스트의 1-gram + 2-gram 집합"""
+    grams = set(text)
+    grams.update(text[i:i + 2] for i in range(len(text) - 1))
+    return grams
+
+
+def _gram_counts(text: str) -> Counter:
+    counts = Counter(text)
+    counts.update(text[i:i + 2] for i in range(len(text) - 1))
+    return counts
+
+
+def query_ngrams(query: str) -> Set[str]:
+    """질의 후보 검색용 n-gram (2자 이상이면 2-gram만 사용)"""
+    if len(query) < 2:
+        return set(query)
+    return {query[i:i + 2] for i in range(len(query) - 1)}
+
+
+class PromptSearchIndex:
+    """prompt_id 단위 역색인. 프롬프트 쓰기 시 증분 갱신된다."""
+
+    def __init__(self):
+        self._postings: Dict[str, Set[str]] = {}
+        self._doc_grams: Dict[str, Set[str]] = {}
+        self._doc_fields: Dict[str, Dict[str, str]] = {}
+        self._doc_created: Dict[str, int] = {}
+        self._doc_order: Dict[str, int] = {}
+        self._next_order = 0
+        # BM25F 통계: 문서별 필드 n-gram 빈도, 필드 길이 합계
+        self._doc_tf: Dict[str, Dict[str, Counter]] = {}
+        self._field_len_total: Dict[str, int] = {f: 0 for f in SEARCH_FIELDS}
+        self._built = False
+        self._lock = threading.RLock()
+
+    def rebuild(self, rows: List[Dict[str, str]]) -> None:
+        with self._lock:
+            self._postings.clear()
+            self._doc_grams.clear()
+            self._doc_fields.clear()
+            self._doc_created.clear()
+            self._doc_order.clear()
+            self._next_order = 0
+            self._doc_tf.clear()
+            self._field_len_total = {f: 0 for f in SEARCH_FIELDS}
+            for row in rows:
+                self._add(row)
+            self._built = True
+
+    def is_built(self) -> bool:
+        return self._built
+
+    def upsert(self, row: Dict[str, str]) -> None:
+        with self._lock:
+            pid = str(row.get("prompt_id") or row.get("id") or "")
+            self._remove(pid, keep_order=True)
+            self._add(row)
+
+    def remove(self, prompt_id: str) -> None:
+        with self._lock:
+            self._remove(str(prompt_id))
+
+    def _add(self, row: Dict[str, str]) -> None:
+        pid = str(row.get("prompt_id") or row.get("id") or "")
+        if not pid:
+            return
+        fields = {f: (row.get(f) or "").lower() for f in SEARCH_FIELDS}
+        tf = {f: _gram_counts(text) for f, text in fields.items()}
+        grams: Set[str] = set()
+        for counts in tf.values():
+            grams.update(counts)
+        for f, text in fields.items():
+            self._field_len_total[f] += len(text)
+        self._doc_tf[pid] = tf
+        for gram in grams:
+            self._postings.setdefault(gram, set()).add(pid)
+        self._doc_grams[pid] = grams
+        self._doc_fields[pid] = fields
+        self._doc_created[pid] = safe_int(row.get("created_at"), 0)
+        if pid not in self._doc_order:
+            self._doc_order[pid] = self._next_order
+            self._next_order += 1
+
+    def _remove(self, pid: str, keep_order: bool = False) -> None:
+        for gram in self._doc_grams.pop(pid, set()):
+            bucket = self._postings.get(gram)
+            if bucket is not None:
+                bucket.discard(pid)
+                if not bucket:
+                    del self._postings[gram]
+        fields = self._doc_fields.pop(pid, None)
+        if fields is not None:
+            for f, text in fields.items():
+                self._field_len_total[f] -= len(text)
+        self._doc_tf.pop(pid, None)
+        self._doc_created.pop(pid, None)
+        if not keep_order:
+            self._doc_order.pop(pid, None)
+
+    def _candidates(self, query: str) -> Set[str]:
+        grams = query_ngrams(query)
+        if not grams:
+            return set(self._doc_fields)
+        postings = sorted((self._postings.get(g, set()) for g in grams), key=len)
+        matched = set(postings[0])
+        for other in postings[1:]:
+            matched &= other
+            if not matched:
+                break
+        return matched
+
+    def _score(self, pid: str, grams: Set[str], doc_count: int) -> float:
+        """BM25F 점수 (필드별 정규화 빈도를 가중 합산한 뒤 포화)"""
+        score = 0.0
+        tf_fields = self._doc_tf[pid]
+        fields = self._doc_fields[pid]
+        for gram in grams:
+            df = len(self._postings.get(gram, ()))
+            if not df:
+                continue
+            idf = math.log(1 + (doc_count - df + 0.5) / (df + 0.5))
+            weighted_tf = 0.0
+            for f, boost in FIELD_BOOSTS.items():
+                tf = tf_fields[f].get(gram, 0)
+                if not tf:
+                    continue
+                avg_len = (self._field_len_total[f] / doc_count) or 1
+                norm = 1 - BM25_B + BM25_B * len(fields[f]) / avg_len
+                weighted_tf += boost * tf / norm
+            score += idf * weighted_tf / (BM25_K1 + weighted_tf)
+        return score
+
+    def search(self, query: str, limit: Optional[int] = None, offset: int = 0) -> List[str]:
+        """질의(소문자)를 포함하는 prompt_id 목록 (관련도순, 동점이면 최신순)
+        - limit 지정 시 상위 offset+limit 개만 힙으로 선택
+        """
+        with self._lock:
+            grams = query_ngrams(query)
+            doc_count = len(self._doc_fields) or 1
+            scored: List[Tuple[float, int, int, str]] = []
+            for pid in self._candidates(query):
+                if not any(query in text for text in self._doc_fields[pid].values()):
+                    continue
+                scored.append((
+                    self._score(pid, grams, doc_count),
+                    self._doc_created.get(pid, 0),
+                    -self._doc_order.get(pid, 0),
+                    pid,
+                ))
+            offset = max(0, offset)
+            if limit is None:
+                ranked = sorted(scored, reverse=True)
+            else:
+                ranked = heapq.nlargest(offset + max(0, limit), scored)
+            return [item[3] for item in ranked[offset:]]
+
+
+_get_index = register_derived_index(PromptSearchIndex())
+
+
+def get_search_index() -> PromptSearchIndex:
+    """프로세스 공용 검색 인덱스 (최초 호출 시, 또는 prompts.csv 가 바뀌었으면 다시 구축)"""
+    return _get_index()
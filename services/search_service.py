@@ -1,93 +1,46 @@
 """
 검색 서비스
 """
-from pathlib import Path
-from typing import List, Dict, Any
-from .csv_utils import read_csv_rows
+from typing import List, Dict, Any, Optional
+from .prompt_service import get_prompts_by_ids
+from .search_index import get_search_index
+from .suggestion_index import get_suggestion_index
+from utils.log_utils import get_logger
 
+logger = get_logger("search_service")
 
-def search_prompts(query: str) -> List[Dict[str, Any]]:
-    """프롬프트 검색"""
+
+def search_prompt_ids(query: str, limit: Optional[int] = None, offset: int = 0) -> List[str]:
+    """검색 결과의 prompt_id 목록 (관련도순, 행 로드 없음)"""
     try:
-        # CSV에서 모든 프롬프트 로드
-        prompts_data = read_csv_rows(Path("data/prompts.csv"))
-        if not prompts_data:
-            return []
-        
-        query_lower = query.lower().strip()
-        results = []
-        
-        for prompt in prompts_data:
-            # 제목에서 검색
-            title = prompt.get("title", "").lower()
-            if query_lower in title:
-                results.append(prompt)
-                continue
-            
-            # 내용에서 검색
-            content = prompt.get("content", "").lower()
-            if query_lower in content:
-                results.append(prompt)
-                continue
-            
-            # 태그에서 검색
-            tags = prompt.get("tags", "").lower()
-            if query_lower in tags:
-                results.append(prompt)
-                continue
-            
-            # 카테고리에서 검색
-            category = prompt.get("category", "").lower()
-            if query_lower in category:
-                results.append(prompt)
-                continue
+        return get_search_index().search(query.lower().strip(), limit=limit, offset=offset)
         
-        # 최신순으로 정렬
-        def safe_sort_key(x):
-            created_at = x.get("created_at", "0")
-            if not created_at or created_at.strip() == "":
-                return 0
-            try:
-                return int(created_at)
-            except ValueError:
-                return 0
-        
-        results.sort(key=safe_sort_key, reverse=True)
+    except Exception as e:
+        logger.error("검색 오류: %s", e)
+        return []
+
+
+def search_prompts(query: str, limit: Optional[int] = None, offset: int = 0) -> List[Dict[str, Any]]:
+    """프롬프트 검색 (제목/내용/태그/카테고리 부분 일치, 관련도순)
+    - limit/offset: 상위 결과 페이지 (limit 없으면 전체)
+    """
+    try:
+        # 역색인으로 일치 문서 ID만 찾고 해당 행만 로드
+        results = get_prompts_by_ids(search_prompt_ids(query, limit=limit, offset=offset))
         
-        print(f"[DEBUG] 검색어 '{query}': {len(results)}개 결과")
+        logger.debug("검색어 '%s': %d개 결과", query, len(results))
         return results
         
     except Exception as e:
-        print(f"[ERROR] 검색 오류: {e}")
+        logger.error("검색 오류: %s", e)
         return []
 
 
 def get_search_suggestions(query: str, limit: int = 5) -> List[str]:
-    """검색 제안어 생성"""
+    """검색 제안어 생성 (제목 단어/태그 접두어 일치, 가중치순)"""
     try:
-        prompts_data = read_csv_rows(Path("data/prompts.csv"))
-        if not prompts_data:
-            return []
-        
-        query_lower = query.lower().strip()
-        suggestions = set()
-        
-        for prompt in prompts_data:
-            # 제목에서 단어 추출
-            title_words = prompt.get("title", "").split()
-            for word in title_words:
-                if len(word) >= 2 and query_lower in word.lower():
-                    suggestions.add(word)
-            
-            # 태그에서 추출
-            tags = prompt.get("tags", "").split(",")
-            for tag in tags:
-                tag = tag.strip()
-                if len(tag) >= 2 and query_lower in tag.lower():
-                    suggestions.add(tag)
-        
-        return list(suggestions)[:limit]
+        return get_suggestion_index().suggest(query.strip(), limit)
         
     except Exception as e:
-        print(f"[ERROR] 검색 제안 오류: {e}")
+        logger.error("검색 제안 오류: %s", e)
         return []
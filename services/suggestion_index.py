@@ -0,0 +1,117 @@
+"""
+검색어 자동완성용 접두어 인덱스 (정렬 배열 + bisect)
+
+제목 단어와 태그(2자 이상)를 소문자 키로 정렬해 두고, 접두어 범위를 bisect 로
+찾은 뒤 가중치(등장 횟수 + 인기도) 상위 항목만 반환한다.
+"""
+import heapq
+import threading
+from bisect import bisect_left, insort
+from typing import Dict, List
+
+from .csv_utils import safe_int
+from .prompt_service import register_derived_index
+
+
+MIN_TERM_LENGTH = 2
+
+
+def _extract_terms(row: Dict[str, str]) -> List[str]:
+    terms = [w for w in (row.get("title") or "").split() if len(w) >= MIN_TERM_LENGTH]
+    for tag in (row.get("tags") or "").split(","):
+        tag = tag.strip()
+        if len(tag) >= MIN_TERM_LENGTH:
+            terms.append(tag)
+    return terms
+
+
+def _popularity(row: Dict[str, str]) -> float:
+    """인기도 가중치 (좋아요/북마크 우선, 조회수는 보조)"""
+    return (
+        safe_int(row.get("likes"), 0)
+        + safe_int(row.get("bookmarks"), 0)
+        + safe_int(row.get("views"), 0) / 10
+    )
+
+
+class SuggestionIndex:
+    """접두어 검색용 정렬 키 배열. 프롬프트 쓰기 시 증분 갱신된다."""
+
+    def __init__(self):
+        self._keys: List[str] = []
+        self._weights: Dict[str, float] = {}
+        self._display: Dict[str, str] = {}
+        self._doc_terms: Dict[str, Dict[str, float]] = {}
+        self._built = False
+        self._lock = threading.RLock()
+
+    def is_built(self) -> bool:
+        return self._built
+
+    def rebuild(self, rows: List[Dict[str, str]]) -> None:
+        with self._lock:
+            self._weights.clear()
+            self._display.clear()
+            self._doc_terms.clear()
+            for row in rows:
+                self._add(row, keep_sorted=False)
+            self._keys = sorted(self._weights)
+            self._built = True
+
+    def upsert(self, row: Dict[str, str]) -> None:
+        with self._lock:
+            self._remove(str(row.get("prompt_id") or row.get("id") or ""))
+            self._add(row)
+
+    def remove(self, prompt_id: str) -> None:
+        with self._lock:
+            self._remove(str(prompt_id))
+
+    def _add(self, row: Dict[str, str], keep_sorted: bool = True) -> None:
+        pid = str(row.get("prompt_id") or row.get("id") or "")
+        if not pid:
+            return
+        weight = 1 + _popularity(row)
+        contributions: Dict[str, float] = {}
+        for term in _extract_terms(row):
+            key = term.lower()
+            contributions[key] = contributions.get(key, 0) + weight
+            self._display.setdefault(key, term)
+        for key, w in contributions.items():
+            if key not in self._weights:
+                self._weights[key] = 0
+                if keep_sorted:
+                    insort(self._keys, key)
+            self._weights[key] += w
+        self._doc_terms[pid] = contributions
+
+    def _remove(self, pid: str) -> None:
+        for key, w in self._doc_terms.pop(pid, {}).items():
+            remaining = self._weights.get(key, 0) - w
+            if remaining > 1e-9:
+                self._weights[key] = remaining
+                continue
+            self._weights.pop(key, None)
+            self._display.pop(key, None)
+            pos = bisect_left(self._keys, key)
+            if pos < len(self._keys) and self._keys[pos] == key:
+                del self._keys[pos]
+
+    def suggest(self, prefix: str, limit: int = 5) -> List[str]:
+        """접두어로 시작하는 단어/태그 (가중치 높은 순)"""
+        prefix = prefix.lower()
+        with self._lock:
+            lo = bisect_left(self._keys, prefix)
+            hi = bisect_left(self._keys, prefix + "\U0010ffff")
+            top = heapq.nsmallest(
+                limit, self._keys[lo:hi], key=lambda k: (-self._weights[k], k)
+            )
+            return [self._display[k] for k in top]
+
+
+_get_index = register_derived_index(SuggestionIndex())
+
+
+def get_suggestion_index() -> SuggestionIndex:
+    """프로세스 공용 자동완성 인덱스 (최초 호출 시, 또는 prompts.csv 가 바뀌었으면 다시 구축)"""
+    return _get_index()
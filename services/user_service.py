@@ -3,6 +3,7 @@ from pathlib import Path
 from typing import Dict, List, Optional
 
 from .csv_utils import read_csv_rows, write_csv_rows
+from .write_queue import WriteBatch, get_write_queue
 import csv
 import time
 import secrets
@@ -33,7 +34,7 @@ def _ensure_users_file() -> None:
 
 
 def ensure_users_schema() -> None:
-    """users.csv 스키마를 강제합니다.
+    """users.csv 스키마를 강제합니다. (services.migrations 에서 한 번만 실행)
     - 기존 파일에 plaintext password가 있으면 hash+salt로 변환
     - 누락 필드는 기본값 채움
     - user_id 없으면 생성
@@ -91,7 +92,6 @@ def ensure_users_schema() -> None:
 
 
 def get_user_by_id(user_id: str) -> Optional[Dict[str, str]]:
-    ensure_users_schema()
     for u in read_csv_rows(USERS_CSV_PATH):
         if u.get("user_id") == user_id:
             return u
@@ -99,27 +99,24 @@ def get_user_by_id(user_id: str) -> Optional[Dict[str, str]]:
 
 
 def update_user_points(user_id: str, delta: int) -> Optional[int]:
-    ensure_users_schema()
-    rows = read_csv_rows(USERS_CSV_PATH)
-    if not rows:
-        return None
-    fieldnames = list(rows[0].keys())
-    updated_points: Optional[int] = None
-    for r in rows:
-        if r.get("user_id") == user_id:
-            try:
-                current = int(r.get("points") or 0)
-            except Exception:
-                current = 0
-            new_points = current + delta
-            if new_points < 0:
-                return None
-            r["points"] = str(new_points)
-            updated_points = new_points
-            break
-    if updated_points is None:
+    """포인트 증감 (writer 큐 경유, 같은 커밋 윈도우의 변경은 users.csv 한 번 재작성)
+    반환: 변경 후 포인트 (사용자가 없거나 잔액 부족이면 None)
+    """
+    def op(batch: WriteBatch) -> Optional[int]:
+        for r in batch.rows():
+            if r.get("user_id") == user_id:
+                try:
+                    current = int(r.get("points") or 0)
+                except Exception:
+                    current = 0
+                new_points = current + delta
+                if new_points < 0:
+                    return None
+                r["points"] = str(new_points)
+                batch.mark_dirty()
+                return new_points
         return None
-    write_csv_rows(USERS_CSV_PATH, rows, fieldnames)
-    return updated_points
+
+    return get_write_queue().submit(USERS_CSV_PATH, [], op).result()
 
 
@@ -0,0 +1,276 @@
+"""
+CSV 단일 writer 그룹 커밋 큐
+
+변경 요청(op)을 큐로 받아 백그라운드 writer 스레드 하나가 COMMIT_WINDOW 동안
+(또는 MAX_BATCH_OPS 개까지) 모아서 처리한다. 같은 파일에 대한 op 들은 한 번 읽은
+행 목록에 메모리에서 차례로 적용하고, 파일당 한 번만 기록(append 또는 원자적 재작성)한
+뒤 각 호출자의 Future 를 완료시킨다.
+
+op 는 writer 스레드에서 실행되므로 op 안에서 다시 submit(...).result() 를 기다리면 안 된다.
+"""
+import atexit
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from .csv_utils import append_csv_rows, file_lock, file_signature, read_csv_rows, write_csv_rows
+from utils.log_utils import get_logger
+
+logger = get_logger("write_queue")
+
+COMMIT_WINDOW = 0.05  # 초
+MAX_BATCH_OPS = 256
+
+
+class WriteBatch:
+    """한 커밋 윈도우 동안 한 파일에 적용되는 변경 모음 (writer 스레드 전용)
+    - append(row): 끝에 행 추가 (재작성 없이 append 로 기록)
+    - rows(): 현재 행 목록 (파일 + 이번 배치에서 추가된 행). 기존 행을 고쳤으면 mark_dirty()
+    - replace(rows): 전체 행 교체 (재작성)
+    op 하나가 예외로 끝나면 그 op 의 변경만 되돌린다 (begin_op/rollback_op, writer 가 호출)
+    """
+
+    def __init__(self, path: Path, fieldnames: Sequence[str]):
+        self.path = path
+        self.fieldnames: List[str] = list(fieldnames)
+        self.signature_before = file_signature(path)
+        self.signature_after = None
+        self._rows: Optional[List[Dict[str, str]]] = None
+        self._base_len = 0
+        self._appended: List[Dict[str, str]] = []
+        self._rewrite = False
+        self._callbacks: List[Callable[[], None]] = []
+        self._savepoint: Optional[Dict[str, Any]] = None
+
+    def add_fields(self, fields: Sequence[str]) -> None:
+        for f in fields:
+            if f not in self.fieldnames:
+                self.fieldnames.append(f)
+
+    def rows(self) -> List[Dict[str, str]]:
+        if self._rows is None:
+            self._rows = read_csv_rows(self.path)
+            self._base_len = len(self._rows)
+            if self._rows:
+                self.add_fields(list(self._rows[0].keys()))
+            self._rows.extend(self._appended)
+            self._appended = []
+        elif self._savepoint is not None and self._savepoint["loaded"] and self._savepoint["rows"] is None:
+            # 이번 op 가 기존 행을 고칠 수 있으므로 처음 건넬 때 한 번만 복사해 둔다
+            self._savepoint["rows"] = [dict(r) for r in self._rows]
+        return self._rows
+
+    def append(self, row: Dict[str, str]) -> None:
+        if self._rows is None:
+            self._appended.append(row)
+        else:
+            self._rows.append(row)
+
+    def mark_dirty(self) -> None:
+        self._rewrite = True
+
+    def replace(self, rows: List[Dict[str, str]]) -> None:
+        self.rows()
+        self._rows = rows
+        self._base_len = 0
+        self._rewrite = True
+
+    def begin_op(self) -> None:
+        """op 실행 직전 상태 기록 (행 복사는 op 가 rows() 를 부를 때만)"""
+        self._savepoint = {
+            "loaded": self._rows is not None,
+            "appended": list(self._appended),
+            "rows_len": len(self._rows) if self._rows is not None else 0,
+            "rows": None,
+            "base_len": self._base_len,
+            "rewrite": self._rewrite,
+            "fieldnames": list(self.fieldnames),
+            "callbacks": len(self._callbacks),
+        }
+
+    def end_op(self) -> None:
+        self._savepoint = None
+
+    def rollback_op(self) -> None:
+        """실패한 op 의 행 변경/추가와 콜백 등록을 되돌림"""
+        sp = self._savepoint
+        if sp is None:
+            return
+        if not sp["loaded"]:
+            self._rows = None
+            self._appended = sp["appended"]
+        elif sp["rows"] is not None:
+            self._rows = sp["rows"]
+        else:
+            # rows() 를 받지 않았으면 append 만 가능했으므로 뒤쪽만 잘라낸다
+            del self._rows[sp["rows_len"]:]
+        self._base_len = sp["base_len"]
+        self._rewrite = sp["rewrite"]
+        self.fieldnames = sp["fieldnames"]
+        del self._callbacks[sp["callbacks"]:]
+        self._savepoint = None
+
+    def on_commit(self, callback: Callable[[], None]) -> None:
+        """커밋 직후 (파일 락을 잡은 채로) 실행할 콜백 등록
+        - 이 파일에 기록할 변경이 없어도 실행된다 (다른 파일 저장 등 후속 작업용)
+        """
+        self._callbacks.append(callback)
+
+    def commit(self) -> bool:
+        """변경을 파일에 기록하고 커밋 콜백 실행. 반환: 기록 여부"""
+        written = True
+        if self._rewrite:
+            write_csv_rows(self.path, self._rows, self.fieldnames)
+        else:
+            new_rows = self._appended if self._rows is None else self._rows[self._base_len:]
+            if new_rows:
+                append_csv_rows(self.path, new_rows, self.fieldnames)
+            else:
+                written = False
+        self.signature_after = file_signature(self.path) if written else self.signature_before
+        for callback in self._callbacks:
+            try:
+                callback()
+            except Exception:
+                logger.exception("커밋 콜백 오류: %s", self.path)
+        return written
+
+
+_Op = Tuple[Path, Sequence[str], Callable[[WriteBatch], Any], Future]
+
+
+class WriteQueue:
+    """백그라운드 writer 스레드 하나로 CSV 변경을 그룹 커밋"""
+
+    def __init__(self, commit_window: float = COMMIT_WINDOW, max_batch_ops: int = MAX_BATCH_OPS):
+        self.commit_window = commit_window
+        self.max_batch_ops = max_batch_ops
+        self._queue: "queue.Queue[Optional[_Op]]" = queue.Queue()
+        self._thread: Optional[threading.Thread] = None
+        self._start_lock = threading.Lock()
+        self._stats = {"ops": 0, "batches": 0, "writes": 0}
+
+    def _ensure_started(self) -> None:
+        if self._thread is not None and self._thread.is_alive():
+            return
+        with self._start_lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name="csv-writer", daemon=True)
+                self._thread.start()
+
+    def submit(self, path: Path, fieldnames: Sequence[str], op: Callable[[WriteBatch], Any]) -> Future:
+        """op(batch) 를 다음 커밋에 포함. Future 는 파일 기록 후 op 의 반환값으로 완료된다"""
+        if threading.current_thread() is self._thread:
+            raise RuntimeError("writer 스레드 안에서는 submit 할 수 없습니다")
+        future: Future = Future()
+        self._ensure_started()
+        self._queue.put((Path(path), fieldnames, op, future))
+        return future
+
+    def submit_append(self, path: Path, fieldnames: Sequence[str], row: Dict[str, str]) -> Future:
+        """행 하나 append"""
+        return self.submit(path, fieldnames, lambda batch: batch.append(row))
+
+    def flush(self, timeout: Optional[float] = None) -> None:
+        """지금까지 제출된 변경이 모두 기록될 때까지 대기"""
+        if self._thread is None or not self._thread.is_alive():
+            return
+        barrier: Future = Future()
+        self._queue.put((None, (), None, barrier))
+        barrier.result(timeout)
+
+    def close(self) -> None:
+        """남은 변경을 기록하고 writer 스레드 종료"""
+        if self._thread is None or not self._thread.is_alive():
+            return
+        self._queue.put(None)
+        self._thread.join()
+
+    def stats(self) -> Dict[str, int]:
+        return dict(self._stats)
+
+    def _collect(self, first: _Op) -> Tuple[List[_Op], bool]:
+        ops = [first]
+        deadline = time.monotonic() + self.commit_window
+        while len(ops) < self.max_batch_ops:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                item = self._queue.get(timeout=remaining)
+            except queue.Empty:
+                break
+            if item is None:
+                return ops, True
+            ops.append(item)
+            if item[0] is None:
+                # flush 요청은 기다리지 않고 바로 커밋
+                break
+        return ops, False
+
+    def _run(self) -> None:
+        while True:
+            first = self._queue.get()
+            if first is None:
+                return
+            ops, stop = self._collect(first)
+            self._apply(ops)
+            if stop:
+                return
+
+    def _apply(self, ops: List[_Op]) -> None:
+        # 파일별로 제출 순서를 유지해 묶음
+        by_path: Dict[Path, List[_Op]] = {}
+        barriers: List[Future] = []
+        for item in ops:
+            if item[0] is None:
+                barriers.append(item[3])
+            else:
+                by_path.setdefault(item[0], []).append(item)
+        for path, path_ops in by_path.items():
+            self._apply_path(path, path_ops)
+        self._stats["batches"] += 1
+        for barrier in barriers:
+            barrier.set_result(None)
+
+    def _apply_path(self, path: Path, ops: List[_Op]) -> None:
+        results: List[Tuple[Future, Any, Optional[BaseException]]] = []
+        try:
+            with file_lock(path):
+                batch = WriteBatch(path, ops[0][1])
+                for _, fieldnames, op, future in ops:
+                    batch.begin_op()
+                    batch.add_fields(fieldnames)
+                    try:
+                        results.append((future, op(batch), None))
+                        batch.end_op()
+                    except Exception as e:
+                        # 실패한 op 가 행을 일부 고쳤어도 그 변경은 기록하지 않는다
+                        batch.rollback_op()
+                        logger.exception("쓰기 op 오류: %s", path)
+                        results.append((future, None, e))
+                if batch.commit():
+                    self._stats["writes"] += 1
+        except Exception as e:
+            logger.exception("배치 기록 실패: %s (%d ops)", path, len(ops))
+            for _, _, _, future in ops:
+                future.set_exception(e)
+            return
+        self._stats["ops"] += len(ops)
+        for future, result, error in results:
+            if error is not None:
+                future.set_exception(error)
+            else:
+                future.set_result(result)
+
+
+_write_queue = WriteQueue()
+atexit.register(_write_queue.close)
+
+
+def get_write_queue() -> WriteQueue:
+    """프로세스 공용 writer 큐"""
+    return _write_queue
@@ -0,0 +1,36 @@
+"""
+CSV 데이터를 SQLite 저장소로 이관하는 일회성 스크립트
+(이관 후 STORAGE_BACKEND=sqlite 로 실행)
+"""
+import sys
+from pathlib import Path
+
+# 프로젝트 루트를 sys.path에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from config.settings import SQLITE_DB_PATH
+from managers.storage_engine import import_csv_to_sqlite
+
+
+def migrate_all():
+    from managers.prompt_manager import PromptManager
+    from managers.user_manager import UserManager
+
+    manager_classes = [PromptManager, UserManager]
+    try:
+        from managers.category_manager import CategoryManager
+        manager_classes.append(CategoryManager)
+    except ImportError as e:
+        print(f"카테고리 매니저 로드 실패, 건너뜀: {e}")
+
+    for manager_class in manager_classes:
+        manager = manager_class()
+        count = import_csv_to_sqlite(manager, SQLITE_DB_PATH)
+        print(f"{manager.get_table_name()}: {count}개 행 이관 완료")
+
+    print(f"SQLite 파일: {SQLITE_DB_PATH}")
+
+
+if __name__ == "__main__":
+    migrate_all()
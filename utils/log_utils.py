@@ -0,0 +1,51 @@
+"""
+모듈별 로거 유틸리티
+
+utils.error_handler 의 로거("utils.error_handler")에 자식 로거를 붙여 같은 핸들러/포맷을
+사용한다. 레벨은 config.settings 의 MODULE_LOG_LEVELS 로 모듈별 지정하고, 메시지는
+logger.debug("... %s", value) 처럼 인자로 넘겨 비활성 레벨에서는 포맷 비용이 들지 않게 한다.
+flet 의존성을 피하려고 error_handler 모듈을 직접 import 하지 않고 이름으로 로거를 가져온다.
+"""
+import itertools
+import logging
+import threading
+from typing import Dict
+
+from config.settings import LOG_LEVEL, MODULE_LOG_LEVELS, LOG_SAMPLE_EVERY
+
+BASE_LOGGER_NAME = "utils.error_handler"
+
+_loggers: Dict[str, logging.Logger] = {}
+_loggers_lock = threading.Lock()
+
+
+class SamplingFilter(logging.Filter):
+    """max_level 이하 레코드는 every 개 중 1개만 통과 (그보다 높은 레벨은 항상 통과)"""
+
+    def __init__(self, every: int, max_level: int = logging.DEBUG):
+        super().__init__()
+        self.every = max(1, int(every))
+        self.max_level = max_level
+        self._counter = itertools.count()
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno > self.max_level:
+            return True
+        return next(self._counter) % self.every == 0
+
+
+def get_logger(name: str) -> logging.Logger:
+    """모듈용 로거 (레벨/샘플링은 최초 호출 시 설정값으로 한 번만 적용)"""
+    logger = _loggers.get(name)
+    if logger is not None:
+        return logger
+    with _loggers_lock:
+        logger = _loggers.get(name)
+        if logger is None:
+            logger = logging.getLogger(BASE_LOGGER_NAME).getChild(name)
+            logger.setLevel(MODULE_LOG_LEVELS.get(name, LOG_LEVEL))
+            sample_every = LOG_SAMPLE_EVERY.get(name)
+            if sample_every and sample_every > 1:
+                logger.addFilter(SamplingFilter(sample_every))
+            _loggers[name] = logger
+    return logger